@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Request
@@ -7,11 +8,16 @@ from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from supabase import Client, create_client
 
+from app.config.database import get_session_factory
 from app.config.settings import get_settings
+from app.dependencies.auth_dependency import reload_jwt_secret
+from app.engines.balance.snapshot_scheduler import SnapshotScheduler
+from app.repository.ledger_version_repository import LedgerVersionRepository
 from app.routes import (
     account_route,
     category_route,
     concept_route,
+    health_route,
     reporting_route,
     tag_route,
     transaction_route,
@@ -28,6 +34,34 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the optional snapshot scheduler for the lifetime of the app."""
+    # Resolve the JWT secret once at startup instead of on every request
+    reload_jwt_secret()
+    if settings.LEDGER_ETAG_ENABLED:
+        # Writes made while counting was off never moved the counters
+        db = get_session_factory()()
+        try:
+            LedgerVersionRepository(db).bump_epoch()
+            db.commit()
+        finally:
+            db.close()
+    scheduler: Optional[SnapshotScheduler] = None
+    if settings.SNAPSHOT_SCHEDULER_ENABLED:
+        scheduler = SnapshotScheduler(
+            session_factory=get_session_factory(),
+            interval_seconds=settings.SNAPSHOT_SCHEDULER_INTERVAL_SECONDS,
+        )
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            scheduler.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -36,6 +70,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.DEBUG else None,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # Log application startup details
@@ -125,6 +160,7 @@ app.include_router(
     prefix=f"{settings.API_V1_STR}/reporting",
     tags=["Reporting"],
 )
+app.include_router(health_route.router, prefix="/health", tags=["Health"])
 
 
 # Root endpoint
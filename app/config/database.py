@@ -1,13 +1,61 @@
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.config.db_pool import TimedQueuePool, pool_status
 from app.config.settings import get_settings
+from app.entities.ledger_version import track_ledger_versions
 
 _engine: Engine | None = None
 _session_factory: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+# Sync driver -> async driver used when ASYNC_DATABASE_URL is not set.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def _pool_kwargs(url: str, *, timed: bool) -> Dict[str, Any]:
+    """
+    create_engine pool arguments from the DB_POOL_* settings.
+
+    DB_POOL_MODE=null opens a connection per checkout (for transaction-mode
+    pgbouncer such as Supabase's pooler, which does the pooling itself).
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    settings = get_settings()
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return {}
+    if settings.DB_POOL_MODE == "null":
+        return {"poolclass": NullPool, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    kwargs: Dict[str, Any] = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if timed:
+        kwargs["poolclass"] = TimedQueuePool
+    return kwargs
 
 
 def _build_engine() -> Engine:
@@ -17,7 +65,12 @@ def _build_engine() -> Engine:
         if settings.DATABASE_URL.startswith("sqlite")
         else {}
     )
-    return create_engine(settings.DATABASE_URL, connect_args=connect_args, future=True)
+    return create_engine(
+        settings.DATABASE_URL,
+        connect_args=connect_args,
+        future=True,
+        **_pool_kwargs(settings.DATABASE_URL, timed=True),
+    )
 
 
 def get_engine() -> Engine:
@@ -27,6 +80,11 @@ def get_engine() -> Engine:
     return _engine
 
 
+def get_pool_status() -> Dict[str, Any]:
+    """Usage of the sync engine's connection pool (see app.config.db_pool)."""
+    return pool_status(get_engine().pool)
+
+
 def get_session_factory() -> sessionmaker:
     global _session_factory
     if _session_factory is None:
@@ -35,15 +93,72 @@ def get_session_factory() -> sessionmaker:
             autoflush=False,
             bind=get_engine(),
         )
+        if get_settings().LEDGER_ETAG_ENABLED:
+            track_ledger_versions(_session_factory)
     return _session_factory
 
 
+def _async_database_url() -> str:
+    """ASYNC_DATABASE_URL, or DATABASE_URL with its driver swapped for an async one."""
+    settings = get_settings()
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise RuntimeError(
+            f"No async driver known for '{backend}'; set ASYNC_DATABASE_URL"
+        )
+    return url.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+def _build_async_engine() -> AsyncEngine:
+    url = _async_database_url()
+    return create_async_engine(url, **_pool_kwargs(url, timed=False))
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = _build_async_engine()
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Async sessions for the opt-in async read path (ASYNC_DATABASE_ENABLED).
+
+    expire_on_commit=False keeps loaded rows usable after the session closes, so
+    concurrent branches can each use a short-lived session.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+def reset_async_database_state() -> None:
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        # Closes pooled connections without needing a running event loop.
+        _async_engine.sync_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
 def reset_database_state() -> None:
     global _engine, _session_factory
     if _engine is not None:
         _engine.dispose()
     _engine = None
     _session_factory = None
+    reset_async_database_state()
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -53,3 +168,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_session_factory()() as db:
+        yield db
@@ -0,0 +1,91 @@
+"""
+Connection pool wiring and telemetry for the sync engine.
+
+TimedQueuePool is SQLAlchemy's QueuePool plus checkout timing, so pool
+saturation (checked-out connections, overflow in use, time spent waiting for
+a connection) can be read at runtime via pool_status().
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool, Pool, QueuePool
+
+
+class PoolWaitStats:
+    """Thread-safe running totals of pool checkout latency."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "avg_wait_ms": (
+                    round(self.total_wait * 1000 / attempts, 3) if attempts else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waits for a connection.
+
+    Wait time includes opening a new connection when the pool grows, which is
+    the latency a request actually sees.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return record
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Point-in-time pool usage; NullPool has nothing to report beyond its class."""
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, NullPool):
+        return status
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+            }
+        )
+    if isinstance(pool, TimedQueuePool):
+        status["wait"] = pool.wait_stats.snapshot()
+    return status
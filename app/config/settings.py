@@ -1,6 +1,7 @@
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -13,6 +14,24 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = "sqlite:///./smart_finances.db"
 
+    # Connection pool. DB_POOL_MODE=null disables client-side pooling (use with
+    # pgbouncer in transaction mode, e.g. the Supabase pooler on port 6543).
+    # DB_POOL_RECYCLE is in seconds; -1 never recycles.
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # Expose GET /health/db-pool (checked-out, overflow, checkout wait times).
+    DB_POOL_METRICS_ENABLED: bool = False
+
+    # Opt-in async read path (AsyncSession) for the reporting stack. Needs an
+    # async driver: aiosqlite for SQLite, asyncpg for Postgres. When
+    # ASYNC_DATABASE_URL is empty it is derived from DATABASE_URL.
+    ASYNC_DATABASE_ENABLED: bool = False
+    ASYNC_DATABASE_URL: str = ""
+
     # Supabase settings
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
@@ -24,6 +43,114 @@ class Settings(BaseSettings):
     # Security settings
     SECRET_KEY: str = ""
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    # Per-process cache of the authenticated user row, keyed by token sub. Saves
+    # the profile lookup on every request; profile updates through /users evict
+    # the entry, other workers see the change after at most the TTL.
+    AUTH_USER_CACHE_ENABLED: bool = False
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10_000
+    # Verified bearer tokens (by sha256) are remembered until their `exp`, at most
+    # this long, so repeat requests skip HS256 verification. 0 entries disables.
+    JWT_TOKEN_CACHE_TTL_SECONDS: int = 5 * 60
+    JWT_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Statement import settings
+    # Largest raw body POST /transactions/import accepts; larger requests get 413.
+    STATEMENT_IMPORT_MAX_BYTES: int = 20 * 1024 * 1024
+
+    # Reporting settings
+    # Maintain the account_daily_balances running-balance ledger on every write.
+    # Turn on once docs/migrations/004_account_daily_balances.sql has created the
+    # table, then run its backfill, and keep it on while reads are off so the
+    # ledger never misses a write.
+    BALANCE_LEDGER_WRITES_ENABLED: bool = False
+    # Read balances from the ledger; implies BALANCE_LEDGER_WRITES_ENABLED.
+    BALANCE_LEDGER_ENABLED: bool = False
+    # Sum transactions.amount_minor (integer minor units) instead of the NUMERIC
+    # amount when computing balances. The column itself is always mapped and
+    # written, so migration 006 is required before deploying whatever this flag
+    # says; the flag only switches balance reads, and needs 006's backfill.
+    LEDGER_MINOR_UNITS_ENABLED: bool = False
+    # Maintain the category_month_totals rollup on every write. Turn on once
+    # docs/migrations/008_category_month_totals.sql has created the table, then run
+    # its backfill; keep it on while reads are off.
+    CATEGORY_ROLLUP_WRITES_ENABLED: bool = False
+    # Answer whole months of category summaries from the rollup; implies
+    # CATEGORY_ROLLUP_WRITES_ENABLED.
+    CATEGORY_ROLLUP_ENABLED: bool = False
+    # Maintain the daily_cashflow_totals rollup on every write. Turn on once
+    # docs/migrations/009_daily_cashflow_totals.sql has created the table, then run
+    # its backfill; keep it on while reads are off.
+    CASHFLOW_ROLLUP_WRITES_ENABLED: bool = False
+    # Build cashflow history buckets from the rollup; implies
+    # CASHFLOW_ROLLUP_WRITES_ENABLED.
+    CASHFLOW_ROLLUP_ENABLED: bool = False
+    # Weak ETags / 304s on ledger GETs, fingerprinted by the ledger_versions
+    # counters (docs/migrations/010_ledger_versions.sql). Writes only bump the
+    # counters while this is on, so apply 010 first; flip it with a full restart.
+    LEDGER_ETAG_ENABLED: bool = False
+    # Materialize month-start balance snapshots on a background thread. Leave off
+    # when commands/materialize_snapshots.py runs from an external scheduler.
+    # Single-worker only: every worker would start its own racing thread.
+    SNAPSHOT_SCHEDULER_ENABLED: bool = False
+    SNAPSHOT_SCHEDULER_INTERVAL_SECONDS: int = 60 * 60  # 1 hour
+    # How transaction writes invalidate snapshots: "delta" shifts later snapshots by
+    # the signed amount; "delete" drops them so they are rematerialized.
+    SNAPSHOT_INVALIDATION_MODE: Literal["delta", "delete"] = "delta"
+    # Read historical rates from fx_rates (docs/migrations/005_fx_rates.sql). When
+    # off, FxService uses the built-in MVP rates only.
+    FX_RATES_ENABLED: bool = False
+    # Per-user response cache for /reporting endpoints, invalidated on writes.
+    # "memory" is per process and only valid with a single worker: a write bumps
+    # the generation in its own worker, so others would serve stale reports until
+    # the TTL. "redis" shares entries and generations across workers via REDIS_URL
+    # (required; install the redis extra).
+    REPORTING_CACHE_ENABLED: bool = False
+    REPORTING_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    REPORTING_CACHE_TTL_SECONDS: int = 5 * 60
+    REPORTING_CACHE_MAX_ENTRIES: int = 10_000
+    REDIS_URL: str = ""
+    # Worker processes (uvicorn/gunicorn read the same variable).
+    WEB_CONCURRENCY: int = 1
+
+    @model_validator(mode="after")
+    def maintain_what_is_read(self) -> "Settings":
+        # A derived table that is read must be kept in step with every write.
+        if self.BALANCE_LEDGER_ENABLED:
+            self.BALANCE_LEDGER_WRITES_ENABLED = True
+        if self.CATEGORY_ROLLUP_ENABLED:
+            self.CATEGORY_ROLLUP_WRITES_ENABLED = True
+        if self.CASHFLOW_ROLLUP_ENABLED:
+            self.CASHFLOW_ROLLUP_WRITES_ENABLED = True
+        return self
+
+    @model_validator(mode="after")
+    def check_reporting_cache_backend(self) -> "Settings":
+        if (
+            self.REPORTING_CACHE_ENABLED
+            and self.REPORTING_CACHE_BACKEND == "memory"
+            and self.WEB_CONCURRENCY > 1
+        ):
+            raise ValueError(
+                "REPORTING_CACHE_BACKEND=memory is single-worker only; use redis "
+                "when WEB_CONCURRENCY > 1"
+            )
+        if (
+            self.REPORTING_CACHE_ENABLED
+            and self.REPORTING_CACHE_BACKEND == "redis"
+            and not self.REDIS_URL
+        ):
+            raise ValueError("REPORTING_CACHE_BACKEND=redis requires REDIS_URL")
+        return self
+
+    @model_validator(mode="after")
+    def check_snapshot_scheduler_workers(self) -> "Settings":
+        if self.SNAPSHOT_SCHEDULER_ENABLED and self.WEB_CONCURRENCY > 1:
+            raise ValueError(
+                "SNAPSHOT_SCHEDULER_ENABLED is single-worker only; run "
+                "commands/materialize_snapshots.py from cron when WEB_CONCURRENCY > 1"
+            )
+        return self
 
     class Config:
         env_file = ".env"
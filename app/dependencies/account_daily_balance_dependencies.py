@@ -0,0 +1,30 @@
+"""Dependencies for the account daily balance ledger (transaction writes and balance reads)."""
+
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.config.settings import get_settings
+from app.repository.account_daily_balance_repository import (
+    AccountDailyBalanceRepository,
+)
+
+
+def get_account_daily_balance_repository(
+    db: Session = Depends(get_db),
+) -> Optional[AccountDailyBalanceRepository]:
+    """Ledger repository for writes; None while BALANCE_LEDGER_WRITES_ENABLED is off."""
+    if not get_settings().BALANCE_LEDGER_WRITES_ENABLED:
+        return None
+    return AccountDailyBalanceRepository(db)
+
+
+def get_account_daily_balance_reader(
+    db: Session = Depends(get_db),
+) -> Optional[AccountDailyBalanceRepository]:
+    """Ledger repository for balance reads; None while BALANCE_LEDGER_ENABLED is off."""
+    if not get_settings().BALANCE_LEDGER_ENABLED:
+        return None
+    return AccountDailyBalanceRepository(db)
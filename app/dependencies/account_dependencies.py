@@ -1,16 +1,33 @@
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.config.settings import get_settings
+from app.dependencies.reporting_cache_dependencies import get_reporting_cache
+from app.dependencies.request_cache_dependencies import get_request_cache
 from app.repository.account_repository import AccountRepository
 from app.services.account_service import AccountService
+from app.services.reporting_cache_service import ReportingCacheService
+from app.shared.helpers.request_cache_helper import RequestCache
 
 
 def get_account_repository(
     db: Session = Depends(get_db),
+    request_cache: RequestCache = Depends(get_request_cache),
 ) -> AccountRepository:
-    return AccountRepository(db)
+    return AccountRepository(db, request_cache)
 
 
-def get_account_service(db: Session = Depends(get_db)) -> AccountService:
-    return AccountService(db)
+def get_account_service(
+    db: Session = Depends(get_db),
+    reporting_cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    request_cache: RequestCache = Depends(get_request_cache),
+) -> AccountService:
+    return AccountService(
+        db,
+        reporting_cache,
+        request_cache,
+        minor_units=get_settings().LEDGER_MINOR_UNITS_ENABLED,
+    )
@@ -1,17 +1,62 @@
+import hashlib
 import os
-from typing import Any
+import time
+from typing import Any, Optional
 
 import jwt
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.config.settings import get_settings
+from app.shared.helpers.cache_helper import TTLCache
 
 bearer_scheme = HTTPBearer(
     description="Enter your JWT token in the format: Bearer <token>",
     auto_error=False,
 )
 
+# Resolved once per process (see get_jwt_secret); reload_jwt_secret() re-reads it.
+_jwt_secret: Optional[str] = None
+# sha256(token) -> verified payload. Entries expire with the token's own `exp`
+# (capped by JWT_TOKEN_CACHE_TTL_SECONDS), so a hit is never an expired token.
+_token_cache: Optional[TTLCache] = None
+
+
+def get_jwt_secret() -> str:
+    """HS256 secret, read from the environment (tests) or settings on first use."""
+    global _jwt_secret
+    if _jwt_secret is None:
+        # Prefer runtime environment secret in tests; fallback to settings
+        _jwt_secret = os.getenv("JWT_SECRET_KEY", get_settings().JWT_SECRET_KEY)
+    return _jwt_secret
+
+
+def _get_token_cache() -> TTLCache:
+    global _token_cache
+    if _token_cache is None:
+        settings = get_settings()
+        _token_cache = TTLCache(
+            maxsize=settings.JWT_TOKEN_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.JWT_TOKEN_CACHE_TTL_SECONDS,
+        )
+    return _token_cache
+
+
+def reload_jwt_secret() -> None:
+    """Re-read the secret and forget every verified token (key rotation, tests)."""
+    global _jwt_secret, _token_cache
+    _jwt_secret = None
+    _token_cache = None
+    get_jwt_secret()
+
+
+def _token_ttl(payload: dict[str, Any]) -> Optional[float]:
+    """Seconds until `exp` capped by the cache TTL; None means use the cache TTL."""
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return None
+    return min(exp - time.time(), get_settings().JWT_TOKEN_CACHE_TTL_SECONDS)
+
 
 def verify_token(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
@@ -19,20 +64,28 @@ def verify_token(
     if credentials is None or not credentials.credentials:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
+    token = credentials.credentials
+    cache = _get_token_cache()
+    token_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cached = cache.get(token_key)
+    if cached is not None:
+        return dict(cached)
+
     try:
-        settings = get_settings()
-        # Prefer runtime environment secret in tests; fallback to settings
-        secret = os.getenv("JWT_SECRET_KEY", settings.JWT_SECRET_KEY)
         payload = jwt.decode(
-            credentials.credentials,
-            secret,
+            token,
+            get_jwt_secret(),
             algorithms=["HS256"],
             options={"verify_aud": False},
         )
-        return payload
     except jwt.ExpiredSignatureError:
         print("Token expired")
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         print("Invalid token")
         raise HTTPException(status_code=401, detail="Invalid token")
+
+    ttl = _token_ttl(payload)
+    if ttl is None or ttl > 0:
+        cache.set(token_key, dict(payload), ttl)
+    return payload
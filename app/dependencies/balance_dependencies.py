@@ -1,7 +1,15 @@
 """Dependencies for balance service, snapshot service, and balance engine."""
 
+from typing import Optional
+
 from fastapi import Depends
+from sqlalchemy.orm import Session
 
+from app.config.database import get_async_session_factory, get_db
+from app.config.settings import get_settings
+from app.dependencies.account_daily_balance_dependencies import (
+    get_account_daily_balance_reader,
+)
 from app.dependencies.account_dependencies import (
     get_account_repository,
     get_account_service,
@@ -13,9 +21,13 @@ from app.dependencies.transaction_dependencies import (
     get_transaction_repository,
     get_transaction_service,
 )
-from app.engines.balance_engine import BalanceEngine
+from app.engines.balance_engine import AsyncBalanceEngine, BalanceEngine
+from app.repository.account_daily_balance_repository import (
+    AccountDailyBalanceRepository,
+)
 from app.repository.account_repository import AccountRepository
 from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
+from app.repository.fx_rate_repository import FxRateRepository
 from app.repository.transaction_repository import TransactionRepository
 from app.services.account_service import AccountService
 from app.services.fx_service import FxService
@@ -23,9 +35,11 @@ from app.services.snapshot_service import SnapshotService
 from app.services.transaction_service import TransactionService
 
 
-def get_fx_service() -> FxService:
-    """Stub FX service; replace with real implementation when needed."""
-    return FxService()
+def get_fx_service(db: Session = Depends(get_db)) -> FxService:
+    """FX service; reads stored historical rates when FX_RATES_ENABLED is on."""
+    if not get_settings().FX_RATES_ENABLED:
+        return FxService()
+    return FxService(FxRateRepository(db))
 
 
 def get_balance_engine(
@@ -33,6 +47,9 @@ def get_balance_engine(
     snapshot_repo: BalanceSnapshotRepository = Depends(get_balance_snapshot_repository),
     transaction_repo: TransactionRepository = Depends(get_transaction_repository),
     fx_service: FxService = Depends(get_fx_service),
+    ledger_repo: Optional[AccountDailyBalanceRepository] = Depends(
+        get_account_daily_balance_reader
+    ),
 ) -> BalanceEngine:
     """Balance engine for balance reporting computations (repos + FX injected)."""
     return BalanceEngine(
@@ -40,9 +57,26 @@ def get_balance_engine(
         snapshot_repo=snapshot_repo,
         transaction_repo=transaction_repo,
         fx_service=fx_service,
+        ledger_repo=ledger_repo,
+        minor_units=get_settings().LEDGER_MINOR_UNITS_ENABLED,
     )
 
 
+def get_async_balance_engine() -> Optional[AsyncBalanceEngine]:
+    """AsyncSession balance engine when ASYNC_DATABASE_ENABLED is on, else None."""
+    settings = get_settings()
+    if not settings.ASYNC_DATABASE_ENABLED:
+        return None
+    minor_units = settings.LEDGER_MINOR_UNITS_ENABLED
+    if settings.FX_RATES_ENABLED:
+        return AsyncBalanceEngine(
+            get_async_session_factory(),
+            lambda session: FxService(FxRateRepository(session)),
+            minor_units=minor_units,
+        )
+    return AsyncBalanceEngine(get_async_session_factory(), minor_units=minor_units)
+
+
 def get_snapshot_service(
     account_service: AccountService = Depends(get_account_service),
     transaction_service: TransactionService = Depends(get_transaction_service),
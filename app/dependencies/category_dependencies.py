@@ -1,9 +1,43 @@
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.dependencies.category_month_total_dependencies import (
+    get_category_month_total_repository,
+)
+from app.dependencies.daily_cashflow_total_dependencies import (
+    get_daily_cashflow_total_repository,
+)
+from app.dependencies.reporting_cache_dependencies import get_reporting_cache
+from app.dependencies.request_cache_dependencies import get_request_cache
+from app.repository.category_month_total_repository import (
+    CategoryMonthTotalRepository,
+)
+from app.repository.daily_cashflow_total_repository import (
+    DailyCashflowTotalRepository,
+)
 from app.services.category_service import CategoryService
+from app.services.reporting_cache_service import ReportingCacheService
+from app.shared.helpers.request_cache_helper import RequestCache
 
 
-def get_category_service(db: Session = Depends(get_db)) -> CategoryService:
-    return CategoryService(db)
+def get_category_service(
+    db: Session = Depends(get_db),
+    reporting_cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    category_month_total_repository: Optional[CategoryMonthTotalRepository] = Depends(
+        get_category_month_total_repository
+    ),
+    daily_cashflow_total_repository: Optional[DailyCashflowTotalRepository] = Depends(
+        get_daily_cashflow_total_repository
+    ),
+    request_cache: RequestCache = Depends(get_request_cache),
+) -> CategoryService:
+    return CategoryService(
+        db,
+        reporting_cache,
+        category_month_total_repository,
+        daily_cashflow_total_repository,
+        request_cache,
+    )
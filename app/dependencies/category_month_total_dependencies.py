@@ -0,0 +1,21 @@
+"""Dependencies for the category month rollup (transaction writes and category summaries)."""
+
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.config.settings import get_settings
+from app.repository.category_month_total_repository import (
+    CategoryMonthTotalRepository,
+)
+
+
+def get_category_month_total_repository(
+    db: Session = Depends(get_db),
+) -> Optional[CategoryMonthTotalRepository]:
+    """Write-path rollup repository; None unless CATEGORY_ROLLUP_WRITES_ENABLED."""
+    if not get_settings().CATEGORY_ROLLUP_WRITES_ENABLED:
+        return None
+    return CategoryMonthTotalRepository(db)
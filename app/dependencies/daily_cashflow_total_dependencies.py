@@ -0,0 +1,21 @@
+"""Dependencies for the daily cashflow rollup (transaction writes and cashflow history)."""
+
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.config.settings import get_settings
+from app.repository.daily_cashflow_total_repository import (
+    DailyCashflowTotalRepository,
+)
+
+
+def get_daily_cashflow_total_repository(
+    db: Session = Depends(get_db),
+) -> Optional[DailyCashflowTotalRepository]:
+    """Write-path rollup repository; None unless CASHFLOW_ROLLUP_WRITES_ENABLED."""
+    if not get_settings().CASHFLOW_ROLLUP_WRITES_ENABLED:
+        return None
+    return DailyCashflowTotalRepository(db)
@@ -0,0 +1,42 @@
+from datetime import date
+from typing import Optional, cast
+from uuid import UUID
+
+from fastapi import Depends, Request
+
+from app.config.settings import get_settings
+from app.dependencies.ledger_version_dependencies import (
+    get_ledger_version_repository,
+)
+from app.dependencies.user_dependencies import get_current_user
+from app.entities.user import User
+from app.repository.ledger_version_repository import LedgerVersionRepository
+from app.shared.helpers.etag_helper import build_etag
+
+
+def get_ledger_etag(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    ledger_version_repository: LedgerVersionRepository = Depends(
+        get_ledger_version_repository
+    ),
+) -> Optional[str]:
+    """
+    ETag for GET responses derived from the user's ledger.
+
+    Combines the endpoint and its query, the user's base currency, today's date
+    (relative periods and default as_of) and the ledger version (the user's
+    write counter, the FX rates counter and the epoch), so any write that can
+    change the body changes the tag. None when LEDGER_ETAG_ENABLED is off.
+    """
+    if not get_settings().LEDGER_ETAG_ENABLED:
+        return None
+    user_id = cast(UUID, current_user.id)
+    return build_etag(
+        str(user_id),
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        current_user.currency,
+        date.today(),
+        ledger_version_repository.get_ledger_version(user_id),
+    )
@@ -0,0 +1,13 @@
+"""Dependencies for the ledger version repository (used by conditional GETs)."""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.repository.ledger_version_repository import LedgerVersionRepository
+
+
+def get_ledger_version_repository(
+    db: Session = Depends(get_db),
+) -> LedgerVersionRepository:
+    return LedgerVersionRepository(db)
@@ -0,0 +1,45 @@
+from typing import Optional, Tuple
+
+from app.config.settings import get_settings
+from app.services.reporting_cache_service import ReportingCacheService
+from app.shared.helpers.cache_helper import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+
+# One backend per process, rebuilt only when the cache settings change.
+_backend: Optional[CacheBackend] = None
+_backend_config: Optional[Tuple[str, str, int]] = None
+
+
+def _get_backend(backend: str, redis_url: str, max_entries: int) -> CacheBackend:
+    global _backend, _backend_config
+    config = (backend, redis_url, max_entries)
+    if _backend is None or _backend_config != config:
+        if backend == "redis":
+            _backend = RedisCacheBackend.from_url(redis_url)
+        else:
+            _backend = InMemoryCacheBackend(maxsize=max_entries)
+        _backend_config = config
+    return _backend
+
+
+def reset_reporting_cache() -> None:
+    """Drop the process-wide backend (tests and settings reloads)."""
+    global _backend, _backend_config
+    _backend = None
+    _backend_config = None
+
+
+def get_reporting_cache() -> Optional[ReportingCacheService]:
+    """Reporting response cache when REPORTING_CACHE_ENABLED is on, else None."""
+    settings = get_settings()
+    if not settings.REPORTING_CACHE_ENABLED:
+        return None
+    backend = _get_backend(
+        settings.REPORTING_CACHE_BACKEND,
+        settings.REDIS_URL,
+        settings.REPORTING_CACHE_MAX_ENTRIES,
+    )
+    return ReportingCacheService(backend, settings.REPORTING_CACHE_TTL_SECONDS)
@@ -0,0 +1,12 @@
+"""Per-request identity map shared by the repository and service factories."""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.shared.helpers.request_cache_helper import RequestCache
+
+
+def get_request_cache(db: Session = Depends(get_db)) -> RequestCache:
+    """Cache bound to the request's session; every factory in the request shares it."""
+    return RequestCache.for_session(db)
@@ -1,19 +1,42 @@
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.config.settings import get_settings
+from app.dependencies.account_daily_balance_dependencies import (
+    get_account_daily_balance_repository,
+)
 from app.dependencies.account_dependencies import get_account_service
 from app.dependencies.balance_snapshot_dependencies import (
     get_balance_snapshot_repository,
 )
 from app.dependencies.category_dependencies import get_category_service
+from app.dependencies.category_month_total_dependencies import (
+    get_category_month_total_repository,
+)
 from app.dependencies.concept_dependencies import get_concept_service
+from app.dependencies.daily_cashflow_total_dependencies import (
+    get_daily_cashflow_total_repository,
+)
+from app.dependencies.reporting_cache_dependencies import get_reporting_cache
 from app.dependencies.tag_dependencies import get_tag_service
+from app.repository.account_daily_balance_repository import (
+    AccountDailyBalanceRepository,
+)
 from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
+from app.repository.category_month_total_repository import (
+    CategoryMonthTotalRepository,
+)
+from app.repository.daily_cashflow_total_repository import (
+    DailyCashflowTotalRepository,
+)
 from app.repository.transaction_repository import TransactionRepository
 from app.services.account_service import AccountService
 from app.services.category_service import CategoryService
 from app.services.concept_service import ConceptService
+from app.services.reporting_cache_service import ReportingCacheService
 from app.services.tag_service import TagService
 from app.services.transaction_service import TransactionService
 
@@ -33,8 +56,19 @@ def get_transaction_service(
     balance_snapshot_repository: BalanceSnapshotRepository = Depends(
         get_balance_snapshot_repository
     ),
+    account_daily_balance_repository: Optional[AccountDailyBalanceRepository] = Depends(
+        get_account_daily_balance_repository
+    ),
+    reporting_cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    category_month_total_repository: Optional[CategoryMonthTotalRepository] = Depends(
+        get_category_month_total_repository
+    ),
+    daily_cashflow_total_repository: Optional[DailyCashflowTotalRepository] = Depends(
+        get_daily_cashflow_total_repository
+    ),
 ) -> TransactionService:
     """Dependency factory for TransactionService with injected domain services."""
+    settings = get_settings()
     return TransactionService(
         db,
         account_service,
@@ -42,4 +76,11 @@ def get_transaction_service(
         concept_service,
         tag_service,
         balance_snapshot_repository,
+        account_daily_balance_repository,
+        settings.SNAPSHOT_INVALIDATION_MODE,
+        reporting_cache,
+        category_month_total_repository,
+        daily_cashflow_total_repository,
+        category_rollup_reads=settings.CATEGORY_ROLLUP_ENABLED,
+        cashflow_rollup_reads=settings.CASHFLOW_ROLLUP_ENABLED,
     )
@@ -1,20 +1,54 @@
 import logging
+from typing import Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.config.settings import get_settings
 from app.dependencies.auth_dependency import verify_token
 from app.entities.user import User
 from app.services.user_service import UserService
+from app.shared.helpers.cache_helper import TTLCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    return UserService(db)
+# One cache per process, rebuilt only when the cache settings change.
+_user_cache: Optional[TTLCache] = None
+_user_cache_config: Optional[Tuple[int, int]] = None
+
+
+def reset_user_cache() -> None:
+    """Drop the process-wide user cache (tests and settings reloads)."""
+    global _user_cache, _user_cache_config
+    _user_cache = None
+    _user_cache_config = None
+
+
+def get_user_cache() -> Optional[TTLCache]:
+    """Authenticated-user cache when AUTH_USER_CACHE_ENABLED is on, else None."""
+    global _user_cache, _user_cache_config
+    settings = get_settings()
+    if not settings.AUTH_USER_CACHE_ENABLED:
+        return None
+    config = (
+        settings.AUTH_USER_CACHE_MAX_ENTRIES,
+        settings.AUTH_USER_CACHE_TTL_SECONDS,
+    )
+    if _user_cache is None or _user_cache_config != config:
+        _user_cache = TTLCache(maxsize=config[0], ttl_seconds=config[1])
+        _user_cache_config = config
+    return _user_cache
+
+
+def get_user_service(
+    db: Session = Depends(get_db),
+    user_cache: Optional[TTLCache] = Depends(get_user_cache),
+) -> UserService:
+    return UserService(db, user_cache)
 
 
 def get_current_user(
@@ -34,7 +68,7 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
     try:
-        user = user_service.get(user_id)
+        user = user_service.get_authenticated(user_id)
         if not user:
             logger.warning(f"User not found with ID: {user_id}")
             raise HTTPException(status_code=404, detail="User not found")
@@ -1,3 +1,13 @@
 """Balance engine package."""
 
-__all__ = []
+from app.engines.balance.snapshot_materializer import (
+    SnapshotMaterializer,
+    materialize_snapshots,
+)
+from app.engines.balance.snapshot_scheduler import SnapshotScheduler
+
+__all__ = [
+    "SnapshotMaterializer",
+    "SnapshotScheduler",
+    "materialize_snapshots",
+]
@@ -0,0 +1,129 @@
+"""
+Snapshot materializer: precomputes month-start balance snapshots in bulk.
+
+Runs outside the request path (CLI command or in-process scheduler) so balance
+reads never write. Each month chains from the previous snapshot per account,
+so materializing months in ascending order only sums one month of rows.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.entities.balance_snapshot import BalanceSnapshot
+from app.repository.account_repository import AccountRepository
+from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
+from app.repository.transaction_repository import TransactionRepository
+from app.shared.helpers.date_helper import first_day_of_month, iter_dates
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class SnapshotMaterializer:
+    """Creates missing BalanceSnapshot rows for every active account."""
+
+    def __init__(
+        self,
+        account_repo: AccountRepository,
+        snapshot_repo: BalanceSnapshotRepository,
+        transaction_repo: TransactionRepository,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.account_repo = account_repo
+        self.snapshot_repo = snapshot_repo
+        self.transaction_repo = transaction_repo
+        self.batch_size = batch_size
+
+    def materialize_months(self, from_month: date, to_month: date) -> int:
+        """
+        Materialize snapshots for each month start in [from_month, to_month].
+
+        Months are processed oldest first so each one chains from the last.
+        Existing snapshots are left untouched; returns the number created.
+        """
+        accounts = self.account_repo.get_active()
+        created = 0
+        for month_start in iter_dates(
+            first_day_of_month(from_month), to_month, "month"
+        ):
+            created += self._materialize_month(accounts, month_start)
+        return created
+
+    def _materialize_month(self, accounts: List, month_start: date) -> int:
+        created = 0
+        for i in range(0, len(accounts), self.batch_size):
+            created += self._materialize_batch(
+                accounts[i : i + self.batch_size], month_start
+            )
+        logger.info(f"Materialized {created} snapshots for {month_start}")
+        return created
+
+    def _materialize_batch(self, accounts: List, month_start: date) -> int:
+        """One batch = four set-based queries and one commit."""
+        existing = self.snapshot_repo.get_snapshots_at_date(
+            [a.id for a in accounts], month_start
+        )
+        pending = [a for a in accounts if existing.get(a.id) is None]
+        if not pending:
+            return 0
+
+        snap_before_map = self.snapshot_repo.get_latest_before_for_accounts(
+            [a.id for a in pending], month_start
+        )
+        day_before_month = month_start - timedelta(days=1)
+        windows = []
+        for acc in pending:
+            snap_before = snap_before_map.get(acc.id)
+            windows.append(
+                (
+                    acc.id,
+                    snap_before.snapshot_date if snap_before else None,
+                    day_before_month,
+                )
+            )
+        sums = self.transaction_repo.get_net_signed_sums_for_windows(windows)
+
+        snapshots: List[BalanceSnapshot] = []
+        for acc, delta in zip(pending, sums):
+            snap_before = snap_before_map.get(acc.id)
+            if snap_before:
+                base = Decimal(str(snap_before.balance))
+            else:
+                base = Decimal(str(acc.initial_balance or 0))
+            snapshots.append(
+                BalanceSnapshot(
+                    account_id=acc.id,
+                    currency=acc.currency,
+                    snapshot_date=month_start,
+                    balance=base + delta,
+                )
+            )
+        self.snapshot_repo.add_many(snapshots)
+        return len(snapshots)
+
+
+def materialize_snapshots(
+    session_factory: Callable[[], Session],
+    from_month: date,
+    to_month: date,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Open a session and materialize snapshots for [from_month, to_month]."""
+    db = session_factory()
+    try:
+        materializer = SnapshotMaterializer(
+            account_repo=AccountRepository(db),
+            snapshot_repo=BalanceSnapshotRepository(db),
+            transaction_repo=TransactionRepository(db),
+            batch_size=batch_size,
+        )
+        return materializer.materialize_months(from_month, to_month)
+    finally:
+        db.close()
@@ -0,0 +1,68 @@
+"""
+Optional in-process scheduler for snapshot materialization.
+
+Enabled with SNAPSHOT_SCHEDULER_ENABLED=true for single-instance deployments
+that have no external cron; settings refuse it when WEB_CONCURRENCY > 1, since
+each worker would run its own thread. Runs on a daemon thread; each tick materializes
+the current month start, which is a no-op once the month's snapshots exist.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.engines.balance.snapshot_materializer import materialize_snapshots
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotScheduler:
+    """Periodically materializes month-start snapshots on a background thread."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval_seconds: int,
+        today: Callable[[], date] = date.today,
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.today = today
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        month_start = self.today().replace(day=1)
+        return materialize_snapshots(self.session_factory, month_start, month_start)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="snapshot-scheduler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Snapshot scheduler started (interval={self.interval_seconds}s)")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        logger.info("Snapshot scheduler stopped")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                # Keep the thread alive; reads stay correct without snapshots.
+                logger.error(f"Snapshot materialization failed: {str(e)}")
+            self._stop.wait(self.interval_seconds)
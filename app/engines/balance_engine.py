@@ -7,18 +7,33 @@ It is not FastAPI-aware: no schemas, no HTTP exceptions.
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
 from app.entities.balance_snapshot import BalanceSnapshot
-from app.repository.account_repository import AccountRepository
+from app.repository.account_daily_balance_repository import (
+    AccountDailyBalanceRepository,
+)
+from app.repository.account_repository import (
+    AccountBalanceRow,
+    AccountRepository,
+    AsyncAccountRepository,
+)
 from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
-from app.repository.transaction_repository import TransactionRepository
-from app.services.fx_service import FxService
-from app.shared.helpers.date_helper import first_day_of_month, iter_dates
+from app.repository.transaction_repository import (
+    AsyncTransactionRepository,
+    TransactionRepository,
+)
+from app.services.fx_service import FxRateTable, FxService
+from app.shared.helpers.date_helper import iter_dates
+from app.shared.helpers.money_helper import from_minor, to_minor
 
 
 class BalanceEngine:
@@ -30,11 +45,19 @@ class BalanceEngine:
         snapshot_repo: BalanceSnapshotRepository,
         transaction_repo: TransactionRepository,
         fx_service: FxService,
+        ledger_repo: Optional[AccountDailyBalanceRepository] = None,
+        minor_units: bool = False,
     ):
         self.account_repo = account_repo
         self.snapshot_repo = snapshot_repo
         self.transaction_repo = transaction_repo
         self.fx_service = fx_service
+        # Optional: running-balance ledger; when present, as-of balances are one
+        # indexed lookup per account instead of a snapshot + ledger replay.
+        self.ledger_repo = ledger_repo
+        # Sum and replay transactions as integer minor units (amount_minor);
+        # converted back to Decimal per account or currency before FX.
+        self.minor_units = minor_units
 
     # ---------------------------------------------------------------------
     # Public API (used by ReportingService)
@@ -100,72 +123,127 @@ class BalanceEngine:
         account_id: Optional[UUID] = None,
     ) -> List[dict]:
         accounts = self._load_accounts(user_id=user_id, account_id_filter=account_id)
+        point_dates = list(iter_dates(from_date, to_date, period))
         if not accounts:
             return [
-                {"date": d.isoformat(), "balance": Decimal("0")}
-                for d in iter_dates(from_date, to_date, period)
+                {"date": d.isoformat(), "balance": Decimal("0")} for d in point_dates
             ]
 
-        account_ids = [a.id for a in accounts]
-        month_start_from = first_day_of_month(from_date)
-
-        snapshots = self.snapshot_repo.get_latest_snapshots_for_accounts(
-            account_ids, month_start_from
+        # Opening snapshots, opening sums and in-range rows in one round trip.
+        snapshots, opening_sums, tx_rows = (
+            self.transaction_repo.get_balance_history_inputs(
+                [a.id for a in accounts],
+                from_date,
+                to_date,
+                minor_units=self.minor_units,
+            )
+        )
+        balances = self._opening_balances(
+            accounts, snapshots, opening_sums, minor_units=self.minor_units
         )
-        snap_before_map = self.snapshot_repo.get_latest_before_for_accounts(
-            account_ids, month_start_from
+        fx_table = self.fx_service.rate_table(
+            self._history_pairs(accounts, base_currency), point_dates
         )
-        tx_rows = self.transaction_repo.get_transactions_for_accounts_until_date(
-            account_ids, to_date
+        return self._history_points(
+            accounts=accounts,
+            balances=balances,
+            tx_rows=tx_rows,
+            point_dates=point_dates,
+            fx_table=fx_table,
+            base_currency=base_currency,
+            minor_units=self.minor_units,
         )
 
-        tx_before_by_account: Dict[UUID, List[tuple]] = defaultdict(list)
+    # ---------------------------------------------------------------------
+    # Internal helpers
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _base_amount(
+        value, currency: str, minor_units: bool = False
+    ) -> Union[Decimal, int]:
+        """Snapshot or initial balance in the engine's arithmetic (Decimal or minor)."""
+        amount = Decimal(str(value or 0))
+        return to_minor(amount, currency) if minor_units else amount
+
+    @staticmethod
+    def _opening_balances(
+        accounts: List,
+        snapshots: Dict[UUID, tuple],
+        opening_sums: Dict[UUID, Union[Decimal, int]],
+        *,
+        minor_units: bool = False,
+    ) -> Dict[UUID, Union[Decimal, int]]:
+        """Balances at the end of the day before the range (snapshot + opening sum)."""
+        balances: Dict[UUID, Union[Decimal, int]] = {}
+        for acc in accounts:
+            snap = snapshots.get(acc.id)
+            base = BalanceEngine._base_amount(
+                snap[1] if snap else acc.initial_balance, acc.currency, minor_units
+            )
+            balances[acc.id] = base + opening_sums.get(acc.id, 0)
+        return balances
+
+    @staticmethod
+    def _history_pairs(accounts: List, base_currency: str) -> List[tuple]:
+        return [
+            (currency, base_currency) for currency in {a.currency for a in accounts}
+        ]
+
+    @staticmethod
+    def _history_points(
+        *,
+        accounts: List,
+        balances: Dict[UUID, Union[Decimal, int]],
+        tx_rows: List[tuple],
+        point_dates: List[date],
+        fx_table: FxRateTable,
+        base_currency: str,
+        minor_units: bool = False,
+    ) -> List[dict]:
+        """
+        Walk the points, applying in-range transactions to opening balances.
+
+        With minor_units, balances and tx amounts are ints and the replay is
+        integer addition; each currency total is converted to Decimal per point.
+        """
+        currency_by_account = {acc.id: acc.currency for acc in accounts}
         tx_by_date: Dict[date, List[tuple]] = defaultdict(list)
         for acc_id, tx_date, amount in tx_rows:
-            if tx_date < from_date:
-                tx_before_by_account[acc_id].append((tx_date, amount))
-            elif from_date <= tx_date <= to_date:
-                tx_by_date[tx_date].append((acc_id, amount))
+            tx_by_date[tx_date].append((currency_by_account[acc_id], amount))
 
-        balances = self._compute_initial_balances(
-            accounts=accounts,
-            from_date=from_date,
-            snapshots=snapshots,
-            snap_before_map=snap_before_map,
-            tx_before_by_account=tx_before_by_account,
+        # Conversion is linear, so running totals are kept per currency and each
+        # point converts once per currency from a precomputed rate table.
+        balances_by_currency: Dict[str, Union[Decimal, int]] = defaultdict(
+            int if minor_units else Decimal
         )
+        for acc in accounts:
+            balances_by_currency[acc.currency] += balances.get(acc.id, 0)
 
         points: List[dict] = []
         sorted_tx_dates = sorted(tx_by_date.keys())
         tx_index = 0
 
-        for d in iter_dates(from_date, to_date, period):
+        for d in point_dates:
             while tx_index < len(sorted_tx_dates) and sorted_tx_dates[tx_index] <= d:
                 tx_day = sorted_tx_dates[tx_index]
-                for acc_id, amt in tx_by_date[tx_day]:
-                    balances[acc_id] = balances.get(acc_id, Decimal("0")) + amt
+                for currency, amt in tx_by_date[tx_day]:
+                    balances_by_currency[currency] += amt
                 tx_index += 1
 
             total = Decimal("0")
-            for acc in accounts:
-                b = balances.get(acc.id, Decimal("0"))
-                total += self.fx_service.convert(b, acc.currency, base_currency, d)
+            for currency, b in balances_by_currency.items():
+                if minor_units:
+                    b = from_minor(b, currency)
+                total += fx_table.convert(b, currency, base_currency, d)
             points.append({"date": d.isoformat(), "balance": total})
 
         return points
 
-    # ---------------------------------------------------------------------
-    # Internal helpers
-    # ---------------------------------------------------------------------
-
     def _load_accounts(
         self, *, user_id: UUID, account_id_filter: Optional[UUID] = None
-    ) -> List:
-        all_accounts = self.account_repo.get_by_user_id(user_id)
-        active = [a for a in all_accounts if not getattr(a, "is_deleted", False)]
-        if account_id_filter:
-            active = [a for a in active if a.id == account_id_filter]
-        return active
+    ) -> List[AccountBalanceRow]:
+        return self.account_repo.get_balance_rows(user_id, account_id_filter)
 
     def _compute_native_balances_as_of(
         self,
@@ -173,126 +251,159 @@ class BalanceEngine:
         accounts: List,
         as_of: date,
     ) -> Dict[UUID, Decimal]:
-        account_ids = [a.id for a in accounts]
+        if self.ledger_repo is not None:
+            return self._ledger_balances_as_of(accounts=accounts, as_of=as_of)
 
         snapshots = self.snapshot_repo.get_latest_snapshots_for_accounts(
-            account_ids, as_of
+            [a.id for a in accounts], as_of
         )
-        tx_rows = self.transaction_repo.get_transactions_for_accounts_until_date(
-            account_ids, as_of
+        return self._compute_balances_from_snapshots(
+            accounts=accounts, snapshots=snapshots, to_date=as_of
         )
 
-        month_start = first_day_of_month(as_of)
-        day_before_month = month_start - timedelta(days=1)
-
-        tx_by_account: Dict[UUID, List[tuple]] = defaultdict(list)
-        for acc_id, tx_date, amount in tx_rows:
-            tx_by_account[acc_id].append((tx_date, amount))
-
-        accounts_without_snap = [
-            acc for acc in accounts if snapshots.get(acc.id) is None
-        ]
-        snap_before_map: Dict[UUID, Optional[BalanceSnapshot]] = {}
-        existing_at_month: Dict[UUID, Optional[BalanceSnapshot]] = {}
-        if accounts_without_snap:
-            ids_without = [a.id for a in accounts_without_snap]
-            snap_before_map = self.snapshot_repo.get_latest_before_for_accounts(
-                ids_without, month_start
-            )
-            existing_at_month = self.snapshot_repo.get_snapshots_at_date(
-                ids_without, month_start
-            )
-
-        result: Dict[UUID, Decimal] = {}
-        to_create: List[BalanceSnapshot] = []
+    def _ledger_balances_as_of(
+        self,
+        *,
+        accounts: List,
+        as_of: date,
+    ) -> Dict[UUID, Decimal]:
+        running = self.ledger_repo.get_running_net_as_of(
+            [a.id for a in accounts], as_of
+        )
+        return {
+            acc.id: Decimal(str(acc.initial_balance or 0))
+            + running.get(acc.id, Decimal("0"))
+            for acc in accounts
+        }
 
+    def _compute_balances_from_snapshots(
+        self,
+        *,
+        accounts: List,
+        snapshots: Dict[UUID, Optional[BalanceSnapshot]],
+        to_date: date,
+    ) -> Dict[UUID, Decimal]:
+        """
+        Native balance per account at the end of to_date (one query, read-only).
+
+        A snapshot holds the balance at the start of snapshot_date, so each window
+        starts on (and includes) the snapshot date. Snapshots are materialized
+        offline by SnapshotMaterializer; accounts without one sum from their
+        initial balance.
+        """
+        bases, windows = self._snapshot_windows(
+            accounts, snapshots, to_date, minor_units=self.minor_units
+        )
+        sums = self.transaction_repo.get_net_signed_sums_for_windows(
+            windows, minor_units=self.minor_units
+        )
+        if self.minor_units:
+            return {
+                acc.id: from_minor(bases[acc.id] + delta, acc.currency)
+                for acc, delta in zip(accounts, sums)
+            }
+        return {acc.id: bases[acc.id] + delta for acc, delta in zip(accounts, sums)}
+
+    @staticmethod
+    def _snapshot_windows(
+        accounts: List,
+        snapshots: Dict[UUID, Optional[BalanceSnapshot]],
+        to_date: date,
+        *,
+        minor_units: bool = False,
+    ) -> tuple[Dict[UUID, Union[Decimal, int]], List[tuple]]:
+        """Base balance and (account_id, from, to) sum window per account, in order."""
+        bases: Dict[UUID, Union[Decimal, int]] = {}
+        windows: List[tuple] = []
         for acc in accounts:
-            currency = acc.currency
-            initial = Decimal(str(acc.initial_balance or 0))
             snap = snapshots.get(acc.id)
+            base = snap.balance if snap else acc.initial_balance
+            bases[acc.id] = BalanceEngine._base_amount(base, acc.currency, minor_units)
+            windows.append((acc.id, snap.snapshot_date if snap else None, to_date))
+        return bases, windows
 
-            account_txs = tx_by_account.get(acc.id, [])
-
-            if snap:
-                base = Decimal(str(snap.balance))
-                day_after_snap = snap.snapshot_date + timedelta(days=1)
-                delta = sum(
-                    amt for d, amt in account_txs if day_after_snap <= d <= as_of
-                )
-                result[acc.id] = base + delta
-                continue
-
-            snap_before = snap_before_map.get(acc.id)
-
-            if snap_before:
-                base = Decimal(str(snap_before.balance))
-                day_after_snap = snap_before.snapshot_date + timedelta(days=1)
-                sum_before = sum(
-                    amt
-                    for d, amt in account_txs
-                    if day_after_snap <= d <= day_before_month
-                )
-                balance_at_month_start = base + sum_before
-            else:
-                sum_before = sum(amt for d, amt in account_txs if d <= day_before_month)
-                balance_at_month_start = initial + sum_before
-
-            if acc.id not in existing_at_month or existing_at_month[acc.id] is None:
-                to_create.append(
-                    BalanceSnapshot(
-                        account_id=acc.id,
-                        currency=currency,
-                        snapshot_date=month_start,
-                        balance=balance_at_month_start,
-                    )
-                )
 
-            delta = sum(amt for d, amt in account_txs if month_start <= d <= as_of)
-            result[acc.id] = balance_at_month_start + delta
+class AsyncBalanceEngine:
+    """
+    Async balance history for the opt-in AsyncSession path.
 
-        if to_create:
-            self.snapshot_repo.add_many(to_create)
+    Same algorithm and results as BalanceEngine.get_balance_history, but the
+    ledger read (get_balance_history_inputs) and the FX rate table run
+    concurrently, each on its own short-lived session.
+    """
 
-        return result
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        fx_service_factory: Callable[[Session], FxService] = lambda _: FxService(),
+        minor_units: bool = False,
+    ):
+        self.session_factory = session_factory
+        # FxService is sync; it is built on the sync facade of an async session.
+        self.fx_service_factory = fx_service_factory
+        self.minor_units = minor_units
 
-    def _compute_initial_balances(
+    async def get_balance_history(
         self,
-        *,
-        accounts: List,
+        user_id: UUID,
         from_date: date,
-        snapshots: Dict[UUID, Optional[BalanceSnapshot]],
-        snap_before_map: Dict[UUID, Optional[BalanceSnapshot]],
-        tx_before_by_account: Dict[UUID, List[tuple]],
-    ) -> Dict[UUID, Decimal]:
-        result: Dict[UUID, Decimal] = {}
-        day_before_from = from_date - timedelta(days=1)
+        to_date: date,
+        period: str,
+        base_currency: str,
+        *,
+        account_id: Optional[UUID] = None,
+    ) -> List[dict]:
+        async with self.session_factory() as session:
+            accounts = await AsyncAccountRepository(session).get_balance_rows(
+                user_id, account_id
+            )
+        point_dates = list(iter_dates(from_date, to_date, period))
+        if not accounts:
+            return [
+                {"date": d.isoformat(), "balance": Decimal("0")} for d in point_dates
+            ]
 
-        for acc in accounts:
-            initial = Decimal(str(acc.initial_balance or 0))
-            account_txs = tx_before_by_account.get(acc.id, [])
-            snap = snapshots.get(acc.id)
-            snap_before = snap_before_map.get(acc.id)
-
-            if snap:
-                base = Decimal(str(snap.balance))
-                day_after_snap = snap.snapshot_date + timedelta(days=1)
-                delta = sum(
-                    amt
-                    for d, amt in account_txs
-                    if day_after_snap <= d <= day_before_from
-                )
-                result[acc.id] = base + delta
-            elif snap_before:
-                base = Decimal(str(snap_before.balance))
-                day_after_snap = snap_before.snapshot_date + timedelta(days=1)
-                delta = sum(
-                    amt
-                    for d, amt in account_txs
-                    if day_after_snap <= d <= day_before_from
-                )
-                result[acc.id] = base + delta
-            else:
-                delta = sum(amt for d, amt in account_txs if d <= day_before_from)
-                result[acc.id] = initial + delta
+        (balances, tx_rows), fx_table = await asyncio.gather(
+            self._history_inputs(accounts, from_date, to_date),
+            self._rate_table(
+                BalanceEngine._history_pairs(accounts, base_currency), point_dates
+            ),
+        )
+        return BalanceEngine._history_points(
+            accounts=accounts,
+            balances=balances,
+            tx_rows=tx_rows,
+            point_dates=point_dates,
+            fx_table=fx_table,
+            base_currency=base_currency,
+            minor_units=self.minor_units,
+        )
 
-        return result
+    async def _history_inputs(
+        self, accounts: List, from_date: date, to_date: date
+    ) -> tuple[Dict[UUID, Union[Decimal, int]], List[tuple]]:
+        async with self.session_factory() as session:
+            snapshots, opening_sums, tx_rows = await AsyncTransactionRepository(
+                session
+            ).get_balance_history_inputs(
+                [a.id for a in accounts],
+                from_date,
+                to_date,
+                minor_units=self.minor_units,
+            )
+        return (
+            BalanceEngine._opening_balances(
+                accounts, snapshots, opening_sums, minor_units=self.minor_units
+            ),
+            tx_rows,
+        )
+
+    async def _rate_table(
+        self, pairs: List[tuple], point_dates: List[date]
+    ) -> FxRateTable:
+        async with self.session_factory() as session:
+            return await session.run_sync(
+                lambda sync_session: self.fx_service_factory(sync_session).rate_table(
+                    pairs, point_dates
+                )
+            )
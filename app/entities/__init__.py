@@ -1,7 +1,12 @@
 from .account import Account
+from .account_daily_balance import AccountDailyBalance
 from .balance_snapshot import BalanceSnapshot
 from .category import Category
+from .category_month_total import CategoryMonthTotal
 from .concept import Concept
+from .daily_cashflow_total import DailyCashflowTotal
+from .fx_rate import FxRate
+from .ledger_version import LedgerVersion
 from .tag import Tag
 from .transaction import Transaction
 from .transaction_tag import TransactionTag
@@ -10,9 +15,14 @@ from .user import User
 __all__ = [
     "User",
     "Account",
+    "AccountDailyBalance",
     "BalanceSnapshot",
     "Category",
+    "CategoryMonthTotal",
     "Concept",
+    "DailyCashflowTotal",
+    "FxRate",
+    "LedgerVersion",
     "Tag",
     "Transaction",
     "TransactionTag",
@@ -0,0 +1,44 @@
+"""
+Account daily balance ledger entity.
+
+A running-balance projection maintained incrementally on every transaction write
+(see docs/migrations/004_account_daily_balances.sql). One row per account per day
+that has activity; balance as of any date is the latest row on or before it plus
+account.initial_balance. Like snapshots, rows are native currency only and fully
+rebuildable from transactions.
+"""
+
+import uuid
+
+from sqlalchemy import Column, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy.dialects.postgresql import DATE, UUID
+
+from app.config.db_base import Base
+
+
+class AccountDailyBalance(Base):
+    """
+    Per-account, per-day running net of transactions.
+
+    - running_net = sum(signed transaction amounts with date <= balance_date).
+    - initial_balance is NOT included so editing an account's opening balance
+      never requires rewriting the ledger.
+    """
+
+    __tablename__ = "account_daily_balances"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    account_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    balance_date = Column(DATE, nullable=False)
+    running_net = Column(Numeric, nullable=False, default=0)
+
+    __table_args__ = (
+        # Also serves as the (account_id, balance_date) lookup index.
+        UniqueConstraint(
+            "account_id", "balance_date", name="uq_account_daily_balances_day"
+        ),
+    )
@@ -0,0 +1,68 @@
+"""
+Category month totals entity.
+
+A per-month rollup of transactions maintained incrementally on every transaction
+write (see docs/migrations/008_category_month_totals.sql). Category summaries
+answer whole months from here and scan raw transactions only for partial edge
+months. Like the balance ledger, rows are fully rebuildable from transactions.
+"""
+
+import uuid
+
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    Text,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import DATE, UUID
+
+from app.config.db_base import Base
+
+
+class CategoryMonthTotal(Base):
+    """
+    Net-signed amount and count of transactions per category, account, month
+    and transaction currency.
+
+    - month is always the first day of the month.
+    - net_amount adds income and subtracts expense, like category summaries.
+    - account_id is kept so soft-deleted accounts can be excluded at read time.
+    - (category_id, account_id, month, currency) is unique, with NULL currency
+      folded to '' so writers upsert into one row per key.
+    """
+
+    __tablename__ = "category_month_totals"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
+    category_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    account_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    month = Column(DATE, nullable=False)
+    currency = Column(Text, nullable=True)
+    net_amount = Column(Numeric, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_category_month_totals_user_month", "user_id", "month"),
+        Index(
+            "ix_category_month_totals_key",
+            "category_id",
+            "account_id",
+            "month",
+            func.coalesce(currency, literal_column("''")),
+            unique=True,
+        ),
+    )
@@ -0,0 +1,58 @@
+"""
+Daily cashflow totals entity.
+
+A per-day rollup of income and expense maintained incrementally on every
+transaction write (see docs/migrations/009_daily_cashflow_totals.sql). Cashflow
+history buckets are folded from these rows instead of grouping every raw
+transaction by a period expression. Rows are fully rebuildable from transactions.
+"""
+
+import uuid
+
+from sqlalchemy import Column, ForeignKey, Index, Numeric, Text, func, literal_column
+from sqlalchemy.dialects.postgresql import DATE, UUID
+
+from app.config.db_base import Base
+
+
+class DailyCashflowTotal(Base):
+    """
+    Income and expense per user, account, category, transaction currency and day.
+
+    - income sums income amounts; expense_abs sums expense amounts (both as stored,
+      like cashflow history).
+    - account_id is kept so soft-deleted accounts can be excluded at read time.
+    - (account_id, category_id, day, currency) is unique, with NULL currency
+      folded to '' so writers upsert into one row per key.
+    """
+
+    __tablename__ = "daily_cashflow_totals"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
+    account_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    category_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    currency = Column(Text, nullable=True)
+    day = Column(DATE, nullable=False)
+    income = Column(Numeric, nullable=False, default=0)
+    expense_abs = Column(Numeric, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_daily_cashflow_totals_user_day", "user_id", "day"),
+        Index(
+            "ix_daily_cashflow_totals_key",
+            "account_id",
+            "category_id",
+            "day",
+            func.coalesce(currency, literal_column("''")),
+            unique=True,
+        ),
+    )
@@ -0,0 +1,40 @@
+"""
+Historical FX rate entity.
+
+Reference data loaded in bulk from rate files (see commands/load_fx_rates.py and
+docs/migrations/005_fx_rates.sql). FxService reads the latest rate on or before
+the as_of date; rates are never applied to stored balances.
+"""
+
+import datetime
+import uuid
+
+from sqlalchemy import Column, DateTime, Numeric, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import DATE, UUID
+
+from app.config.db_base import Base
+
+
+class FxRate(Base):
+    """
+    One rate per currency pair per day: 1 unit of base = rate units of quote.
+
+    Days without a row (weekends, holidays) use the latest earlier rate.
+    """
+
+    __tablename__ = "fx_rates"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    base = Column(Text, nullable=False)
+    quote = Column(Text, nullable=False)
+    rate_date = Column(DATE, nullable=False)
+    rate = Column(Numeric, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+    )
+
+    __table_args__ = (
+        # Also serves as the (base, quote, rate_date) as_of lookup index.
+        UniqueConstraint("base", "quote", "rate_date", name="uq_fx_rates_pair_date"),
+    )
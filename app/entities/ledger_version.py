@@ -0,0 +1,111 @@
+"""
+Ledger version entity.
+
+A counter per scope (one per user, plus one for the shared fx_rates table),
+bumped in the same transaction as every write that can change what the user's
+ledger views return (see docs/migrations/010_ledger_versions.sql). Conditional
+GETs read the counters by primary key instead of aggregating the user's history.
+
+Only sessions from a factory passed to track_ledger_versions bump counters; the
+app's factory is tracked when LEDGER_ETAG_ENABLED is on.
+"""
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, Text, event, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config.db_base import Base
+from app.entities.account import Account
+from app.entities.category import Category
+from app.entities.concept import Concept
+from app.entities.fx_rate import FxRate
+from app.entities.tag import Tag
+from app.entities.transaction import Transaction
+from app.entities.transaction_tag import TransactionTag
+
+# Scope of the shared FX rate table; user scopes are str(user_id)
+FX_RATES_SCOPE = "fx_rates"
+# Bumped at startup: tags issued before counting was last off stop matching
+EPOCH_SCOPE = "epoch"
+# Session.info key set on tracked sessions
+_TRACKED = "ledger_versions_tracked"
+
+# Entities whose rows carry user_id and feed ledger views
+_USER_OWNED = (Transaction, Account, Category, Concept, Tag)
+
+
+class LedgerVersion(Base):
+    """Monotonic write counter of one scope; a missing row reads as version 0."""
+
+    __tablename__ = "ledger_versions"
+
+    scope = Column(Text, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+def user_scope(user_id: UUID) -> str:
+    return str(user_id)
+
+
+def track_ledger_versions(factory: sessionmaker) -> sessionmaker:
+    """Bump ledger versions on every flush of the factory's sessions."""
+    factory.configure(info={_TRACKED: True})
+    event.listen(factory, "before_flush", _bump_on_flush)
+    return factory
+
+
+def versions_tracked(session: Session) -> bool:
+    return bool(session.info.get(_TRACKED))
+
+
+def bump_versions(connection: Connection, scopes: Iterable[str]) -> None:
+    """
+    Increment each scope's counter, creating missing rows, on `connection`.
+
+    INSERT ... ON CONFLICT DO UPDATE on Postgres and SQLite, so concurrent
+    writers never race on the first row; other dialects UPDATE then INSERT.
+    """
+    LV = LedgerVersion.__table__
+    for scope in sorted(set(scopes)):
+        dialect = connection.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert(LV).values(scope=scope, version=1)
+            connection.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[LV.c.scope],
+                    set_={"version": LV.c.version + 1},
+                )
+            )
+            continue
+        updated = connection.execute(
+            update(LV).where(LV.c.scope == scope).values(version=LV.c.version + 1)
+        )
+        if not updated.rowcount:
+            connection.execute(LV.insert().values(scope=scope, version=1))
+
+
+def _bump_on_flush(session: Session, flush_context, instances) -> None:
+    """Bump the owners' versions for every ledger row the flush writes."""
+    scopes = set()
+    tag_ids = set()
+    modified = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in (*session.new, *modified, *session.deleted):
+        if isinstance(obj, _USER_OWNED):
+            if obj.user_id is not None:
+                scopes.add(user_scope(obj.user_id))
+        elif isinstance(obj, TransactionTag):
+            tag_ids.add(obj.tag_id)
+        elif isinstance(obj, FxRate):
+            scopes.add(FX_RATES_SCOPE)
+    if not scopes and not tag_ids:
+        return
+    connection = session.connection()
+    if tag_ids:
+        owners = connection.scalars(select(Tag.user_id).where(Tag.id.in_(tag_ids)))
+        scopes.update(user_scope(user_id) for user_id in owners)
+    bump_versions(connection, scopes)
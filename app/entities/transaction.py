@@ -2,11 +2,23 @@ import datetime
 import uuid
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Text
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Text,
+    event,
+    select,
+)
 from sqlalchemy.dialects.postgresql import DATE, NUMERIC, UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.attributes import instance_state
 
 from app.config.db_base import Base
+from app.entities.account import Account
+from app.shared.helpers.money_helper import to_minor
 
 
 class TransactionType(str, Enum):
@@ -16,6 +28,7 @@ class TransactionType(str, Enum):
 
 class TransactionSource(str, Enum):
     MANUAL = "manual"
+    IMPORT = "import"
 
 
 class Transaction(Base):
@@ -35,9 +48,13 @@ class Transaction(Base):
     transfer_id = Column(UUID(as_uuid=True))
     type = Column(Text, nullable=False)
     amount = Column(NUMERIC, nullable=False)
+    # amount in integer minor units of the account currency (see migration 006)
+    amount_minor = Column(BigInteger, nullable=True)
     currency = Column(Text)
     date = Column(DATE, nullable=False)
     source = Column(Text, default=TransactionSource.MANUAL.value)
+    # statement_row_hash of imported rows; NULL for manual entries (see migration 007)
+    import_hash = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(
         DateTime,
@@ -53,3 +70,32 @@ class Transaction(Base):
         "TransactionTag", back_populates="transaction", cascade="all, delete-orphan"
     )
     user = relationship("User", back_populates="transactions")
+
+    __table_args__ = (
+        Index(
+            "uq_transactions_account_import_hash",
+            "account_id",
+            "import_hash",
+            unique=True,
+        ),
+    )
+
+
+@event.listens_for(Transaction, "before_insert")
+@event.listens_for(Transaction, "before_update")
+def _sync_amount_minor(mapper, connection, target: Transaction) -> None:
+    """Keep amount_minor in step with amount and the account's currency."""
+    state = instance_state(target)
+    if state.has_identity and not (
+        state.attrs.amount.history.has_changes()
+        or state.attrs.account_id.history.has_changes()
+    ):
+        return
+    account = state.dict.get("account")
+    if account is not None and account.id == target.account_id:
+        currency = account.currency
+    else:
+        currency = connection.scalar(
+            select(Account.currency).where(Account.id == target.account_id)
+        )
+    target.amount_minor = to_minor(target.amount, currency)
@@ -0,0 +1,155 @@
+"""
+Repository for account_daily_balances (running-balance ledger).
+
+Rows hold the running net of transactions per account per day. Writes are
+incremental deltas applied in the same unit of work as the transaction write;
+reads are one indexed lookup per account.
+
+All methods are set-based; never call inside loops over accounts.
+Methods never commit — the caller owns the transaction.
+"""
+
+import logging
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import and_, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.entities.account import Account
+from app.entities.account_daily_balance import AccountDailyBalance
+from app.repository.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AccountDailyBalanceRepository(BaseRepository[AccountDailyBalance]):
+    def __init__(self, db: Session) -> None:
+        super().__init__(db, AccountDailyBalance)
+
+    def apply_delta(self, account_id: UUID, day: date, delta: Decimal) -> None:
+        """
+        Add a signed transaction amount to the ledger at `day`.
+
+        Locks the account row, ensures a row exists for `day` (seeded from the
+        previous day's running net) and shifts every row on or after `day` by
+        `delta` in one UPDATE. Does NOT commit.
+        """
+        if not delta:
+            return
+        logger.debug(
+            f"DB apply_delta: AccountDailyBalance account_id={account_id} "
+            f"day={day} delta={delta}"
+        )
+        ADB = AccountDailyBalance
+        self._lock_account(account_id)
+        exists = (
+            self.db.query(ADB.id)
+            .filter(ADB.account_id == account_id, ADB.balance_date == day)
+            .first()
+        )
+        if exists is None:
+            previous = (
+                self.db.query(ADB.running_net)
+                .filter(ADB.account_id == account_id, ADB.balance_date < day)
+                .order_by(ADB.balance_date.desc())
+                .first()
+            )
+            seed = Decimal(str(previous.running_net)) if previous else Decimal("0")
+            self._insert_day_if_missing(account_id, day, seed)
+
+        self.db.query(ADB).filter(
+            ADB.account_id == account_id, ADB.balance_date >= day
+        ).update({ADB.running_net: ADB.running_net + delta}, synchronize_session=False)
+
+    def _lock_account(self, account_id: UUID) -> None:
+        """
+        Hold the account row lock (SELECT ... FOR UPDATE) until the caller commits.
+
+        Ledger writes to one account run one at a time: a write that seeds a new
+        day from the last committed row and a write on an earlier day whose
+        UPDATE must shift that new row would otherwise miss each other under
+        READ COMMITTED. SQLite ignores FOR UPDATE; it serializes writers anyway.
+        """
+        self.db.query(Account.id).filter(
+            Account.id == account_id
+        ).with_for_update().first()
+
+    def _insert_day_if_missing(
+        self, account_id: UUID, day: date, seed: Decimal
+    ) -> None:
+        """
+        Insert the (account_id, day) row unless a concurrent write already did.
+
+        Two first writes for the same day both see no row; the loser's insert
+        becomes a no-op (ON CONFLICT DO NOTHING on Postgres/SQLite, a savepoint
+        elsewhere) and its UPDATE then shifts the winner's row, so neither
+        delta is lost.
+        """
+        values = {
+            "id": uuid.uuid4(),
+            "account_id": account_id,
+            "balance_date": day,
+            "running_net": seed,
+        }
+        dialect = self.db.bind.dialect.name if self.db.bind else ""
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            self.db.execute(
+                insert(AccountDailyBalance)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["account_id", "balance_date"])
+            )
+            return
+        try:
+            with self.db.begin_nested():
+                self.db.add(AccountDailyBalance(**values))
+        except IntegrityError:
+            logger.debug(
+                f"DB apply_delta: AccountDailyBalance account_id={account_id} "
+                f"day={day} inserted concurrently"
+            )
+
+    def get_running_net_as_of(
+        self, account_ids: List[UUID], as_of: date
+    ) -> Dict[UUID, Decimal]:
+        """
+        Running net (sum of signed transactions with date <= as_of) per account.
+
+        Accounts with no ledger rows on or before as_of map to Decimal("0").
+        """
+        if not account_ids:
+            return {}
+        logger.debug(
+            f"DB get_running_net_as_of: account_ids={len(account_ids)} as_of={as_of}"
+        )
+        ADB = AccountDailyBalance
+        latest = (
+            self.db.query(
+                ADB.account_id.label("account_id"),
+                func.max(ADB.balance_date).label("balance_date"),
+            )
+            .filter(ADB.account_id.in_(account_ids), ADB.balance_date <= as_of)
+            .group_by(ADB.account_id)
+            .subquery()
+        )
+        rows = (
+            self.db.query(ADB.account_id, ADB.running_net)
+            .join(
+                latest,
+                and_(
+                    ADB.account_id == latest.c.account_id,
+                    ADB.balance_date == latest.c.balance_date,
+                ),
+            )
+            .all()
+        )
+        result: Dict[UUID, Decimal] = {aid: Decimal("0") for aid in account_ids}
+        for account_id, running_net in rows:
+            result[account_id] = Decimal(str(running_net))
+        return result
@@ -1,19 +1,38 @@
 import logging
-from typing import List
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.entities.account import Account
-from app.repository.base_repository import BaseRepository
+from app.entities.transaction import Transaction
+from app.repository.base_repository import AsyncBaseRepository, BaseRepository
+from app.repository.ledger_version_repository import LedgerVersionRepository
+from app.shared.helpers.money_helper import to_minor
+from app.shared.helpers.request_cache_helper import RequestCache
 
 logger = logging.getLogger(__name__)
 
 
+class AccountBalanceRow(NamedTuple):
+    """The account columns balance computations read, without ORM identity."""
+
+    id: UUID
+    name: str
+    currency: Optional[str]
+    initial_balance: Optional[Decimal]
+
+
 class AccountRepository(BaseRepository[Account]):
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self, db: Session, request_cache: Optional[RequestCache] = None
+    ) -> None:
         super().__init__(db, Account)
+        # Optional: per-request identity map, so one request lists accounts once
+        self.request_cache = request_cache
 
     def get(self, id: UUID) -> Account:
         """Get an active (non-deleted) account by ID. Raises 404 if not found or soft-deleted."""
@@ -29,6 +48,13 @@ class AccountRepository(BaseRepository[Account]):
 
     def get_by_user_id(self, user_id: UUID) -> List[Account]:
         """Get all active (non-deleted) accounts for a user."""
+        if self.request_cache is not None:
+            return self.request_cache.get_or_load(
+                ("accounts", user_id), lambda: self._query_by_user_id(user_id)
+            )
+        return self._query_by_user_id(user_id)
+
+    def _query_by_user_id(self, user_id: UUID) -> List[Account]:
         logger.debug(
             f"DB get_by_user_id: Account user_id={user_id} (is_deleted=False filter)"
         )
@@ -40,11 +66,115 @@ class AccountRepository(BaseRepository[Account]):
             .all()
         )
 
+    def get_balance_rows(
+        self, user_id: UUID, account_id: Optional[UUID] = None
+    ) -> List[AccountBalanceRow]:
+        """
+        Active accounts of a user (optionally only account_id) as column tuples.
+
+        Filters run in SQL and no ORM entities are hydrated, so engines can read
+        accounts without loading full rows into the session.
+        """
+        if self.request_cache is not None:
+            return self.request_cache.get_or_load(
+                ("balance_accounts", user_id, account_id),
+                lambda: self._query_balance_rows(user_id, account_id),
+            )
+        return self._query_balance_rows(user_id, account_id)
+
+    def _query_balance_rows(
+        self, user_id: UUID, account_id: Optional[UUID]
+    ) -> List[AccountBalanceRow]:
+        logger.debug(
+            f"DB get_balance_rows: Account user_id={user_id} account_id={account_id}"
+        )
+        query = self.db.query(
+            Account.id, Account.name, Account.currency, Account.initial_balance
+        ).filter(
+            Account.user_id == user_id,
+            Account.is_deleted == False,  # noqa: E712
+        )
+        if account_id is not None:
+            query = query.filter(Account.id == account_id)
+        return [AccountBalanceRow(*row) for row in query.all()]
+
+    def has_transactions(self, id: UUID) -> bool:
+        """Whether any transaction references the account (one EXISTS query)."""
+        logger.debug(f"DB has_transactions: Account id={id}")
+        return self.db.query(
+            self.db.query(Transaction.id).filter(Transaction.account_id == id).exists()
+        ).scalar()
+
+    def rescale_amount_minor(self, id: UUID, currency: Optional[str]) -> int:
+        """
+        Recompute amount_minor of the account's transactions for `currency`.
+
+        One SELECT plus one executemany UPDATE by primary key; returns the number
+        of rows rewritten. Does NOT commit.
+        """
+        logger.debug(f"DB rescale_amount_minor: Account id={id} currency={currency}")
+        rows = [
+            {"id": tx_id, "amount_minor": to_minor(amount, currency)}
+            for tx_id, amount in self.db.query(Transaction.id, Transaction.amount)
+            .filter(Transaction.account_id == id)
+            .all()
+        ]
+        if rows:
+            self.db.execute(update(Transaction), rows)
+        return len(rows)
+
+    def get_currencies_for_user(
+        self, user_id: UUID, ids: Iterable[UUID]
+    ) -> Dict[UUID, str]:
+        """Currency of each active account in ids owned by user_id (one IN query)."""
+        ids = set(ids)
+        if not ids:
+            return {}
+        logger.debug(
+            f"DB get_currencies_for_user: Account user_id={user_id} ids={len(ids)}"
+        )
+        rows = (
+            self.db.query(Account.id, Account.currency)
+            .filter(
+                Account.id.in_(ids),
+                Account.user_id == user_id,
+                Account.is_deleted == False,  # noqa: E712
+            )
+            .all()
+        )
+        return {row.id: row.currency for row in rows}
+
+    def get_active(self) -> List[AccountBalanceRow]:
+        """Active accounts across users as column tuples (batch jobs only)."""
+        logger.debug("DB get_active: Account (is_deleted=False filter)")
+        rows = (
+            self.db.query(
+                Account.id, Account.name, Account.currency, Account.initial_balance
+            )
+            .filter(Account.is_deleted == False)  # noqa: E712
+            .order_by(Account.id)
+            .all()
+        )
+        return [AccountBalanceRow(*row) for row in rows]
+
     def soft_delete(self, id: UUID) -> None:
         """Mark an account as deleted (is_deleted=True) and commit."""
         logger.debug(f"DB soft_delete: Account id={id}")
+        user_id = self.db.query(Account.user_id).filter(Account.id == id).scalar()
         self.db.query(Account).filter(Account.id == id).update(
             {"is_deleted": True}, synchronize_session=False
         )
+        LedgerVersionRepository(self.db).bump_users([user_id])
         self.db.commit()
         logger.info(f"Soft-deleted Account with ID: {id}")
+
+
+class AsyncAccountRepository(AsyncBaseRepository[AccountRepository]):
+    """Async reads used by the async balance path (see AsyncBaseRepository)."""
+
+    repository_class = AccountRepository
+
+    async def get_balance_rows(
+        self, user_id: UUID, account_id: Optional[UUID] = None
+    ) -> List[AccountBalanceRow]:
+        return await self.run(lambda repo: repo.get_balance_rows(user_id, account_id))
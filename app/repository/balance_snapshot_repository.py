@@ -2,17 +2,19 @@
 Repository for balance_snapshots.
 
 Snapshots are a reporting optimization: balance at start of month, in account currency.
-They are lazy-created and rebuildable; never store converted balances.
+They are materialized offline and rebuildable; never store converted balances.
 
 All methods are set-based; never call inside loops.
 """
 
 import logging
 from datetime import date
+from decimal import Decimal
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
 
 from app.entities.balance_snapshot import BalanceSnapshot
 from app.repository.base_repository import BaseRepository
@@ -80,6 +82,51 @@ class BalanceSnapshotRepository(BaseRepository[BalanceSnapshot]):
             .first()
         )
 
+    def _latest_per_account_query(self, account_ids: List[UUID], date_filter):
+        """
+        Query for the latest snapshot matching date_filter, one row per account.
+
+        Postgres uses DISTINCT ON (account_id); other dialects rank rows with
+        ROW_NUMBER() OVER (PARTITION BY account_id ORDER BY snapshot_date DESC).
+        Both walk idx_balance_snapshots_account_date (account_id, snapshot_date DESC).
+        """
+        order = (BalanceSnapshot.account_id, BalanceSnapshot.snapshot_date.desc())
+        filters = (BalanceSnapshot.account_id.in_(account_ids), date_filter)
+        dialect = self.db.bind.dialect.name if self.db.bind else ""
+        if dialect == "postgresql":
+            return (
+                self.db.query(BalanceSnapshot)
+                .filter(*filters)
+                .distinct(BalanceSnapshot.account_id)
+                .order_by(*order)
+            )
+        ranked = (
+            self.db.query(
+                BalanceSnapshot,
+                func.row_number()
+                .over(
+                    partition_by=BalanceSnapshot.account_id,
+                    order_by=BalanceSnapshot.snapshot_date.desc(),
+                )
+                .label("rn"),
+            )
+            .filter(*filters)
+            .subquery()
+        )
+        latest = aliased(BalanceSnapshot, ranked)
+        return self.db.query(latest).filter(ranked.c.rn == 1)
+
+    def _latest_per_account(
+        self, account_ids: List[UUID], date_filter
+    ) -> Dict[UUID, Optional[BalanceSnapshot]]:
+        query = self._latest_per_account_query(account_ids, date_filter)
+        result: Dict[UUID, Optional[BalanceSnapshot]] = {
+            aid: None for aid in account_ids
+        }
+        for row in query.all():
+            result[row.account_id] = row
+        return result
+
     def get_latest_snapshots_for_accounts(
         self, account_ids: List[UUID], as_of: date
     ) -> Dict[UUID, Optional[BalanceSnapshot]]:
@@ -94,30 +141,9 @@ class BalanceSnapshotRepository(BaseRepository[BalanceSnapshot]):
             f"DB get_latest_snapshots_for_accounts: account_ids={len(account_ids)} "
             f"as_of={as_of}"
         )
-        # Use DISTINCT ON (Postgres) or subquery for "latest per account"
-        # SQLite doesn't support DISTINCT ON; use a correlated subquery or group by
-        subq = (
-            self.db.query(BalanceSnapshot)
-            .filter(
-                BalanceSnapshot.account_id.in_(account_ids),
-                BalanceSnapshot.snapshot_date <= as_of,
-            )
-            .order_by(
-                BalanceSnapshot.account_id,
-                BalanceSnapshot.snapshot_date.desc(),
-            )
+        return self._latest_per_account(
+            account_ids, BalanceSnapshot.snapshot_date <= as_of
         )
-        rows = subq.all()
-        # Deduplicate: keep first (latest) per account
-        result: Dict[UUID, Optional[BalanceSnapshot]] = {
-            aid: None for aid in account_ids
-        }
-        seen: set = set()
-        for row in rows:
-            if row.account_id not in seen:
-                seen.add(row.account_id)
-                result[row.account_id] = row
-        return result
 
     def get_latest_before_for_accounts(
         self, account_ids: List[UUID], before_date: date
@@ -131,27 +157,9 @@ class BalanceSnapshotRepository(BaseRepository[BalanceSnapshot]):
             f"DB get_latest_before_for_accounts: account_ids={len(account_ids)} "
             f"before_date={before_date}"
         )
-        rows = (
-            self.db.query(BalanceSnapshot)
-            .filter(
-                BalanceSnapshot.account_id.in_(account_ids),
-                BalanceSnapshot.snapshot_date < before_date,
-            )
-            .order_by(
-                BalanceSnapshot.account_id,
-                BalanceSnapshot.snapshot_date.desc(),
-            )
-            .all()
+        return self._latest_per_account(
+            account_ids, BalanceSnapshot.snapshot_date < before_date
         )
-        result: Dict[UUID, Optional[BalanceSnapshot]] = {
-            aid: None for aid in account_ids
-        }
-        seen: set = set()
-        for row in rows:
-            if row.account_id not in seen:
-                seen.add(row.account_id)
-                result[row.account_id] = row
-        return result
 
     def get_snapshots_at_date(
         self, account_ids: List[UUID], snapshot_date: date
@@ -225,3 +233,29 @@ class BalanceSnapshotRepository(BaseRepository[BalanceSnapshot]):
         )
         # Caller is responsible for commit (e.g. same request as transaction update/delete)
         return deleted
+
+    def apply_delta(self, account_id: UUID, tx_date: date, delta: Decimal) -> int:
+        """
+        Shift snapshots that include a transaction dated tx_date by `delta`.
+
+        A snapshot covers transactions with date < snapshot_date, so only rows with
+        snapshot_date > tx_date change. Keeps the snapshot chain warm instead of
+        deleting it. Does NOT commit.
+        """
+        if not delta:
+            return 0
+        logger.debug(
+            f"DB apply_delta: BalanceSnapshot account_id={account_id} "
+            f"tx_date={tx_date} delta={delta}"
+        )
+        return (
+            self.db.query(BalanceSnapshot)
+            .filter(
+                BalanceSnapshot.account_id == account_id,
+                BalanceSnapshot.snapshot_date > tx_date,
+            )
+            .update(
+                {BalanceSnapshot.balance: BalanceSnapshot.balance + delta},
+                synchronize_session=False,
+            )
+        )
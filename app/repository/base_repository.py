@@ -1,11 +1,13 @@
 import logging
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, Callable, Generic, Iterable, List, Optional, Set, Type, TypeVar
 from uuid import UUID
 
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Session
 
 T = TypeVar("T", bound=DeclarativeBase)
+R = TypeVar("R", bound="BaseRepository")
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,22 @@ class BaseRepository(Generic[T]):
             .all()  # type: ignore
         )
 
+    def get_owned_ids(self, user_id: UUID, ids: Iterable[UUID]) -> Set[UUID]:
+        """Subset of ids that exist and belong to user_id, in one IN query."""
+        ids = set(ids)
+        if not ids:
+            return set()
+        logger.debug(
+            f"DB get_owned_ids: {self.model.__name__} user_id={user_id} "
+            f"ids={len(ids)}"
+        )
+        rows = (
+            self.db.query(self.model.id)  # type: ignore
+            .filter(self.model.id.in_(ids), self.model.user_id == user_id)
+            .all()
+        )
+        return {row.id for row in rows}
+
     def delete(self, id: UUID, auto_commit: bool = True) -> Optional[T]:
         """Delete entity by ID with transaction handling"""
         logger.debug(f"DB delete: {self.model.__name__} id={id}")
@@ -129,3 +147,30 @@ class BaseRepository(Generic[T]):
                 )
                 raise
         return obj
+
+
+class AsyncBaseRepository(Generic[R]):
+    """
+    Async variant of a repository, bound to an AsyncSession.
+
+    Methods run the sync repository's query code through AsyncSession.run_sync:
+    the SQL lives in one place and the I/O is awaited on the async driver. One
+    AsyncSession runs one statement at a time; use a session per concurrent
+    branch when gathering queries.
+    """
+
+    repository_class: Type[R]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run(self, fn: Callable[[R], Any]) -> Any:
+        return await self.db.run_sync(
+            lambda session: fn(self.repository_class(session))
+        )
+
+    async def get(self, id: UUID) -> Any:
+        return await self.run(lambda repo: repo.get(id))
+
+    async def get_by_user_id(self, user_id: UUID) -> List[Any]:
+        return await self.run(lambda repo: repo.get_by_user_id(user_id))
@@ -0,0 +1,234 @@
+"""
+Repository for category_month_totals (per-month category rollup).
+
+Writes are incremental deltas applied in the same unit of work as the
+transaction write; reads return one aggregate row per category for a range of
+whole months.
+
+Methods never commit — the caller owns the transaction.
+"""
+
+import logging
+import uuid
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.entities.account import Account
+from app.entities.category_month_total import CategoryMonthTotal
+from app.entities.transaction import Transaction, TransactionType
+from app.repository.base_repository import BaseRepository
+from app.schemas.reporting_schemas import CategoryAggregationData
+from app.shared.helpers.date_helper import first_day_of_month
+
+logger = logging.getLogger(__name__)
+
+# (user_id, category_id, account_id, month, currency)
+RollupKey = Tuple[UUID, UUID, UUID, date, Optional[str]]
+
+
+class CategoryMonthTotalRepository(BaseRepository[CategoryMonthTotal]):
+    def __init__(self, db: Session) -> None:
+        super().__init__(db, CategoryMonthTotal)
+
+    def apply_deltas(self, deltas: Dict[RollupKey, Tuple[Decimal, int]]) -> None:
+        """
+        Add (net_amount, count) deltas to their rollup rows, creating missing rows.
+
+        On Postgres/SQLite one INSERT ... ON CONFLICT DO UPDATE against the
+        unique key index upserts every key, so concurrent first writes to the
+        same month add to one row instead of inserting two. Keys are written
+        in sorted order so concurrent batches lock rows in the same order.
+        Other dialects UPDATE, then INSERT when no row matched. Callers
+        pre-aggregate, so a batch of writes costs one row per touched month.
+        Does NOT commit.
+        """
+        CMT = CategoryMonthTotal
+        rows = []
+        for key, (amount, count) in sorted(deltas.items(), key=lambda kv: str(kv[0])):
+            if not amount and not count:
+                continue
+            user_id, category_id, account_id, month, currency = key
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "category_id": category_id,
+                    "account_id": account_id,
+                    "month": month,
+                    "currency": currency,
+                    "net_amount": amount,
+                    "count": count,
+                }
+            )
+        if not rows:
+            return
+        logger.debug(f"DB apply_deltas: CategoryMonthTotal keys={len(rows)}")
+        dialect = self.db.bind.dialect.name if self.db.bind else ""
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert(CMT)
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        CMT.category_id,
+                        CMT.account_id,
+                        CMT.month,
+                        func.coalesce(CMT.currency, literal_column("''")),
+                    ],
+                    set_={
+                        "net_amount": CMT.net_amount + stmt.excluded.net_amount,
+                        "count": CMT.count + stmt.excluded.count,
+                    },
+                ),
+                rows,
+            )
+            return
+        for row in rows:
+            updated = (
+                self.db.query(CMT)
+                .filter(
+                    CMT.category_id == row["category_id"],
+                    CMT.account_id == row["account_id"],
+                    CMT.month == row["month"],
+                    CMT.currency.is_not_distinct_from(row["currency"]),
+                )
+                .update(
+                    {
+                        CMT.net_amount: CMT.net_amount + row["net_amount"],
+                        CMT.count: CMT.count + row["count"],
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if not updated:
+                self.db.add(CMT(**row))
+        self.db.flush()
+
+    def get_net_signed_amounts_and_counts_by_category(
+        self,
+        user_id: UUID,
+        month_from: date,
+        month_to: date,
+        category_ids: Optional[List[UUID]] = None,
+        *,
+        account_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+    ) -> Dict[UUID, CategoryAggregationData]:
+        """
+        Net-signed amounts and counts per category over whole months
+        [month_from, month_to] (both first days of month), excluding
+        soft-deleted accounts. Categories with no rows are absent.
+        """
+        logger.debug(
+            f"DB get_net_signed_amounts_and_counts_by_category: CategoryMonthTotal "
+            f"user_id={user_id} month_from={month_from} month_to={month_to}"
+        )
+        CMT = CategoryMonthTotal
+        query = (
+            self.db.query(
+                CMT.category_id,
+                func.sum(CMT.net_amount).label("net_amount"),
+                func.sum(CMT.count).label("count"),
+            )
+            .join(Account, CMT.account_id == Account.id)
+            .filter(
+                CMT.user_id == user_id,
+                CMT.month >= month_from,
+                CMT.month <= month_to,
+                Account.is_deleted == False,  # noqa: E712
+            )
+            .group_by(CMT.category_id)
+        )
+        if category_ids is not None:
+            query = query.filter(CMT.category_id.in_(category_ids))
+        if account_id is not None:
+            query = query.filter(CMT.account_id == account_id)
+        if currency is not None:
+            query = query.filter(CMT.currency == currency)
+
+        return {
+            category_id: CategoryAggregationData(
+                net_signed_amount=Decimal(str(net_amount or 0)),
+                transaction_count=int(count or 0),
+            )
+            for category_id, net_amount, count in query.all()
+            if count
+        }
+
+    def rebuild_for_categories(self, category_ids: Iterable[UUID]) -> int:
+        """
+        Recompute the rollup rows of the given categories from transactions.
+
+        Used after set-based rewrites that bypass TransactionService (category
+        migration). Transactions are grouped by day in SQL and folded into months
+        here, which keeps the query dialect-neutral. Returns rows written.
+        Does NOT commit.
+        """
+        category_ids = list(set(category_ids))
+        if not category_ids:
+            return 0
+        logger.debug(f"DB rebuild_for_categories: category_ids={len(category_ids)}")
+        CMT = CategoryMonthTotal
+        self.db.query(CMT).filter(CMT.category_id.in_(category_ids)).delete(
+            synchronize_session=False
+        )
+
+        rows = (
+            self.db.query(
+                Transaction.user_id,
+                Transaction.category_id,
+                Transaction.account_id,
+                Transaction.date,
+                Transaction.currency,
+                Transaction.type,
+                func.sum(Transaction.amount).label("amount"),
+                func.count(Transaction.id).label("count"),
+            )
+            .filter(Transaction.category_id.in_(category_ids))
+            .group_by(
+                Transaction.user_id,
+                Transaction.category_id,
+                Transaction.account_id,
+                Transaction.date,
+                Transaction.currency,
+                Transaction.type,
+            )
+            .all()
+        )
+        totals: Dict[RollupKey, List] = defaultdict(lambda: [Decimal("0"), 0])
+        for row in rows:
+            amount = Decimal(str(row.amount))
+            if row.type != TransactionType.INCOME.value:
+                amount = -amount
+            key = (
+                row.user_id,
+                row.category_id,
+                row.account_id,
+                first_day_of_month(row.date),
+                row.currency,
+            )
+            totals[key][0] += amount
+            totals[key][1] += int(row.count)
+
+        for key, (amount, count) in totals.items():
+            user_id, category_id, account_id, month, currency = key
+            self.db.add(
+                CMT(
+                    user_id=user_id,
+                    category_id=category_id,
+                    account_id=account_id,
+                    month=month,
+                    currency=currency,
+                    net_amount=amount,
+                    count=count,
+                )
+            )
+        self.db.flush()
+        return len(totals)
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -8,13 +8,27 @@ from app.entities.account import Account
 from app.entities.category import Category
 from app.entities.transaction import Transaction
 from app.repository.base_repository import BaseRepository
+from app.repository.ledger_version_repository import LedgerVersionRepository
+from app.shared.helpers.request_cache_helper import RequestCache
 
 logger = logging.getLogger(__name__)
 
 
 class CategoryRepository(BaseRepository[Category]):
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self, db: Session, request_cache: Optional[RequestCache] = None
+    ) -> None:
         super().__init__(db, Category)
+        # Optional: per-request identity map, so one request lists categories once
+        self.request_cache = request_cache
+
+    def get_by_user_id(self, user_id: UUID) -> List[Category]:
+        load = super().get_by_user_id
+        if self.request_cache is not None:
+            return self.request_cache.get_or_load(
+                ("categories", user_id), lambda: load(user_id)
+            )
+        return load(user_id)
 
     def count_transactions(self, category_id: UUID) -> int:
         """Return the number of visible transactions that belong to this category.
@@ -33,7 +47,9 @@ class CategoryRepository(BaseRepository[Category]):
             .count()
         )
 
-    def migrate_transactions(self, source_id: UUID, target_id: UUID) -> int:
+    def migrate_transactions(
+        self, source_id: UUID, target_id: UUID, auto_commit: bool = True
+    ) -> int:
         """
         Reassign all transactions from source_category to target_category.
 
@@ -47,7 +63,10 @@ class CategoryRepository(BaseRepository[Category]):
             .filter(Transaction.category_id == source_id)
             .update({"category_id": target_id}, synchronize_session=False)
         )
-        self.db.commit()
+        user_id = self.db.query(Category.user_id).filter(Category.id == source_id)
+        LedgerVersionRepository(self.db).bump_users([user_id.scalar()])
+        if auto_commit:
+            self.db.commit()
         logger.info(
             f"Migrated {updated} transaction(s) from category {source_id} → {target_id}"
         )
@@ -62,6 +81,16 @@ class CategoryRepository(BaseRepository[Category]):
 
     def get_by_user_id_and_type(
         self, user_id: UUID, category_type: str
+    ) -> List[Category]:
+        if self.request_cache is not None:
+            return self.request_cache.get_or_load(
+                ("categories", user_id, category_type),
+                lambda: self._query_by_user_id_and_type(user_id, category_type),
+            )
+        return self._query_by_user_id_and_type(user_id, category_type)
+
+    def _query_by_user_id_and_type(
+        self, user_id: UUID, category_type: str
     ) -> List[Category]:
         return (
             self.db.query(self.model)
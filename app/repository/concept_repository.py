@@ -1,9 +1,11 @@
+from typing import Dict
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.entities.concept import Concept
 from app.repository.base_repository import BaseRepository
+from app.shared.helpers.statement_helper import normalize_description
 
 
 class ConceptRepository(BaseRepository[Concept]):
@@ -14,3 +16,13 @@ class ConceptRepository(BaseRepository[Concept]):
         """Validate that the user owns the concept."""
         concept = self.db.query(Concept).filter(Concept.id == concept_id).first()
         return bool(concept and concept.user_id == user_id)
+
+    def get_name_index(self, user_id: UUID) -> Dict[str, UUID]:
+        """Concept id by normalized name for user_id; first created wins on ties."""
+        rows = (
+            self.db.query(Concept.id, Concept.name)
+            .filter(Concept.user_id == user_id)
+            .order_by(Concept.created_at.desc())
+            .all()
+        )
+        return {normalize_description(row.name): row.id for row in rows}
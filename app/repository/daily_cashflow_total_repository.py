@@ -0,0 +1,221 @@
+"""
+Repository for daily_cashflow_totals (per-day cashflow rollup).
+
+Writes are incremental deltas applied in the same unit of work as the
+transaction write; reads return income and expense per day and currency for a
+date range, ready to be folded into period buckets.
+
+Methods never commit — the caller owns the transaction.
+"""
+
+import logging
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.entities.account import Account
+from app.entities.daily_cashflow_total import DailyCashflowTotal
+from app.entities.transaction import Transaction, TransactionType
+from app.repository.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+# (user_id, account_id, category_id, currency, day)
+CashflowKey = Tuple[UUID, UUID, UUID, Optional[str], date]
+
+
+class DailyCashflowTotalRepository(BaseRepository[DailyCashflowTotal]):
+    def __init__(self, db: Session) -> None:
+        super().__init__(db, DailyCashflowTotal)
+
+    def apply_deltas(self, deltas: Dict[CashflowKey, Tuple[Decimal, Decimal]]) -> None:
+        """
+        Add (income, expense_abs) deltas to their day rows, creating missing rows.
+
+        On Postgres/SQLite one INSERT ... ON CONFLICT DO UPDATE against the
+        unique key index upserts every key in sorted order, so concurrent first
+        writes to a day add to one row; other dialects UPDATE, then INSERT when
+        no row matched. Callers pre-aggregate, so a batch of writes costs one
+        row per touched day. Does NOT commit.
+        """
+        DCT = DailyCashflowTotal
+        rows = []
+        for key, (income, expense_abs) in sorted(
+            deltas.items(), key=lambda kv: str(kv[0])
+        ):
+            if not income and not expense_abs:
+                continue
+            user_id, account_id, category_id, currency, day = key
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "account_id": account_id,
+                    "category_id": category_id,
+                    "currency": currency,
+                    "day": day,
+                    "income": income,
+                    "expense_abs": expense_abs,
+                }
+            )
+        if not rows:
+            return
+        logger.debug(f"DB apply_deltas: DailyCashflowTotal keys={len(rows)}")
+        dialect = self.db.bind.dialect.name if self.db.bind else ""
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert(DCT)
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        DCT.account_id,
+                        DCT.category_id,
+                        DCT.day,
+                        func.coalesce(DCT.currency, literal_column("''")),
+                    ],
+                    set_={
+                        "income": DCT.income + stmt.excluded.income,
+                        "expense_abs": DCT.expense_abs + stmt.excluded.expense_abs,
+                    },
+                ),
+                rows,
+            )
+            return
+        for row in rows:
+            updated = (
+                self.db.query(DCT)
+                .filter(
+                    DCT.account_id == row["account_id"],
+                    DCT.category_id == row["category_id"],
+                    DCT.day == row["day"],
+                    DCT.currency.is_not_distinct_from(row["currency"]),
+                )
+                .update(
+                    {
+                        DCT.income: DCT.income + row["income"],
+                        DCT.expense_abs: DCT.expense_abs + row["expense_abs"],
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if not updated:
+                self.db.add(DCT(**row))
+        self.db.flush()
+
+    def get_cashflow_by_day(
+        self,
+        user_id: UUID,
+        date_from: date,
+        date_to: date,
+        *,
+        account_id: Optional[UUID] = None,
+        category_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Income and expense_abs per (day, currency) in [date_from, date_to],
+        excluding soft-deleted accounts. Ordered by day.
+        """
+        logger.debug(
+            f"DB get_cashflow_by_day: user_id={user_id} "
+            f"date_from={date_from} date_to={date_to}"
+        )
+        DCT = DailyCashflowTotal
+        query = (
+            self.db.query(
+                DCT.day,
+                DCT.currency,
+                func.coalesce(func.sum(DCT.income), 0).label("income"),
+                func.coalesce(func.sum(DCT.expense_abs), 0).label("expense_abs"),
+            )
+            .join(Account, DCT.account_id == Account.id)
+            .filter(
+                DCT.user_id == user_id,
+                DCT.day >= date_from,
+                DCT.day <= date_to,
+                Account.is_deleted == False,  # noqa: E712
+            )
+            .group_by(DCT.day, DCT.currency)
+            .order_by(DCT.day.asc())
+        )
+        if account_id is not None:
+            query = query.filter(DCT.account_id == account_id)
+        if category_id is not None:
+            query = query.filter(DCT.category_id == category_id)
+        if currency is not None:
+            query = query.filter(DCT.currency == currency)
+
+        return [
+            {
+                "day": r.day,
+                "currency": r.currency,
+                "income": Decimal(str(r.income)),
+                "expense_abs": Decimal(str(r.expense_abs)),
+            }
+            for r in query.all()
+        ]
+
+    def rebuild_for_categories(self, category_ids: Iterable[UUID]) -> int:
+        """
+        Recompute the rollup rows of the given categories from transactions.
+
+        Used after set-based rewrites that bypass TransactionService (category
+        migration). Returns rows written. Does NOT commit.
+        """
+        category_ids = list(set(category_ids))
+        if not category_ids:
+            return 0
+        logger.debug(f"DB rebuild_for_categories: category_ids={len(category_ids)}")
+        DCT = DailyCashflowTotal
+        self.db.query(DCT).filter(DCT.category_id.in_(category_ids)).delete(
+            synchronize_session=False
+        )
+
+        income_expr = case(
+            (Transaction.type == TransactionType.INCOME.value, Transaction.amount),
+            else_=0,
+        )
+        expense_expr = case(
+            (Transaction.type == TransactionType.EXPENSE.value, Transaction.amount),
+            else_=0,
+        )
+        rows = (
+            self.db.query(
+                Transaction.user_id,
+                Transaction.account_id,
+                Transaction.category_id,
+                Transaction.currency,
+                Transaction.date,
+                func.sum(income_expr).label("income"),
+                func.sum(expense_expr).label("expense_abs"),
+            )
+            .filter(Transaction.category_id.in_(category_ids))
+            .group_by(
+                Transaction.user_id,
+                Transaction.account_id,
+                Transaction.category_id,
+                Transaction.currency,
+                Transaction.date,
+            )
+            .all()
+        )
+        for row in rows:
+            self.db.add(
+                DCT(
+                    user_id=row.user_id,
+                    account_id=row.account_id,
+                    category_id=row.category_id,
+                    currency=row.currency,
+                    day=row.date,
+                    income=Decimal(str(row.income or 0)),
+                    expense_abs=Decimal(str(row.expense_abs or 0)),
+                )
+            )
+        self.db.flush()
+        return len(rows)
@@ -0,0 +1,126 @@
+"""
+Repository for fx_rates (historical exchange rates).
+
+Lookups use the latest rate on or before a date via the (base, quote, rate_date)
+unique index. All methods are set-based; never call inside loops over dates.
+Methods never commit — the caller owns the transaction.
+"""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.entities.fx_rate import FxRate
+from app.repository.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+Pair = Tuple[str, str]
+
+
+class FxRateRepository(BaseRepository[FxRate]):
+    def __init__(self, db: Session) -> None:
+        super().__init__(db, FxRate)
+
+    @staticmethod
+    def _pairs_filter(pairs: Iterable[Pair]):
+        return or_(*(and_(FxRate.base == b, FxRate.quote == q) for b, q in pairs))
+
+    def get_rate_as_of(self, base: str, quote: str, as_of: date) -> Optional[Decimal]:
+        """Latest rate for base->quote with rate_date <= as_of, or None."""
+        logger.debug(f"DB get_rate_as_of: FxRate {base}->{quote} as_of={as_of}")
+        row = (
+            self.db.query(FxRate.rate)
+            .filter(
+                FxRate.base == base,
+                FxRate.quote == quote,
+                FxRate.rate_date <= as_of,
+            )
+            .order_by(FxRate.rate_date.desc())
+            .first()
+        )
+        return Decimal(str(row.rate)) if row else None
+
+    def get_rate_series(
+        self, pairs: List[Pair], from_date: date, to_date: date
+    ) -> Dict[Pair, List[Tuple[date, Decimal]]]:
+        """
+        Rates per pair needed to answer any as_of in [from_date, to_date].
+
+        Includes the latest rate on or before from_date (the carry-in) plus every
+        rate up to to_date, ascending by date. Two queries regardless of range.
+        """
+        if not pairs:
+            return {}
+        logger.debug(
+            f"DB get_rate_series: FxRate pairs={len(pairs)} "
+            f"from={from_date} to={to_date}"
+        )
+        anchors = (
+            self.db.query(
+                FxRate.base, FxRate.quote, func.max(FxRate.rate_date).label("anchor")
+            )
+            .filter(self._pairs_filter(pairs), FxRate.rate_date <= from_date)
+            .group_by(FxRate.base, FxRate.quote)
+            .all()
+        )
+        lower_bounds = {(r.base, r.quote): r.anchor for r in anchors}
+        rows = (
+            self.db.query(FxRate.base, FxRate.quote, FxRate.rate_date, FxRate.rate)
+            .filter(
+                or_(
+                    *(
+                        and_(
+                            FxRate.base == b,
+                            FxRate.quote == q,
+                            FxRate.rate_date >= lower_bounds.get((b, q), from_date),
+                        )
+                        for b, q in pairs
+                    )
+                ),
+                FxRate.rate_date <= to_date,
+            )
+            .order_by(FxRate.base, FxRate.quote, FxRate.rate_date)
+            .all()
+        )
+        series: Dict[Pair, List[Tuple[date, Decimal]]] = {p: [] for p in pairs}
+        for r in rows:
+            series[(r.base, r.quote)].append((r.rate_date, Decimal(str(r.rate))))
+        return series
+
+    def upsert_many(self, rates: List[Tuple[str, str, date, Decimal]]) -> int:
+        """
+        Insert or overwrite (base, quote, rate_date) rows in bulk.
+
+        One query loads the existing rows for the incoming pairs and date range;
+        returns the number of rows written. Does NOT commit.
+        """
+        if not rates:
+            return 0
+        logger.debug(f"DB upsert_many: FxRate count={len(rates)}")
+        pairs = {(b, q) for b, q, _, _ in rates}
+        dates = [d for _, _, d, _ in rates]
+        existing = {
+            (r.base, r.quote, r.rate_date): r
+            for r in self.db.query(FxRate)
+            .filter(
+                self._pairs_filter(pairs),
+                FxRate.rate_date >= min(dates),
+                FxRate.rate_date <= max(dates),
+            )
+            .all()
+        }
+        for base, quote, rate_date, rate in rates:
+            row = existing.get((base, quote, rate_date))
+            if row is None:
+                row = FxRate(base=base, quote=quote, rate_date=rate_date, rate=rate)
+                self.db.add(row)
+                existing[(base, quote, rate_date)] = row
+            else:
+                row.rate = rate
+        self.db.flush()
+        return len(rates)
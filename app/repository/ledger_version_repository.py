@@ -0,0 +1,77 @@
+"""
+Repository for ledger_versions (per-user write counters for conditional GETs).
+
+ORM writes on tracked sessions bump versions automatically (see
+app/entities/ledger_version.py); set-based writes that bypass the flush call
+bump_users / bump_fx_rates in the same unit of work, which are no-ops on
+untracked sessions.
+
+Methods never commit — the caller owns the transaction.
+"""
+
+import logging
+from typing import Iterable, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.entities.ledger_version import (
+    EPOCH_SCOPE,
+    FX_RATES_SCOPE,
+    LedgerVersion,
+    bump_versions,
+    user_scope,
+    versions_tracked,
+)
+from app.repository.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerVersionRepository(BaseRepository[LedgerVersion]):
+    def __init__(self, db: Session) -> None:
+        super().__init__(db, LedgerVersion)
+
+    def get_ledger_version(self, user_id: UUID) -> Tuple[int, int, int]:
+        """
+        (user version, FX rates version, epoch): one primary-key lookup.
+
+        The user counter moves on every write to the user's transactions,
+        accounts, categories, concepts, tags and tag links; the FX counter on
+        every rate load; the epoch on every startup with counting on. Callers
+        hash the result into an ETag.
+        """
+        logger.debug(f"DB get_ledger_version: user_id={user_id}")
+        scope = user_scope(user_id)
+        rows = dict(
+            self.db.query(LedgerVersion.scope, LedgerVersion.version)
+            .filter(LedgerVersion.scope.in_([scope, FX_RATES_SCOPE, EPOCH_SCOPE]))
+            .all()
+        )
+        return (
+            int(rows.get(scope, 0)),
+            int(rows.get(FX_RATES_SCOPE, 0)),
+            int(rows.get(EPOCH_SCOPE, 0)),
+        )
+
+    def bump_users(self, user_ids: Iterable[UUID]) -> None:
+        """Bump the version of each user on a tracked session. Does NOT commit."""
+        scopes = {user_scope(user_id) for user_id in user_ids if user_id}
+        if scopes and versions_tracked(self.db):
+            logger.debug(f"DB bump_users: LedgerVersion users={len(scopes)}")
+            bump_versions(self.db.connection(), scopes)
+
+    def bump_fx_rates(self) -> None:
+        """Bump the FX rates version on a tracked session. Does NOT commit."""
+        if versions_tracked(self.db):
+            bump_versions(self.db.connection(), [FX_RATES_SCOPE])
+
+    def bump_epoch(self) -> None:
+        """
+        Bump the epoch so every outstanding ETag stops matching. Does NOT commit.
+
+        Writes made while counting was off never moved the counters; run once
+        per startup with counting on.
+        """
+        logger.debug("DB bump_epoch: LedgerVersion")
+        bump_versions(self.db.connection(), [EPOCH_SCOPE])
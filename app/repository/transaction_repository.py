@@ -1,39 +1,64 @@
 import logging
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy import Date as SQLDate
-from sqlalchemy import Integer, case, cast, func, literal
+from sqlalchemy import (
+    Integer,
+    and_,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, selectinload
 
 from app.entities.account import Account
+from app.entities.balance_snapshot import BalanceSnapshot
+from app.entities.category import Category
+from app.entities.concept import Concept
 from app.entities.tag import Tag
 from app.entities.transaction import Transaction, TransactionType
 from app.entities.transaction_tag import TransactionTag
-from app.repository.base_repository import BaseRepository
+from app.repository.base_repository import AsyncBaseRepository, BaseRepository
+from app.repository.ledger_version_repository import LedgerVersionRepository
 from app.schemas.reporting_schemas import (
     CategoryAggregationData,
+    CategoryCashflowData,
     TransactionSummaryPeriod,
 )
 from app.schemas.transaction_schemas import TransactionSearch
+from app.shared.helpers.cursor_helper import TransactionCursor
 from app.shared.helpers.date_helper import calculate_period_dates
 
 logger = logging.getLogger(__name__)
 
+# Row kinds of get_balance_history_inputs' UNION ALL
+_HISTORY_OPENING = 0
+_HISTORY_SNAPSHOT = 1
+_HISTORY_RANGE = 2
+
+# Windows per inline UNION ALL table: SQLite caps a compound SELECT at 500 terms
+# (SQLITE_MAX_COMPOUND_SELECT) and older builds at 999 bound parameters.
+_WINDOWS_PER_QUERY = 200
+
 
 class TransactionRepository(BaseRepository[Transaction]):
     def __init__(self, db: Session):
         super().__init__(db, Transaction)
 
-    def search(
-        self, user_id: UUID, search_params: TransactionSearch
-    ) -> List[Transaction]:
-        """Search transactions based on various criteria"""
-        logger.debug(f"DB search: Transaction user_id={user_id}")
+    def _build_search_query(self, user_id: UUID, search_params: TransactionSearch):
+        """Base search query: ownership, visible accounts, period and field filters."""
         query = (
             self.db.query(Transaction)
             .options(
@@ -49,7 +74,10 @@ class TransactionRepository(BaseRepository[Transaction]):
                 Transaction.user_id == user_id, Account.is_deleted == False
             )  # noqa: E712
         )
+        return self._apply_search_filters(query, search_params)
 
+    def _apply_search_filters(self, query, search_params: TransactionSearch):
+        """Apply the period-derived range and TransactionSearch.build_filters()."""
         # Optional period filter (mutually exclusive with custom date range, validated in schema)
         if getattr(search_params, "period", None) is not None:
             date_from, date_to = calculate_period_dates(search_params.period)
@@ -60,6 +88,15 @@ class TransactionRepository(BaseRepository[Transaction]):
         for filter_condition in search_params.build_filters():
             query = query.filter(filter_condition)
 
+        return query
+
+    def search(
+        self, user_id: UUID, search_params: TransactionSearch
+    ) -> List[Transaction]:
+        """Search transactions based on various criteria"""
+        logger.debug(f"DB search: Transaction user_id={user_id}")
+        query = self._build_search_query(user_id, search_params)
+
         # Order by date descending (most recent first)
         query = query.order_by(
             Transaction.date.desc(),
@@ -69,6 +106,117 @@ class TransactionRepository(BaseRepository[Transaction]):
 
         return query.all()
 
+    def search_page(
+        self,
+        user_id: UUID,
+        search_params: TransactionSearch,
+        limit: int,
+        after: Optional[TransactionCursor] = None,
+    ) -> tuple[List[Transaction], bool]:
+        """
+        Keyset page of search results, strictly after the `after` position.
+
+        Ordering is date DESC, created_at DESC, id DESC with NULLS LAST so that it
+        matches ix_transactions_user_date_created_id; each page is an index range
+        scan of `limit + 1` rows regardless of depth. Returns (rows, has_more).
+        """
+        logger.debug(
+            f"DB search_page: Transaction user_id={user_id} limit={limit} "
+            f"after={'yes' if after else 'no'}"
+        )
+        query = self._build_search_query(user_id, search_params)
+
+        if after is not None:
+            same_date = Transaction.date == after.date
+            if after.created_at is None:
+                # NULL created_at sorts last within a date: only NULL rows with a
+                # lower id remain on this date.
+                query = query.filter(
+                    or_(
+                        Transaction.date < after.date,
+                        and_(
+                            same_date,
+                            Transaction.created_at.is_(None),
+                            Transaction.id < after.id,
+                        ),
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        Transaction.date < after.date,
+                        and_(
+                            same_date,
+                            or_(
+                                Transaction.created_at < after.created_at,
+                                Transaction.created_at.is_(None),
+                            ),
+                        ),
+                        and_(
+                            same_date,
+                            Transaction.created_at == after.created_at,
+                            Transaction.id < after.id,
+                        ),
+                    )
+                )
+
+        rows = (
+            query.order_by(
+                Transaction.date.desc().nulls_last(),
+                Transaction.created_at.desc().nulls_last(),
+                Transaction.id.desc(),
+            )
+            .limit(limit + 1)
+            .all()
+        )
+        return rows[:limit], len(rows) > limit
+
+    def iter_export_rows(
+        self,
+        user_id: UUID,
+        search_params: TransactionSearch,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        """
+        Stream search results as flat column rows (no ORM entities, no relationship loads).
+
+        Uses the same filters and ordering as search(). Rows are fetched through a
+        server-side cursor (yield_per) so memory stays bounded by batch_size.
+        """
+        logger.debug(
+            f"DB iter_export_rows: Transaction user_id={user_id} batch_size={batch_size}"
+        )
+        query = (
+            self.db.query(
+                Transaction.id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.amount,
+                Transaction.currency,
+                Transaction.account_id,
+                Account.name.label("account_name"),
+                Transaction.category_id,
+                Category.name.label("category_name"),
+                Concept.name.label("concept_name"),
+                Transaction.transfer_id,
+                Transaction.source,
+                Transaction.created_at,
+                Account.currency.label("account_currency"),
+            )
+            .join(Account, Transaction.account_id == Account.id)
+            .outerjoin(Category, Transaction.category_id == Category.id)
+            .outerjoin(Concept, Transaction.concept_id == Concept.id)
+            .filter(
+                Transaction.user_id == user_id, Account.is_deleted == False
+            )  # noqa: E712
+        )
+        query = self._apply_search_filters(query, search_params).order_by(
+            Transaction.date.desc(),
+            Transaction.created_at.desc(),
+            Transaction.id.desc(),
+        )
+        yield from query.execution_options(yield_per=batch_size)
+
     def search_recent(self, user_id: UUID, limit: int) -> List[Transaction]:
         """Return most recent transactions for a user with a fixed limit."""
         logger.debug(f"DB search_recent: Transaction user_id={user_id} limit={limit}")
@@ -130,6 +278,46 @@ class TransactionRepository(BaseRepository[Transaction]):
                 status_code=500, detail="Error linking tags to transaction"
             ) from exc
 
+    def insert_many(self, rows: List[dict], tag_links: List[dict]) -> int:
+        """
+        Bulk INSERT transactions and their transaction_tags links (executemany).
+
+        Rows are plain column dicts with ids already assigned; mapper and flush
+        events do not run, so callers set derived columns such as amount_minor and
+        the owners' ledger versions are bumped here. Does NOT commit.
+        """
+        if not rows:
+            return 0
+        logger.debug(
+            f"DB insert_many: Transaction count={len(rows)} tag_links={len(tag_links)}"
+        )
+        self.db.execute(insert(Transaction), rows)
+        if tag_links:
+            self.db.execute(insert(TransactionTag), tag_links)
+        LedgerVersionRepository(self.db).bump_users({row["user_id"] for row in rows})
+        return len(rows)
+
+    def get_existing_import_hashes(
+        self, account_id: UUID, hashes: Iterable[str]
+    ) -> Set[str]:
+        """Subset of hashes already imported into account_id (one IN query)."""
+        hashes = set(hashes)
+        if not hashes:
+            return set()
+        logger.debug(
+            f"DB get_existing_import_hashes: account_id={account_id} "
+            f"hashes={len(hashes)}"
+        )
+        rows = (
+            self.db.query(Transaction.import_hash)
+            .filter(
+                Transaction.account_id == account_id,
+                Transaction.import_hash.in_(hashes),
+            )
+            .all()
+        )
+        return {row.import_hash for row in rows}
+
     def get_by_transfer_id(self, transfer_id: UUID) -> List[Transaction]:
         """Return both transactions that share the given transfer_id."""
         return (
@@ -263,6 +451,57 @@ class TransactionRepository(BaseRepository[Transaction]):
             for category_id, net_amount, count in results
         }
 
+    def get_cashflow_by_category(
+        self,
+        user_id: UUID,
+        date_from: date,
+        date_to: date,
+    ) -> Dict[UUID, CategoryCashflowData]:
+        """
+        Income, expense and transaction count per category in one grouped scan.
+
+        Summing the rows gives the cashflow summary and income - expense per row
+        gives the category summary, so the dashboard reads the range once for both.
+        Categories without transactions are absent.
+        """
+        logger.debug(
+            f"DB get_cashflow_by_category: user_id={user_id} "
+            f"date_from={date_from} date_to={date_to}"
+        )
+        income_expr = case(
+            (Transaction.type == TransactionType.INCOME.value, Transaction.amount),
+            else_=0,
+        )
+        expense_expr = case(
+            (Transaction.type == TransactionType.EXPENSE.value, Transaction.amount),
+            else_=0,
+        )
+        rows = (
+            self.db.query(
+                Transaction.category_id,
+                func.coalesce(func.sum(income_expr), 0).label("income"),
+                func.coalesce(func.sum(expense_expr), 0).label("expense"),
+                func.count(Transaction.id).label("count"),
+            )
+            .join(Account, Transaction.account_id == Account.id)
+            .filter(
+                Transaction.user_id == user_id,
+                Transaction.date >= date_from,
+                Transaction.date <= date_to,
+                Account.is_deleted == False,  # noqa: E712
+            )
+            .group_by(Transaction.category_id)
+            .all()
+        )
+        return {
+            row.category_id: CategoryCashflowData(
+                income=Decimal(str(row.income)),
+                expense=Decimal(str(row.expense)),
+                transaction_count=int(row.count),
+            )
+            for row in rows
+        }
+
     def get_cashflow_summary(
         self,
         user_id: UUID,
@@ -327,6 +566,90 @@ class TransactionRepository(BaseRepository[Transaction]):
         total = income - expense
         return (income, expense, total)
 
+    def get_cashflow_summaries(
+        self,
+        user_id: UUID,
+        ranges: List[Tuple[date, date]],
+        category_ids: Optional[List[UUID]] = None,
+        *,
+        account_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        amount_min: Optional[Decimal] = None,
+        amount_max: Optional[Decimal] = None,
+        source: Optional[str] = None,
+    ) -> List[Tuple[Decimal, Decimal, Decimal]]:
+        """
+        Get (income, expense, total) for each inclusive date range in one scan.
+
+        Rows in [min start, max end] are read once and split per range with
+        conditional aggregation (SUM(CASE WHEN date BETWEEN ...)), so comparing
+        N periods costs one query instead of N. Filters match get_cashflow_summary.
+        Results are returned in the order of `ranges`.
+        """
+        if not ranges:
+            return []
+        scan_from = min(start for start, _ in ranges)
+        scan_to = max(end for _, end in ranges)
+        logger.debug(
+            f"DB get_cashflow_summaries: user_id={user_id} ranges={len(ranges)} "
+            f"date_from={scan_from} date_to={scan_to}"
+        )
+        is_income = Transaction.type == TransactionType.INCOME.value
+        is_expense = Transaction.type == TransactionType.EXPENSE.value
+        columns = []
+        for index, (start, end) in enumerate(ranges):
+            in_range = Transaction.date.between(start, end)
+            columns.append(
+                func.coalesce(
+                    func.sum(
+                        case((and_(in_range, is_income), Transaction.amount), else_=0)
+                    ),
+                    0,
+                ).label(f"income_{index}")
+            )
+            columns.append(
+                func.coalesce(
+                    func.sum(
+                        case((and_(in_range, is_expense), Transaction.amount), else_=0)
+                    ),
+                    0,
+                ).label(f"expense_{index}")
+            )
+
+        query = (
+            self.db.query(*columns)
+            .join(Account, Transaction.account_id == Account.id)
+            .filter(
+                Transaction.user_id == user_id,
+                Transaction.date >= scan_from,
+                Transaction.date <= scan_to,
+                Account.is_deleted == False,  # noqa: E712
+            )
+        )
+
+        if category_ids is not None:
+            query = query.filter(Transaction.category_id.in_(category_ids))
+        if account_id is not None:
+            query = query.filter(Transaction.account_id == account_id)
+        if currency is not None:
+            query = query.filter(Transaction.currency == currency)
+        if amount_min is not None:
+            query = query.filter(Transaction.amount >= amount_min)
+        if amount_max is not None:
+            query = query.filter(Transaction.amount <= amount_max)
+        if source is not None:
+            query = query.filter(Transaction.source == source)
+
+        row = query.first()
+        summaries: List[Tuple[Decimal, Decimal, Decimal]] = []
+        for index in range(len(ranges)):
+            raw_income = row[2 * index] if row else None
+            raw_expense = row[2 * index + 1] if row else None
+            income = Decimal(str(raw_income)) if raw_income else Decimal("0")
+            expense = Decimal(str(raw_expense)) if raw_expense else Decimal("0")
+            summaries.append((income, expense, income - expense))
+        return summaries
+
     def _build_period_start_expr(self, period: TransactionSummaryPeriod):
         """Build DB-specific period bucket expression."""
         dialect = self.db.bind.dialect.name if self.db.bind else ""
@@ -437,73 +760,199 @@ class TransactionRepository(BaseRepository[Transaction]):
             for r in rows
         ]
 
-    def get_transactions_for_accounts_until_date(
-        self, account_ids: List[UUID], to_date_inclusive: date
-    ) -> List[tuple]:
+    def _build_windows_table(self, windows: List[tuple]):
+        """Inline (window_id, account_id, from_date, to_date) table as a subquery."""
+        dialect = self.db.bind.dialect.name if self.db.bind else ""
+        account_id_type = Transaction.__table__.c.account_id.type
+        date_type = Transaction.__table__.c.date.type
+
+        def bound(value, type_):
+            # Postgres cannot infer parameter types inside UNION ALL; SQLite has
+            # no DATE/UUID storage classes, so casting there would corrupt values.
+            param = literal(value, type_)
+            return param if dialect == "sqlite" else cast(param, type_)
+
+        window_rows = [
+            select(
+                literal(idx, Integer).label("window_id"),
+                bound(account_id, account_id_type).label("account_id"),
+                bound(from_date, date_type).label("from_date"),
+                bound(to_date, date_type).label("to_date"),
+            )
+            for idx, (account_id, from_date, to_date) in enumerate(windows)
+        ]
+        return union_all(*window_rows).subquery("windows")
+
+    @staticmethod
+    def _net_signed_amount(minor_units: bool = False):
+        """income adds, expense subtracts; over amount_minor in minor-units mode."""
+        amount = Transaction.amount_minor if minor_units else Transaction.amount
+        return case(
+            (Transaction.type == TransactionType.INCOME.value, amount),
+            else_=-amount,
+        )
+
+    @staticmethod
+    def _to_amount(value, minor_units: bool = False) -> Union[Decimal, int]:
+        if minor_units:
+            return int(value) if value is not None else 0
+        return Decimal(str(value)) if value is not None else Decimal("0")
+
+    def get_net_signed_sums_for_windows(
+        self, windows: List[tuple], *, minor_units: bool = False
+    ) -> List[Union[Decimal, int]]:
         """
-        Get all transactions for given accounts with date <= to_date_inclusive.
-        Returns list of (account_id, transaction_date, signed_amount).
-        signed_amount: income=+amount, expense=-amount.
+        Net-signed sums for many (account_id, from_date, to_date) windows in one query.
+
+        from_date may be None for an unbounded lower edge; both bounds are inclusive.
+        Windows are joined to transactions as an inline table, so only rows inside
+        a window are read and aggregated in SQL; one query per _WINDOWS_PER_QUERY
+        windows. Returns one sum per window, in order (zero for windows without
+        transactions). With minor_units, sums are ints of amount_minor.
         """
-        if not account_ids:
+        if not windows:
             return []
-        logger.debug(
-            f"DB get_transactions_for_accounts_until_date: account_ids={len(account_ids)} "
-            f"to_date={to_date_inclusive}"
-        )
-        net_amount = case(
-            (Transaction.type == TransactionType.INCOME.value, Transaction.amount),
-            else_=-Transaction.amount,
-        )
-        rows = (
+        logger.debug(f"DB get_net_signed_sums_for_windows: windows={len(windows)}")
+        sums = [self._to_amount(None, minor_units)] * len(windows)
+        for offset in range(0, len(windows), _WINDOWS_PER_QUERY):
+            batch = windows[offset : offset + _WINDOWS_PER_QUERY]
+            for window_id, net in self._net_signed_sums_batch(batch, minor_units):
+                sums[offset + window_id] = self._to_amount(net, minor_units)
+        return sums
+
+    def _net_signed_sums_batch(
+        self, windows: List[tuple], minor_units: bool
+    ) -> List[tuple]:
+        """(window_id, net) for one batch of windows; window_id indexes the batch."""
+        bounds = self._build_windows_table(windows)
+        net_amount = self._net_signed_amount(minor_units)
+        return (
             self.db.query(
-                Transaction.account_id,
-                Transaction.date,
-                net_amount.label("signed_amount"),
+                bounds.c.window_id,
+                func.sum(net_amount).label("net"),
             )
-            .filter(
-                Transaction.account_id.in_(account_ids),
-                Transaction.date <= to_date_inclusive,
+            .join(
+                Transaction,
+                and_(
+                    Transaction.account_id == bounds.c.account_id,
+                    or_(
+                        bounds.c.from_date.is_(None),
+                        Transaction.date >= bounds.c.from_date,
+                    ),
+                    Transaction.date <= bounds.c.to_date,
+                ),
             )
+            .group_by(bounds.c.window_id)
             .all()
         )
-        return [(r.account_id, r.date, Decimal(str(r.signed_amount))) for r in rows]
 
-    def get_transactions_for_accounts_in_range(
+    def get_balance_history_inputs(
         self,
         account_ids: List[UUID],
         from_date: date,
         to_date: date,
-    ) -> List[tuple]:
+        *,
+        minor_units: bool = False,
+    ) -> Tuple[Dict[UUID, Tuple[date, Decimal]], Dict[UUID, Decimal], List[tuple]]:
         """
-        Get transactions for accounts in [from_date, to_date] inclusive.
-        Returns list of (account_id, transaction_date, signed_amount).
+        Everything balance history needs after the accounts, in one round trip.
+
+        Returns:
+        - latest snapshot per account with snapshot_date <= from_date, as
+          {account_id: (snapshot_date, balance)};
+        - net-signed sum per account from that snapshot's date (or the beginning,
+          without one) up to the day before from_date;
+        - (account_id, date, signed_amount) for every transaction in
+          [from_date, to_date].
+
+        The three parts share a latest-snapshot CTE and come back as one
+        UNION ALL, so latency is one query rather than three. With minor_units,
+        sums and signed amounts are ints of amount_minor (snapshots stay Decimal).
         """
         if not account_ids:
-            return []
+            return {}, {}, []
         logger.debug(
-            f"DB get_transactions_for_accounts_in_range: account_ids={len(account_ids)} "
+            f"DB get_balance_history_inputs: account_ids={len(account_ids)} "
             f"from={from_date} to={to_date}"
         )
-        net_amount = case(
-            (Transaction.type == TransactionType.INCOME.value, Transaction.amount),
-            else_=-Transaction.amount,
+        net_amount = self._net_signed_amount(minor_units)
+        latest = (
+            select(
+                BalanceSnapshot.account_id,
+                func.max(BalanceSnapshot.snapshot_date).label("snapshot_date"),
+            )
+            .where(
+                BalanceSnapshot.account_id.in_(account_ids),
+                BalanceSnapshot.snapshot_date <= from_date,
+            )
+            .group_by(BalanceSnapshot.account_id)
+            .cte("latest_snapshot")
         )
-        rows = (
-            self.db.query(
+        snapshot = (
+            select(
+                BalanceSnapshot.account_id,
+                BalanceSnapshot.snapshot_date,
+                BalanceSnapshot.balance,
+            )
+            .join(
+                latest,
+                and_(
+                    BalanceSnapshot.account_id == latest.c.account_id,
+                    BalanceSnapshot.snapshot_date == latest.c.snapshot_date,
+                ),
+            )
+            .cte("snapshot")
+        )
+        opening = (
+            select(
+                literal(_HISTORY_OPENING, Integer).label("part"),
                 Transaction.account_id,
-                Transaction.date,
-                net_amount.label("signed_amount"),
+                cast(null(), Transaction.__table__.c.date.type).label("date"),
+                func.sum(net_amount).label("amount"),
             )
-            .filter(
+            .select_from(Transaction)
+            .outerjoin(snapshot, snapshot.c.account_id == Transaction.account_id)
+            .where(
                 Transaction.account_id.in_(account_ids),
-                Transaction.date >= from_date,
-                Transaction.date <= to_date,
+                Transaction.date < from_date,
+                or_(
+                    snapshot.c.snapshot_date.is_(None),
+                    Transaction.date >= snapshot.c.snapshot_date,
+                ),
             )
-            .order_by(Transaction.date)
-            .all()
+            .group_by(Transaction.account_id)
+        )
+        snapshots = select(
+            literal(_HISTORY_SNAPSHOT, Integer),
+            snapshot.c.account_id,
+            snapshot.c.snapshot_date,
+            snapshot.c.balance,
+        )
+        in_range = select(
+            literal(_HISTORY_RANGE, Integer),
+            Transaction.account_id,
+            Transaction.date,
+            net_amount,
+        ).where(
+            Transaction.account_id.in_(account_ids),
+            Transaction.date >= from_date,
+            Transaction.date <= to_date,
         )
-        return [(r.account_id, r.date, Decimal(str(r.signed_amount))) for r in rows]
+        rows = self.db.execute(union_all(opening, snapshots, in_range)).all()
+
+        snapshot_by_account: Dict[UUID, Tuple[date, Decimal]] = {}
+        opening_sums: Dict[UUID, Decimal] = {}
+        tx_rows: List[tuple] = []
+        for part, account_id, row_date, amount in rows:
+            if part == _HISTORY_OPENING:
+                opening_sums[account_id] = self._to_amount(amount, minor_units)
+            elif part == _HISTORY_SNAPSHOT:
+                snapshot_by_account[account_id] = (row_date, self._to_amount(amount))
+            else:
+                tx_rows.append(
+                    (account_id, row_date, self._to_amount(amount, minor_units))
+                )
+        return snapshot_by_account, opening_sums, tx_rows
 
     def get_net_signed_sum_for_account(
         self, account_id: UUID, date_from: date, date_to: date
@@ -532,3 +981,32 @@ class TransactionRepository(BaseRepository[Transaction]):
             .first()
         )
         return Decimal(str(row.net)) if row and row.net is not None else Decimal("0")
+
+
+class AsyncTransactionRepository(AsyncBaseRepository[TransactionRepository]):
+    """Async reads used by the async balance path (see AsyncBaseRepository)."""
+
+    repository_class = TransactionRepository
+
+    async def get_net_signed_sums_for_windows(
+        self, windows: List[tuple], *, minor_units: bool = False
+    ) -> List[Union[Decimal, int]]:
+        return await self.run(
+            lambda repo: repo.get_net_signed_sums_for_windows(
+                windows, minor_units=minor_units
+            )
+        )
+
+    async def get_balance_history_inputs(
+        self,
+        account_ids: List[UUID],
+        from_date: date,
+        to_date: date,
+        *,
+        minor_units: bool = False,
+    ) -> Tuple[Dict[UUID, Tuple[date, Decimal]], Dict[UUID, Decimal], List[tuple]]:
+        return await self.run(
+            lambda repo: repo.get_balance_history_inputs(
+                account_ids, from_date, to_date, minor_units=minor_units
+            )
+        )
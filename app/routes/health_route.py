@@ -0,0 +1,21 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from app.config.database import get_pool_status
+from app.config.settings import get_settings
+
+router = APIRouter()
+
+
+@router.get("/db-pool")
+def get_db_pool_status() -> Dict[str, Any]:
+    """
+    Connection pool telemetry for sizing workers against real concurrency.
+
+    Reports pool size, checked-in/checked-out connections, overflow in use and
+    checkout wait times since startup. Returns 404 unless DB_POOL_METRICS_ENABLED.
+    """
+    if not get_settings().DB_POOL_METRICS_ENABLED:
+        raise HTTPException(status_code=404)
+    return get_pool_status()
@@ -1,13 +1,34 @@
 from datetime import date
-from typing import List, Optional, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
 
+from app.dependencies.etag_dependencies import get_ledger_etag
+from app.dependencies.reporting_cache_dependencies import get_reporting_cache
 from app.dependencies.reporting_dependencies import get_reporting_service
 from app.dependencies.user_dependencies import get_current_user, get_user_base_currency
 from app.entities.user import User
 from app.schemas.base_schemas import SearchResponse
+from app.schemas.dashboard_schemas import (
+    BALANCE_WIDGETS,
+    DashboardParameters,
+    DashboardResponse,
+    DashboardWidget,
+)
 from app.schemas.reporting_schemas import (
     BalanceAccountsResponse,
     BalanceHistoryResponse,
@@ -21,10 +42,64 @@ from app.schemas.reporting_schemas import (
     ReportingParameters,
     TransactionSummaryPeriod,
 )
+from app.services.reporting_cache_service import ReportingCacheService
 from app.services.reporting_service import ReportingService
+from app.shared.helpers.etag_helper import apply_etag
 
 router = APIRouter()
 
+M = TypeVar("M", bound=BaseModel)
+
+
+def _cached(
+    cache: Optional[ReportingCacheService],
+    current_user: User,
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: Type[M],
+    compute: Callable[[], M],
+) -> M:
+    """Serve a reporting response through the per-user cache when it is enabled."""
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(
+        cast(UUID, current_user.id),
+        endpoint,
+        _cache_params(current_user, params),
+        response_type,
+        compute,
+    )
+
+
+async def _cached_async(
+    cache: Optional[ReportingCacheService],
+    current_user: User,
+    endpoint: str,
+    params: Dict[str, Any],
+    response_type: Type[M],
+    compute: Callable[[], Awaitable[M]],
+) -> M:
+    """_cached for async handlers."""
+    if cache is None:
+        return await compute()
+    return await cache.aget_or_compute(
+        cast(UUID, current_user.id),
+        endpoint,
+        _cache_params(current_user, params),
+        response_type,
+        compute,
+    )
+
+
+def _cache_params(current_user: User, params: Dict[str, Any]) -> Dict[str, Any]:
+    # Relative periods and default as_of resolve against today; the base currency
+    # drives conversions. Both are part of the key.
+    return {
+        **params,
+        "base_currency": current_user.currency,
+        "today": date.today().isoformat(),
+    }
+
 
 @router.get(
     "/categories-summary", response_model=SearchResponse[CategorySummaryResponse]
@@ -33,6 +108,7 @@ def get_categories_summary(
     parameters: ReportingParameters = Depends(),
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
 ) -> SearchResponse[CategorySummaryResponse]:
     """
     Get categories with their transaction amounts for a specified period or date range.
@@ -61,24 +137,52 @@ def get_categories_summary(
     (income adds, expense subtracts) for the specified period.
     """
     user_id = cast(UUID, current_user.id)
-    return service.get_categories_summary(user_id=user_id, parameters=parameters)
+    return _cached(
+        cache,
+        current_user,
+        "categories-summary",
+        parameters.model_dump(mode="json"),
+        SearchResponse[CategorySummaryResponse],
+        lambda: service.get_categories_summary(user_id=user_id, parameters=parameters),
+    )
 
 
-@router.get("/cashflow-summary", response_model=CashflowSummaryResponse)
+@router.get(
+    "/cashflow-summary",
+    response_model=CashflowSummaryResponse,
+    responses={304: {"description": "Not modified (If-None-Match matched)"}},
+)
 def get_cashflow_summary(
+    request: Request,
+    response: Response,
     parameters: ReportingParameters = Depends(),
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
-) -> CashflowSummaryResponse:
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    etag: Optional[str] = Depends(get_ledger_etag),
+) -> Union[CashflowSummaryResponse, Response]:
     """
     Get income, expense, and total (net cashflow) for a period or date range.
 
     Reuses the same query parameters as categories-summary:
     - `period` or `date_from`/`date_to`
     - `type`, `category_id`, `account_id`, `currency`, `amount_min`, `amount_max`, `source`
+
+    With LEDGER_ETAG_ENABLED, returns an `ETag`; send it back as `If-None-Match`
+    to get a 304 when nothing changed.
     """
+    not_modified = apply_etag(request, response, etag)
+    if not_modified:
+        return not_modified
     user_id = cast(UUID, current_user.id)
-    return service.get_cashflow_summary(user_id=user_id, parameters=parameters)
+    return _cached(
+        cache,
+        current_user,
+        "cashflow-summary",
+        parameters.model_dump(mode="json"),
+        CashflowSummaryResponse,
+        lambda: service.get_cashflow_summary(user_id=user_id, parameters=parameters),
+    )
 
 
 @router.get("/period-comparison", response_model=PeriodComparisonResponse)
@@ -86,6 +190,7 @@ def get_period_comparison(
     parameters: PeriodComparisonParameters = Depends(),
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
 ) -> PeriodComparisonResponse:
     """
     Compare financial performance of current period vs previous equivalent period.
@@ -93,9 +198,20 @@ def get_period_comparison(
     Use either `period` (week|month|year) for predefined periods, or `date_from` and
     `date_to` for a custom range. Optional filters: account_id, category_id, currency,
     amount_min, amount_max, source.
+
+    With `period`, pass `periods=N` to compare the last N buckets against the N before
+    them (e.g. `period=month&periods=12`); per-bucket metrics are returned in
+    `current_breakdown` / `previous_breakdown`.
     """
     user_id = cast(UUID, current_user.id)
-    return service.get_period_comparison(user_id=user_id, parameters=parameters)
+    return _cached(
+        cache,
+        current_user,
+        "period-comparison",
+        parameters.model_dump(mode="json"),
+        PeriodComparisonResponse,
+        lambda: service.get_period_comparison(user_id=user_id, parameters=parameters),
+    )
 
 
 @router.get("/cashflow/history", response_model=CashflowHistoryResponse)
@@ -104,13 +220,21 @@ def get_cashflow_history(
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
     base_currency: str = Depends(get_user_base_currency),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
 ) -> CashflowHistoryResponse:
     """Get historical cashflow series by period and date range."""
     user_id = cast(UUID, current_user.id)
-    return service.get_cashflow_history_response(
-        user_id=user_id,
-        parameters=parameters,
-        base_currency=base_currency,
+    return _cached(
+        cache,
+        current_user,
+        "cashflow/history",
+        parameters.model_dump(mode="json"),
+        CashflowHistoryResponse,
+        lambda: service.get_cashflow_history_response(
+            user_id=user_id,
+            parameters=parameters,
+            base_currency=base_currency,
+        ),
     )
 
 
@@ -120,8 +244,14 @@ def get_cashflow_history(
 # -------------------------------------------------------------------------
 
 
-@router.get("/balance", response_model=BalanceResponse)
+@router.get(
+    "/balance",
+    response_model=BalanceResponse,
+    responses={304: {"description": "Not modified (If-None-Match matched)"}},
+)
 def get_balance(
+    request: Request,
+    response: Response,
     as_of: Optional[date] = Query(
         default=None,
         description="Date as of which to compute balance (default: today)",
@@ -129,13 +259,30 @@ def get_balance(
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
     base_currency: str = Depends(get_user_base_currency),
-) -> BalanceResponse:
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    etag: Optional[str] = Depends(get_ledger_etag),
+) -> Union[BalanceResponse, Response]:
     """
     Return the user's total balance as of a date (default: today), converted to the user's base currency.
     Read-only; does not mutate transactions or ledger.
+
+    With LEDGER_ETAG_ENABLED, returns an `ETag`; send it back as `If-None-Match`
+    to get a 304 when nothing changed.
     """
+    not_modified = apply_etag(request, response, etag)
+    if not_modified:
+        return not_modified
     user_id = cast(UUID, current_user.id)
-    return service.get_balance_response(user_id, as_of=as_of, currency=base_currency)
+    return _cached(
+        cache,
+        current_user,
+        "balance",
+        {"as_of": as_of},
+        BalanceResponse,
+        lambda: service.get_balance_response(
+            user_id, as_of=as_of, currency=base_currency
+        ),
+    )
 
 
 @router.get("/balance/accounts", response_model=BalanceAccountsResponse)
@@ -147,19 +294,96 @@ def get_balance_accounts(
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
     base_currency: str = Depends(get_user_base_currency),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
 ) -> BalanceAccountsResponse:
     """
     Return current balance per account as of a date. Includes native and converted (base currency) amounts.
     Read-only; does not mutate transactions or ledger.
     """
     user_id = cast(UUID, current_user.id)
-    return service.get_balance_accounts_response(
-        user_id, currency=base_currency, as_of=as_of
+    return _cached(
+        cache,
+        current_user,
+        "balance/accounts",
+        {"as_of": as_of},
+        BalanceAccountsResponse,
+        lambda: service.get_balance_accounts_response(
+            user_id, currency=base_currency, as_of=as_of
+        ),
+    )
+
+
+@router.get(
+    "/dashboard",
+    response_model=DashboardResponse,
+    responses={304: {"description": "Not modified (If-None-Match matched)"}},
+)
+def get_dashboard(
+    request: Request,
+    response: Response,
+    widgets: List[DashboardWidget] = Query(
+        default=list(DashboardWidget),
+        description="Widgets to compute (repeat the parameter); default: all",
+    ),
+    as_of: Optional[date] = Query(
+        default=None, description="Balance date (default: today)"
+    ),
+    period: Optional[TransactionSummaryPeriod] = Query(
+        default=None,
+        description="Cashflow/category period (default: month unless a range is set)",
+    ),
+    date_from: Optional[date] = Query(default=None),
+    date_to: Optional[date] = Query(default=None),
+    full_list: bool = Query(default=True),
+    recent_limit: int = Query(default=5, description="5, 10, 20, 50 or 100"),
+    service: ReportingService = Depends(get_reporting_service),
+    current_user: User = Depends(get_current_user),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
+    etag: Optional[str] = Depends(get_ledger_etag),
+) -> Union[DashboardResponse, Response]:
+    """
+    Return the home-screen widgets in one response: `balance`, `balance_accounts`,
+    `cashflow_summary`, `categories_summary` and `recent_transactions`.
+
+    Each widget matches its standalone endpoint, but accounts and snapshots are
+    loaded once for both balance widgets and one transaction scan feeds both
+    summaries. Balance widgets require a base currency on the profile.
+
+    With LEDGER_ETAG_ENABLED, returns an `ETag`; send it back as `If-None-Match`
+    to get a 304 when nothing changed.
+    """
+    parameters = DashboardParameters(
+        widgets=widgets,
+        as_of=as_of,
+        period=period,
+        date_from=date_from,
+        date_to=date_to,
+        full_list=full_list,
+        recent_limit=recent_limit,
+    )
+    base_currency = (
+        get_user_base_currency(current_user)
+        if set(parameters.widgets) & BALANCE_WIDGETS
+        else None
+    )
+    not_modified = apply_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    user_id = cast(UUID, current_user.id)
+    return _cached(
+        cache,
+        current_user,
+        "dashboard",
+        parameters.model_dump(mode="json"),
+        DashboardResponse,
+        lambda: service.get_dashboard(
+            user_id, parameters=parameters, currency=base_currency
+        ),
     )
 
 
 @router.get("/balance/history", response_model=BalanceHistoryResponse)
-def get_balance_history(
+async def get_balance_history(
     from_date: date = Query(..., alias="from", description="Start date (inclusive)"),
     to_date: date = Query(..., alias="to", description="End date (inclusive)"),
     period: TransactionSummaryPeriod = Query(
@@ -172,17 +396,41 @@ def get_balance_history(
     service: ReportingService = Depends(get_reporting_service),
     current_user: User = Depends(get_current_user),
     base_currency: str = Depends(get_user_base_currency),
+    cache: Optional[ReportingCacheService] = Depends(get_reporting_cache),
 ) -> BalanceHistoryResponse:
     """
     Return balance history for charts or lists. Balances are projections (may change with FX revaluation).
     Does not scan full transaction history per point; uses snapshots efficiently.
+
+    With ASYNC_DATABASE_ENABLED the reads run on AsyncSession without holding a
+    worker thread; otherwise the sync engine runs in the threadpool.
     """
     user_id = cast(UUID, current_user.id)
-    return service.get_balance_history_response(
-        user_id,
+    kwargs = dict(
         from_date=from_date,
         to_date=to_date,
         currency=base_currency,
         period=period,
         account_id=account_id,
     )
+
+    async def compute() -> BalanceHistoryResponse:
+        if service.async_balance_engine is not None:
+            return await service.get_balance_history_response_async(user_id, **kwargs)
+        return await run_in_threadpool(
+            service.get_balance_history_response, user_id, **kwargs
+        )
+
+    return await _cached_async(
+        cache,
+        current_user,
+        "balance/history",
+        {
+            "from": from_date,
+            "to": to_date,
+            "period": period.value,
+            "account_id": account_id,
+        },
+        BalanceHistoryResponse,
+        compute,
+    )
@@ -1,8 +1,16 @@
-from typing import cast
+import io
+import tempfile
+from typing import Optional, Union, cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
 
+from app.config.database import get_session_factory
+from app.config.settings import get_settings
+from app.dependencies.etag_dependencies import get_ledger_etag
 from app.dependencies.transaction_dependencies import get_transaction_service
 from app.dependencies.user_dependencies import get_current_user
 from app.entities.user import User
@@ -10,7 +18,15 @@ from app.schemas.base_schemas import SearchResponse
 from app.schemas.transaction_schemas import (
     RecentTransactionsParams,
     RecentTransactionsResponse,
+    TransactionBulkCreate,
+    TransactionBulkResponse,
     TransactionCreate,
+    TransactionExportFormat,
+    TransactionExportParams,
+    TransactionImportParams,
+    TransactionImportResponse,
+    TransactionPageParams,
+    TransactionPageResponse,
     TransactionResponse,
     TransactionSearch,
     TransactionUpdate,
@@ -19,30 +35,91 @@ from app.schemas.transaction_schemas import (
     TransferUpdate,
 )
 from app.services.transaction_service import TransactionService
+from app.shared.helpers.etag_helper import apply_etag
 
 router = APIRouter()
 
 
-@router.get("", response_model=SearchResponse[TransactionResponse])
+@router.get("", response_model=TransactionPageResponse)
 def search_transactions(
     search: TransactionSearch = Depends(),
+    page: TransactionPageParams = Depends(),
     service: TransactionService = Depends(get_transaction_service),
     current_user: User = Depends(get_current_user),
 ) -> SearchResponse[TransactionResponse]:
     """
     Search transactions by account, category, type, currency, date range, amount range,
     and source for the authenticated user.
+
+    Pass `limit` (1-100) to page through results; follow `next_cursor` via the
+    `cursor` query param until it is null. Without `limit` the full filtered
+    history is returned.
     """
-    return service.search(cast(UUID, current_user.id), search)
+    user_id = cast(UUID, current_user.id)
+    if page.is_paginated:
+        return service.search_page(user_id, search, page)
+    return service.search(user_id, search)
+
+
+_EXPORT_MEDIA_TYPES = {
+    TransactionExportFormat.NDJSON: "application/x-ndjson",
+    TransactionExportFormat.CSV: "text/csv",
+}
 
 
-@router.get("/recent", response_model=RecentTransactionsResponse)
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export transactions",
+    description=(
+        "Stream the authenticated user's transactions as NDJSON or CSV. "
+        "Accepts the same filters as the search endpoint."
+    ),
+)
+def export_transactions(
+    search: TransactionSearch = Depends(),
+    params: TransactionExportParams = Depends(),
+    service: TransactionService = Depends(get_transaction_service),
+    current_user: User = Depends(get_current_user),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream filtered transactions; memory stays flat regardless of ledger size."""
+    export_format = params.format
+    return StreamingResponse(
+        service.export(
+            cast(UUID, current_user.id), search, export_format, session_factory
+        ),
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="transactions.{export_format.value}"'
+            )
+        },
+    )
+
+
+@router.get(
+    "/recent",
+    response_model=RecentTransactionsResponse,
+    responses={304: {"description": "Not modified (If-None-Match matched)"}},
+)
 def get_recent_transactions(
+    request: Request,
+    response: Response,
     params: RecentTransactionsParams = Depends(),
     service: TransactionService = Depends(get_transaction_service),
     current_user: User = Depends(get_current_user),
-) -> RecentTransactionsResponse:
-    """Return a fixed-size list of the most recent transactions."""
+    etag: Optional[str] = Depends(get_ledger_etag),
+) -> Union[RecentTransactionsResponse, Response]:
+    """
+    Return a fixed-size list of the most recent transactions.
+
+    With LEDGER_ETAG_ENABLED, returns an `ETag`; send it back as `If-None-Match`
+    to get a 304 when nothing changed.
+    """
+    not_modified = apply_etag(request, response, etag)
+    if not_modified:
+        return not_modified
     return service.get_recent(cast(UUID, current_user.id), params)
 
 
@@ -77,6 +154,79 @@ async def create_transaction(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=TransactionBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create transactions in bulk",
+    description=(
+        "Create up to 5000 transactions in one request (e.g. a bank statement "
+        "import). Concepts and tags must reference existing ids. The batch is "
+        "all-or-nothing. Requires a valid JWT token in the Authorization header."
+    ),
+)
+def create_transactions_bulk(
+    payload: TransactionBulkCreate,
+    service: TransactionService = Depends(get_transaction_service),
+    current_user: User = Depends(get_current_user),
+) -> TransactionBulkResponse:
+    """Validate ownership set-wise and insert every row in one transaction."""
+    return service.create_bulk(payload, user_id=cast(UUID, current_user.id))
+
+
+# Request bodies up to this size stay in memory; larger statements spill to disk.
+_IMPORT_SPOOL_MAX_BYTES = 1024 * 1024
+
+
+@router.post(
+    "/import",
+    response_model=TransactionImportResponse,
+    summary="Import a bank statement",
+    description=(
+        "Import a CSV or OFX bank statement sent as the raw request body into one "
+        "account. Re-importing an overlapping statement skips rows already "
+        "imported. Bodies over STATEMENT_IMPORT_MAX_BYTES are rejected with 413. "
+        "Requires a valid JWT token in the Authorization header."
+    ),
+)
+async def import_transactions(
+    request: Request,
+    params: TransactionImportParams = Depends(),
+    service: TransactionService = Depends(get_transaction_service),
+    current_user: User = Depends(get_current_user),
+) -> TransactionImportResponse:
+    """
+    Spool the statement body on the event loop, then parse and insert it chunk
+    by chunk in the threadpool, since the service does blocking database I/O.
+    """
+    max_bytes = get_settings().STATEMENT_IMPORT_MAX_BYTES
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Statement exceeds {max_bytes} bytes",
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+    with tempfile.SpooledTemporaryFile(max_size=_IMPORT_SPOOL_MAX_BYTES) as spool:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise too_large
+            spool.write(chunk)
+        spool.seek(0)
+        lines = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        try:
+            return await run_in_threadpool(
+                service.import_statement,
+                lines,
+                params,
+                user_id=cast(UUID, current_user.id),
+            )
+        finally:
+            lines.detach()
+
+
 @router.post(
     "/transfer",
     response_model=TransferResponse,
@@ -0,0 +1,70 @@
+from datetime import date as Date
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.base_schemas import SearchResponse
+from app.schemas.reporting_schemas import (
+    BalanceAccountsResponse,
+    BalanceResponse,
+    CashflowSummaryResponse,
+    CategorySummaryResponse,
+    TransactionSummaryPeriod,
+)
+from app.schemas.transaction_schemas import RecentTransactionsResponse
+
+
+class DashboardWidget(str, Enum):
+    BALANCE = "balance"
+    BALANCE_ACCOUNTS = "balance_accounts"
+    CASHFLOW_SUMMARY = "cashflow_summary"
+    CATEGORIES_SUMMARY = "categories_summary"
+    RECENT_TRANSACTIONS = "recent_transactions"
+
+
+# Widgets that need a base currency to convert balances
+BALANCE_WIDGETS = {DashboardWidget.BALANCE, DashboardWidget.BALANCE_ACCOUNTS}
+
+
+class DashboardParameters(BaseModel):
+    """
+    Parameters for the dashboard endpoint.
+
+    Cashflow and category widgets use `period` OR `date_from`/`date_to`
+    (default: the current month); balance widgets use `as_of` (default: today).
+    """
+
+    widgets: List[DashboardWidget] = Field(
+        default_factory=lambda: list(DashboardWidget)
+    )
+    as_of: Optional[Date] = None
+    period: Optional[TransactionSummaryPeriod] = None
+    date_from: Optional[Date] = None
+    date_to: Optional[Date] = None
+    full_list: bool = True
+    recent_limit: int = 5
+
+    @model_validator(mode="after")
+    def ensure_valid_range(self) -> "DashboardParameters":
+        if self.recent_limit not in {5, 10, 20, 50, 100}:
+            raise ValueError("recent_limit must be one of: 5, 10, 20, 50, 100.")
+        if self.period is not None:
+            return self
+        if (self.date_from is None) != (self.date_to is None):
+            raise ValueError("Provide both 'date_from' and 'date_to', or 'period'")
+        if self.date_from is None:
+            self.period = TransactionSummaryPeriod.MONTH
+        elif self.date_from > self.date_to:
+            raise ValueError("'date_from' must be before or equal to 'date_to'")
+        return self
+
+
+class DashboardResponse(BaseModel):
+    """Every requested widget; widgets that were not requested are null."""
+
+    balance: Optional[BalanceResponse] = None
+    balance_accounts: Optional[BalanceAccountsResponse] = None
+    cashflow_summary: Optional[CashflowSummaryResponse] = None
+    categories_summary: Optional[SearchResponse[CategorySummaryResponse]] = None
+    recent_transactions: Optional[RecentTransactionsResponse] = None
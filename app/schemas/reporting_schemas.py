@@ -68,6 +68,14 @@ class CategoryAggregationData(BaseModel):
     transaction_count: int
 
 
+class CategoryCashflowData(BaseModel):
+    """DTO for per-category income, expense and count (one scan feeds both summaries)"""
+
+    income: Decimal
+    expense: Decimal
+    transaction_count: int
+
+
 class CategorySummaryResponse(BaseModel):
     id: UUID4
     name: str
@@ -134,10 +142,17 @@ class PeriodComparisonResponse(BaseModel):
     current_period: PeriodMetrics
     previous_period: PeriodMetrics
     summary: PeriodComparisonSummary
+    # Per-bucket metrics, oldest first; only filled when periods > 1.
+    current_breakdown: list[PeriodMetrics] = []
+    previous_breakdown: list[PeriodMetrics] = []
 
     model_config = {"populate_by_name": True, **_decimal_json}
 
 
+# Upper bound for N-period comparisons (2N ranges aggregated in one query)
+MAX_COMPARISON_PERIODS = 24
+
+
 class PeriodComparisonParameters(BaseModel):
     """Query parameters for period comparison. Use either period OR date_from/date_to."""
 
@@ -152,12 +167,20 @@ class PeriodComparisonParameters(BaseModel):
     amount_max: Optional[Decimal] = None
     source: Optional[str] = None
     period: Optional[TransactionSummaryPeriod] = None
+    periods: int = Field(
+        default=1,
+        ge=1,
+        le=MAX_COMPARISON_PERIODS,
+        description="With period, compare the last N buckets against the N before them (e.g. period=month&periods=12).",
+    )
 
     @model_validator(mode="after")
     def ensure_date_range_or_period(self) -> "PeriodComparisonParameters":
         """Ensure either period is set OR both date_from and date_to. Period takes precedence."""
         if self.period is not None:
             return self
+        if self.periods > 1:
+            raise ValueError("'periods' greater than 1 requires 'period'")
         if self.date_from is None or self.date_to is None:
             raise ValueError(
                 "Either 'period' or both 'date_from' and 'date_to' must be provided"
@@ -13,10 +13,17 @@ from sqlalchemy import and_
 
 from app.entities.transaction import Transaction, TransactionSource, TransactionType
 from app.schemas.account_schemas import AccountType
+from app.schemas.base_schemas import SearchResponse
 from app.schemas.category_schemas import CategoryResponseBase
 from app.schemas.concept_schemas import ConceptTransactionCreate
 from app.schemas.reporting_schemas import TransactionSummaryPeriod
 from app.schemas.tag_schemas import TagTransactionCreate
+from app.shared.helpers.cursor_helper import decode_transaction_cursor
+
+# Upper bound for keyset pages; keeps per-page cost constant however deep the user pages.
+MAX_TRANSACTION_PAGE_SIZE = 100
+# Upper bound for one bulk create; larger statements are split by the client.
+MAX_BULK_TRANSACTIONS = 5000
 
 
 class TransactionSearchType(str, Enum):
@@ -129,6 +136,49 @@ class TransactionUpdate(BaseModel):
         return value
 
 
+class TransactionBulkItem(BaseModel):
+    """One row of a bulk create; concept and tags reference existing ids only."""
+
+    account_id: UUID
+    category_id: UUID
+    concept_id: Optional[UUID] = None
+    tag_ids: Optional[List[UUID]] = None
+    type: str
+    amount: Decimal
+    currency: Optional[str] = None
+    date: Date
+    source: str = TransactionSource.MANUAL.value
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def ensure_date(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.date()
+        return value
+
+
+class TransactionBulkCreate(BaseModel):
+    transactions: List[TransactionBulkItem]
+
+    @field_validator("transactions")
+    @classmethod
+    def validate_size(
+        cls, value: List[TransactionBulkItem]
+    ) -> List[TransactionBulkItem]:
+        if not 1 <= len(value) <= MAX_BULK_TRANSACTIONS:
+            raise ValueError(
+                f"transactions must contain between 1 and {MAX_BULK_TRANSACTIONS} items."
+            )
+        return value
+
+
+class TransactionBulkResponse(BaseModel):
+    """Ids of the created transactions, in request order."""
+
+    created: int
+    ids: List[UUID]
+
+
 class TransferTransactionCreate(BaseModel):
     from_account_id: UUID
     to_account_id: UUID
@@ -268,6 +318,95 @@ class TransactionSearch(BaseModel):
         return filters
 
 
+class TransactionPageParams(BaseModel):
+    """
+    Query params enabling keyset (cursor) pagination on transaction search.
+
+    Pagination is opt-in: when `limit` is omitted the search returns the full
+    filtered history as before. `cursor` is the opaque `next_cursor` returned by
+    the previous page and requires `limit`.
+    """
+
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_page_params(self) -> "TransactionPageParams":
+        if self.limit is None:
+            if self.cursor is not None:
+                raise ValueError("'cursor' requires 'limit'.")
+            return self
+
+        if not 1 <= self.limit <= MAX_TRANSACTION_PAGE_SIZE:
+            raise ValueError(
+                f"limit must be between 1 and {MAX_TRANSACTION_PAGE_SIZE}."
+            )
+
+        if self.cursor is not None:
+            decode_transaction_cursor(self.cursor)
+
+        return self
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.limit is not None
+
+
+class TransactionPageResponse(SearchResponse[TransactionResponse]):
+    """Search response; `next_cursor` is set only in paginated mode when more rows exist."""
+
+    next_cursor: Optional[str] = None
+
+
+class TransactionExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TransactionExportParams(BaseModel):
+    """Query params for the streaming export endpoint (filters come from TransactionSearch)."""
+
+    format: TransactionExportFormat = TransactionExportFormat.NDJSON
+
+
+class StatementFormat(str, Enum):
+    CSV = "csv"
+    OFX = "ofx"
+
+
+class TransactionImportParams(BaseModel):
+    """Query params for the statement import endpoint; the file is the request body."""
+
+    account_id: UUID
+    category_id: UUID
+    format: StatementFormat = StatementFormat.CSV
+
+
+class TransactionImportResponse(BaseModel):
+    """Rows inserted, and rows skipped as already imported, repeated or zero."""
+
+    imported: int
+    skipped: int
+
+
+# Flat column order shared by NDJSON keys and the CSV header.
+TRANSACTION_EXPORT_COLUMNS = (
+    "id",
+    "date",
+    "type",
+    "amount",
+    "currency",
+    "account_id",
+    "account_name",
+    "category_id",
+    "category_name",
+    "concept_name",
+    "transfer_id",
+    "source",
+    "created_at",
+)
+
+
 class RecentTransactionsParams(BaseModel):
     """
     Query params for recent transactions endpoint.
@@ -11,15 +11,38 @@ from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
 
 # from app.schemas.account_schemas import AccountUpdate  # unused in service
 from app.services.base_service import BaseService
+from app.services.reporting_cache_service import ReportingCacheService
+from app.shared.helpers.request_cache_helper import RequestCache
 
 logger = logging.getLogger(__name__)
 
 
 class AccountService(BaseService[Account]):
-    def __init__(self, db: Session) -> None:
-        repository = AccountRepository(db)
+    def __init__(
+        self,
+        db: Session,
+        reporting_cache: Optional[ReportingCacheService] = None,
+        request_cache: Optional[RequestCache] = None,
+        *,
+        minor_units: bool = False,
+    ) -> None:
+        repository = AccountRepository(db, request_cache)
         super().__init__(db, repository, Account)
         self.balance_snapshot_repository = BalanceSnapshotRepository(db)
+        # Balances depend on accounts (initial balance, currency, deletion)
+        self.reporting_cache = reporting_cache
+        # Balances are summed from amount_minor (LEDGER_MINOR_UNITS_ENABLED)
+        self.minor_units = minor_units
+
+    def add(self, obj_in: Account, **kwargs: Any) -> Account:
+        account = super().add(obj_in, **kwargs)
+        self._invalidate_reporting_cache(account.user_id)
+        return account
+
+    def update(self, id: UUID, obj_in: Any, **kwargs: Any) -> Account:
+        account = super().update(id, obj_in, **kwargs)
+        self._invalidate_reporting_cache(account.user_id)
+        return account
 
     def before_update(self, id: UUID, obj_in: Any, **kwargs: Any) -> bool:
         super().before_update(id, obj_in, **kwargs)
@@ -40,6 +63,22 @@ class AccountService(BaseService[Account]):
             )
             raise HTTPException(status_code=403, detail="You do not own this account")
 
+        # amount_minor is in the account currency's minor units. While balances
+        # are read from it the currency is frozen once there are transactions;
+        # otherwise the change goes through and amount_minor is recomputed in the
+        # same transaction, ready for when minor-units mode is turned on.
+        currency = getattr(obj_in, "currency", None)
+        if account and currency and currency != account.currency:
+            if not self.minor_units:
+                self.repository.rescale_amount_minor(  # type: ignore[attr-defined]
+                    id, currency
+                )
+            elif self.repository.has_transactions(id):  # type: ignore[attr-defined]
+                raise HTTPException(
+                    status_code=409,
+                    detail="Account has transactions; its currency cannot be changed.",
+                )
+
         return True
 
     def delete(self, id: UUID, **kwargs: Any) -> Optional[Account]:
@@ -55,8 +94,13 @@ class AccountService(BaseService[Account]):
             self.db.rollback()
             logger.exception(f"Failed to soft-delete account id={id}")
             raise
+        self._invalidate_reporting_cache(account.user_id)
         return account
 
+    def _invalidate_reporting_cache(self, user_id: UUID) -> None:
+        if self.reporting_cache:
+            self.reporting_cache.bump_generation(user_id)
+
     def before_delete(self, id: UUID, **kwargs: Any) -> Account:
         account = super().before_delete(id, **kwargs)
 
@@ -6,20 +6,56 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.entities.category import Category, CategoryType
+from app.repository.category_month_total_repository import (
+    CategoryMonthTotalRepository,
+)
 from app.repository.category_repository import CategoryRepository
+from app.repository.daily_cashflow_total_repository import (
+    DailyCashflowTotalRepository,
+)
 from app.schemas.base_schemas import SearchResponse
 from app.schemas.category_schemas import CategoryCreate
 
 # from app.schemas.category_schemas import CategoryUpdate  # unused in service
 from app.services.base_service import BaseService
+from app.services.reporting_cache_service import ReportingCacheService
+from app.shared.helpers.request_cache_helper import RequestCache
 
 logger = logging.getLogger(__name__)
 
 
 class CategoryService(BaseService[Category]):
-    def __init__(self, db: Session) -> None:
-        repository = CategoryRepository(db)
+    def __init__(
+        self,
+        db: Session,
+        reporting_cache: Optional[ReportingCacheService] = None,
+        category_month_total_repository: Optional[CategoryMonthTotalRepository] = None,
+        daily_cashflow_total_repository: Optional[DailyCashflowTotalRepository] = None,
+        request_cache: Optional[RequestCache] = None,
+    ) -> None:
+        repository = CategoryRepository(db, request_cache)
         super().__init__(db, repository, Category)
+        # Category summaries list every category by name
+        self.reporting_cache = reporting_cache
+        # Optional: category month rollup, rebuilt after transaction migration
+        self.category_month_total_repository = category_month_total_repository
+        # Optional: daily cashflow rollup, rebuilt after transaction migration
+        self.daily_cashflow_total_repository = daily_cashflow_total_repository
+
+    def add(self, obj_in: Category, **kwargs: Any) -> Category:
+        category = super().add(obj_in, **kwargs)
+        self._invalidate_reporting_cache(category.user_id)
+        return category
+
+    def update(self, id: UUID, obj_in: Any, **kwargs: Any) -> Category:
+        category = super().update(id, obj_in, **kwargs)
+        self._invalidate_reporting_cache(category.user_id)
+        return category
+
+    def delete(self, id: UUID, **kwargs: Any) -> Category:
+        category = super().delete(id, **kwargs)
+        self._invalidate_reporting_cache(category.user_id)
+        return category
 
     # def get_by_user_id(self, user_id):
     #     categories = super().get_by_user_id(user_id)
@@ -123,12 +159,34 @@ class CategoryService(BaseService[Category]):
                 ),
             )
 
-        migrated = self.repository.migrate_transactions(source_id, target_id)
+        rollups = [
+            rollup
+            for rollup in (
+                self.category_month_total_repository,
+                self.daily_cashflow_total_repository,
+            )
+            if rollup
+        ]
+        if rollups:
+            # Move the rollup rows in the same unit of work as the transactions
+            migrated = self.repository.migrate_transactions(
+                source_id, target_id, auto_commit=False
+            )
+            for rollup in rollups:
+                rollup.rebuild_for_categories([source_id, target_id])
+            self.db.commit()
+        else:
+            migrated = self.repository.migrate_transactions(source_id, target_id)
+        self._invalidate_reporting_cache(user_id)
         logger.info(
             f"Migrated {migrated} transaction(s) from category {source_id} → {target_id}"
         )
         return migrated
 
+    def _invalidate_reporting_cache(self, user_id: UUID) -> None:
+        if self.reporting_cache:
+            self.reporting_cache.bump_generation(user_id)
+
     def before_update(self, id: UUID, obj_in: Any, **kwargs: Any) -> bool:
         # Basic validation
         super().before_update(id, obj_in, **kwargs)
@@ -9,15 +9,103 @@ conversion to user base currency is done here when returning reporting data.
 
 from datetime import date
 from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.repository.fx_rate_repository import FxRateRepository
+from app.shared.helpers.cache_helper import TTLCache
+
+# MVP hard-coded rates. String literals keep them Decimal-exact (never Decimal(float)).
+_MVP_RATES: Dict[Tuple[str, str], Decimal] = {
+    ("USD", "MXN"): Decimal("17.5"),
+    ("MXN", "USD"): Decimal("0.057"),
+    ("USD", "EUR"): Decimal("1.10"),
+    ("EUR", "USD"): Decimal("0.90"),
+    ("MXN", "EUR"): Decimal("0.050"),
+    ("EUR", "MXN"): Decimal("20.00"),
+}
+
+# Process-wide LRU of (base, quote, as_of) -> stored rate (or None when no stored
+# rate exists). Bounded by size and TTL so rates loaded by another process show
+# up without a restart; load_fx_rates clears it in-process.
+RATE_CACHE_SIZE = 4096
+RATE_CACHE_TTL_SECONDS = 60 * 60
+_rate_cache = TTLCache(maxsize=RATE_CACHE_SIZE, ttl_seconds=RATE_CACHE_TTL_SECONDS)
+_MISSING = object()
+
+
+def clear_rate_cache() -> None:
+    _rate_cache.clear()
+
+
+class FxRateTable:
+    """
+    Precomputed rates for a request's currency pairs and dates.
+
+    Built by FxService.rate_table so hot loops (one conversion per point or row)
+    do a dict lookup instead of resolving the rate each time. Looking up a pair or
+    date that was not precomputed raises KeyError.
+    """
+
+    __slots__ = ("_rates",)
+
+    def __init__(self, rates: Dict[Tuple[str, str, date], Optional[Decimal]]):
+        self._rates = rates
+
+    def rate(
+        self, from_currency: str, to_currency: str, as_of: date
+    ) -> Optional[Decimal]:
+        if from_currency == to_currency:
+            return None
+        return self._rates[(from_currency, to_currency, as_of)]
+
+    def convert(
+        self,
+        amount: Decimal,
+        from_currency: str,
+        to_currency: str,
+        as_of: date,
+    ) -> Decimal:
+        """Same contract as FxService.convert, served from the table."""
+        rate = self.rate(from_currency, to_currency, as_of)
+        return amount if rate is None else amount * rate
 
 
 class FxService:
     """
     FX conversion at read time (presentation concern only).
 
-    MVP implementation: hard-coded rates + passthrough fallback.
+    With an FxRateRepository, rates come from the fx_rates table (latest rate on
+    or before as_of). Pairs without stored rates fall back to the MVP hard-coded
+    rates, then to passthrough.
     """
 
+    def __init__(self, fx_rate_repository: Optional[FxRateRepository] = None):
+        self.fx_rate_repository = fx_rate_repository
+
+    def rate(
+        self, from_currency: str, to_currency: str, as_of: date
+    ) -> Optional[Decimal]:
+        """
+        Rate from from_currency to to_currency as of a date.
+
+        Returns None when no conversion applies (same currency or unknown pair);
+        callers then keep the amount unchanged.
+        """
+        if from_currency == to_currency:
+            return None
+        if self.fx_rate_repository is not None:
+            key = (from_currency, to_currency, as_of)
+            stored = _rate_cache.get(key, _MISSING)
+            if stored is _MISSING:
+                stored = self.fx_rate_repository.get_rate_as_of(
+                    from_currency, to_currency, as_of
+                )
+                _rate_cache.set(key, stored)
+            if stored is not None:
+                return stored
+        # Unknown pair: keep behavior safe and deterministic for MVP.
+        return _MVP_RATES.get((from_currency, to_currency))
+
     def convert(
         self,
         amount: Decimal,
@@ -29,19 +117,57 @@ class FxService:
         Convert amount from from_currency to to_currency using rates as of as_of date.
         Used only for presentation; never mutates ledger or snapshots.
         """
-        if from_currency == to_currency:
-            return amount
-        if from_currency == "USD" and to_currency == "MXN":
-            return amount * Decimal(17.5)
-        elif from_currency == "MXN" and to_currency == "USD":
-            return amount * Decimal(0.057)
-        elif from_currency == "USD" and to_currency == "EUR":
-            return amount * Decimal(1.10)
-        elif from_currency == "EUR" and to_currency == "USD":
-            return amount * Decimal(0.90)
-        elif from_currency == "MXN" and to_currency == "EUR":
-            return amount * Decimal(0.050)
-        elif from_currency == "EUR" and to_currency == "MXN":
-            return amount * Decimal(20.00)
-        # Unknown pair: keep behavior safe and deterministic for MVP.
-        return amount
+        rate = self.rate(from_currency, to_currency, as_of)
+        return amount if rate is None else amount * rate
+
+    def load_rates(
+        self, records: List[Tuple[str, str, date, Decimal]], batch_size: int = 1000
+    ) -> int:
+        """Bulk upsert (base, quote, date, rate) records in one transaction."""
+        if self.fx_rate_repository is None:
+            raise RuntimeError("FxService.load_rates requires an FxRateRepository")
+        written = 0
+        try:
+            for i in range(0, len(records), batch_size):
+                written += self.fx_rate_repository.upsert_many(
+                    records[i : i + batch_size]
+                )
+            self.fx_rate_repository.db.commit()
+        except Exception:
+            self.fx_rate_repository.db.rollback()
+            raise
+        clear_rate_cache()
+        return written
+
+    def rate_table(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        dates: Iterable[date],
+    ) -> FxRateTable:
+        """
+        Precompute rates for every (pair, date) combination.
+
+        Use for series (balance history points, cashflow buckets) where the same
+        few pairs are converted at many dates. Stored rates are loaded with one
+        range query and carried forward across days without a rate.
+        """
+        dates = sorted(set(dates))
+        pairs = sorted({(f, t) for f, t in pairs if f != t})
+        series: Dict[Tuple[str, str], List[Tuple[date, Decimal]]] = {}
+        if self.fx_rate_repository is not None and pairs and dates:
+            series = self.fx_rate_repository.get_rate_series(pairs, dates[0], dates[-1])
+
+        rates: Dict[Tuple[str, str, date], Optional[Decimal]] = {}
+        for from_currency, to_currency in pairs:
+            fallback = _MVP_RATES.get((from_currency, to_currency))
+            points = series.get((from_currency, to_currency), [])
+            index = 0
+            current: Optional[Decimal] = None
+            for d in dates:
+                while index < len(points) and points[index][0] <= d:
+                    current = points[index][1]
+                    index += 1
+                rates[(from_currency, to_currency, d)] = (
+                    current if current is not None else fallback
+                )
+        return FxRateTable(rates)
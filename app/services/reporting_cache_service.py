@@ -0,0 +1,126 @@
+"""
+Per-user response cache for reporting endpoints.
+
+Entries are keyed by user, endpoint and normalized parameters, and versioned by
+a per-user generation. Every write that can change a user's reports bumps the
+generation, so older entries are never read again and simply expire by TTL.
+Cached values are the serialized response models; a hit skips the database.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple, Type, TypeVar
+from uuid import UUID, uuid4
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from app.shared.helpers.cache_helper import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class ReportingCacheService:
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _generation_key(user_id: UUID) -> str:
+        return f"reporting:gen:{user_id}"
+
+    def generation(self, user_id: UUID) -> str:
+        """Current generation token for a user (created on first use)."""
+        key = self._generation_key(user_id)
+        generation = self.backend.get(key)
+        if generation is None:
+            generation = uuid4().hex
+            self.backend.set(key, generation)
+        return generation
+
+    def bump_generation(self, user_id: UUID) -> None:
+        """
+        Invalidate every cached report of a user. Call after the write commits.
+
+        Generations are random tokens rather than counters: if the generation key
+        is evicted, a fresh token can never collide with entries cached before.
+        """
+        try:
+            self.backend.set(self._generation_key(user_id), uuid4().hex)
+        except Exception as e:
+            # The write is already committed; stale entries expire by TTL.
+            logger.error(f"Reporting cache invalidation failed: {str(e)}")
+
+    def key(self, user_id: UUID, endpoint: str, params: Mapping[str, Any]) -> str:
+        normalized = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"reporting:{user_id}:{self.generation(user_id)}:{endpoint}:{digest}"
+
+    def get_or_compute(
+        self,
+        user_id: UUID,
+        endpoint: str,
+        params: Mapping[str, Any],
+        response_type: Type[M],
+        compute: Callable[[], M],
+    ) -> M:
+        """Return the cached response for (user, endpoint, params) or compute and store it."""
+        key, cached = self._lookup(user_id, endpoint, params, response_type)
+        if cached is not None:
+            return cached
+        response = compute()
+        self._store(key, response)
+        return response
+
+    async def aget_or_compute(
+        self,
+        user_id: UUID,
+        endpoint: str,
+        params: Mapping[str, Any],
+        response_type: Type[M],
+        compute: Callable[[], Awaitable[M]],
+    ) -> M:
+        """
+        get_or_compute for async handlers; `compute` is awaited on a miss.
+
+        Backend calls are blocking (a Redis round trip), so they run in the
+        threadpool instead of on the event loop.
+        """
+        key, cached = await run_in_threadpool(
+            self._lookup, user_id, endpoint, params, response_type
+        )
+        if cached is not None:
+            return cached
+        response = await compute()
+        await run_in_threadpool(self._store, key, response)
+        return response
+
+    def _lookup(
+        self,
+        user_id: UUID,
+        endpoint: str,
+        params: Mapping[str, Any],
+        response_type: Type[M],
+    ) -> Tuple[Optional[str], Optional[M]]:
+        try:
+            key = self.key(user_id, endpoint, params)
+            cached = self.backend.get(key)
+        except Exception as e:
+            # A cache outage must not fail the request; serve from the DB.
+            logger.warning(f"Reporting cache read failed: {str(e)}")
+            return None, None
+        if cached is None:
+            return key, None
+        logger.debug(f"Reporting cache hit: {endpoint} user={user_id}")
+        return key, response_type.model_validate_json(cached)
+
+    def _store(self, key: Optional[str], response: BaseModel) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, response.model_dump_json(), self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Reporting cache write failed: {str(e)}")
@@ -1,14 +1,20 @@
 import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 
-from app.engines.balance_engine import BalanceEngine
+from app.engines.balance_engine import AsyncBalanceEngine, BalanceEngine
 from app.entities.category import Category, CategoryType
 from app.schemas.base_schemas import SearchResponse
+from app.schemas.dashboard_schemas import (
+    BALANCE_WIDGETS,
+    DashboardParameters,
+    DashboardResponse,
+    DashboardWidget,
+)
 from app.schemas.reporting_schemas import (
     BALANCE_HISTORY_PERIODS,
     AccountBalanceItem,
@@ -29,11 +35,13 @@ from app.schemas.reporting_schemas import (
     ReportingParameters,
     TransactionSummaryPeriod,
 )
+from app.schemas.transaction_schemas import RecentTransactionsParams
 from app.services.category_service import CategoryService
 from app.services.fx_service import FxService
 from app.services.transaction_service import TransactionService
 from app.shared.helpers.date_helper import (
     build_period_buckets,
+    build_trailing_periods,
     calculate_period_dates,
     calculate_previous_equivalent_period,
 )
@@ -59,11 +67,14 @@ class ReportingService:
         transaction_service: TransactionService,
         balance_engine: BalanceEngine,
         fx_service: FxService,
+        async_balance_engine: Optional[AsyncBalanceEngine] = None,
     ):
         self.category_service = category_service
         self.transaction_service = transaction_service
         self.balance_engine = balance_engine
         self.fx_service = fx_service
+        # Optional: AsyncSession read path (ASYNC_DATABASE_ENABLED)
+        self.async_balance_engine = async_balance_engine
 
     def get_categories_summary(
         self,
@@ -125,6 +136,16 @@ class ReportingService:
         )
 
         # 4. Merge and return enriched response
+        return self._build_category_summaries(
+            categories, amounts_and_counts_by_category, parameters.full_list
+        )
+
+    @staticmethod
+    def _build_category_summaries(
+        categories: List[Category],
+        amounts_and_counts_by_category: Dict[UUID, CategoryAggregationData],
+        full_list: bool,
+    ) -> SearchResponse[CategorySummaryResponse]:
         category_summaries = []
         for cat in categories:
             aggregation_data = amounts_and_counts_by_category.get(
@@ -134,10 +155,7 @@ class ReportingService:
                 ),
             )
             # When full_list is False, skip categories with no transactions
-            if (
-                not parameters.full_list
-                and cat.id not in amounts_and_counts_by_category
-            ):
+            if not full_list and cat.id not in amounts_and_counts_by_category:
                 continue
             category_summaries.append(
                 CategorySummaryResponse(
@@ -202,57 +220,67 @@ class ReportingService:
     ) -> PeriodComparisonResponse:
         """
         Compare current period vs previous equivalent period.
-        Reuses get_cashflow_summary logic; 2 queries total.
+
+        Both periods (and, with periods > 1, every bucket of each window) are
+        aggregated in one conditional-aggregation query over
+        [previous_start, current_end].
         """
-        # 1. Resolve current period
-        if parameters.period is not None:
-            current_start, current_end = calculate_period_dates(parameters.period)
+        # 1. Resolve the compared ranges, oldest first
+        if parameters.period is not None and parameters.periods > 1:
+            _, current_end = calculate_period_dates(parameters.period)
+            buckets = build_trailing_periods(
+                current_end, parameters.period, 2 * parameters.periods
+            )
+            previous_buckets = buckets[: parameters.periods]
+            current_buckets = buckets[parameters.periods :]
+            current_start, current_end = current_buckets[0][0], current_buckets[-1][1]
+            previous_start, previous_end = (
+                previous_buckets[0][0],
+                previous_buckets[-1][1],
+            )
         else:
-            current_start = parameters.date_from
-            current_end = parameters.date_to
-            assert current_start is not None and current_end is not None
-
-        # 2. Calculate previous equivalent period
-        previous_start, previous_end = calculate_previous_equivalent_period(
-            current_start, current_end
-        )
-
-        # 3. Resolve category_ids (same logic as get_cashflow_summary)
-        category_ids: Optional[List[UUID]] = None
-        if parameters.category_id is not None:
-            categories_response = self.category_service.get_by_user_id(user_id)
-            categories = [
-                c for c in categories_response.results if c.id == parameters.category_id
-            ]
-            category_ids = [c.id for c in categories] if categories else []
+            if parameters.period is not None:
+                current_start, current_end = calculate_period_dates(parameters.period)
+            else:
+                current_start = parameters.date_from
+                current_end = parameters.date_to
+                assert current_start is not None and current_end is not None
+            previous_start, previous_end = calculate_previous_equivalent_period(
+                current_start, current_end
+            )
+            previous_buckets = [(previous_start, previous_end)]
+            current_buckets = [(current_start, current_end)]
 
-        # 4. Get metrics for both periods
-        filter_kwargs = dict(
-            category_ids=category_ids if category_ids else None,
+        # 2. Aggregate every bucket in a single scan. Transactions are scoped by
+        # user_id, so a category_id the user does not own simply matches nothing.
+        summaries = self.transaction_service.get_cashflow_summaries(
+            user_id=user_id,
+            ranges=previous_buckets + current_buckets,
+            category_ids=(
+                [parameters.category_id] if parameters.category_id is not None else None
+            ),
             account_id=parameters.account_id,
             currency=parameters.currency,
             amount_min=parameters.amount_min,
             amount_max=parameters.amount_max,
             source=parameters.source,
         )
-        income_curr, expense_curr, total_curr = (
-            self.transaction_service.get_cashflow_summary(
-                user_id=user_id,
-                date_from=current_start,
-                date_to=current_end,
-                **filter_kwargs,
+        breakdown = [
+            PeriodMetrics(start=start, end=end, income=income, expense=expense, net=net)
+            for (start, end), (income, expense, net) in zip(
+                previous_buckets + current_buckets, summaries
             )
-        )
-        income_prev, expense_prev, total_prev = (
-            self.transaction_service.get_cashflow_summary(
-                user_id=user_id,
-                date_from=previous_start,
-                date_to=previous_end,
-                **filter_kwargs,
-            )
-        )
-
-        # 5. Build summary
+        ]
+        previous_breakdown = breakdown[: len(previous_buckets)]
+        current_breakdown = breakdown[len(previous_buckets) :]
+        income_prev = sum((m.income for m in previous_breakdown), Decimal("0"))
+        expense_prev = sum((m.expense for m in previous_breakdown), Decimal("0"))
+        income_curr = sum((m.income for m in current_breakdown), Decimal("0"))
+        expense_curr = sum((m.expense for m in current_breakdown), Decimal("0"))
+        total_prev = income_prev - expense_prev
+        total_curr = income_curr - expense_curr
+
+        # 3. Build summary
         difference = total_curr - total_prev
         if total_prev == 0:
             percentage_change = None
@@ -288,6 +316,8 @@ class ReportingService:
                 percentage_change_available=percentage_change_available,
                 trend=trend,
             ),
+            current_breakdown=current_breakdown if parameters.periods > 1 else [],
+            previous_breakdown=previous_breakdown if parameters.periods > 1 else [],
         )
 
     # -------------------------------------------------------------------------
@@ -329,6 +359,82 @@ class ReportingService:
             as_of=as_of_date, currency=currency, accounts=items, total=total
         )
 
+    def get_dashboard(
+        self,
+        user_id: UUID,
+        parameters: DashboardParameters,
+        currency: Optional[str] = None,
+    ) -> DashboardResponse:
+        """
+        Compute the requested home-screen widgets in one pass.
+
+        - balance and balance_accounts come from one BalanceEngine call (accounts
+          and snapshots/ledger loaded once).
+        - cashflow_summary and categories_summary come from one grouped
+          transaction scan over the period.
+        - recent_transactions is a separate indexed read of the latest rows.
+
+        `currency` (the user's base currency) is required for balance widgets.
+        """
+        widgets = set(parameters.widgets)
+        response = DashboardResponse()
+
+        if widgets & BALANCE_WIDGETS:
+            assert currency is not None  # checked by the route
+            as_of_date = parameters.as_of or date.today()
+            accounts_list, total = self.balance_engine.get_accounts_balance(
+                user_id, as_of_date, currency
+            )
+            if DashboardWidget.BALANCE in widgets:
+                response.balance = BalanceResponse(
+                    as_of=as_of_date, currency=currency, balance=total
+                )
+            if DashboardWidget.BALANCE_ACCOUNTS in widgets:
+                response.balance_accounts = BalanceAccountsResponse(
+                    as_of=as_of_date,
+                    currency=currency,
+                    accounts=[AccountBalanceItem(**a) for a in accounts_list],
+                    total=total,
+                )
+
+        if widgets & {
+            DashboardWidget.CASHFLOW_SUMMARY,
+            DashboardWidget.CATEGORIES_SUMMARY,
+        }:
+            if parameters.period is not None:
+                date_from, date_to = calculate_period_dates(parameters.period)
+            else:
+                date_from, date_to = parameters.date_from, parameters.date_to
+                assert date_from is not None and date_to is not None
+            by_category = self.transaction_service.get_cashflow_by_category(
+                user_id, date_from, date_to
+            )
+            if DashboardWidget.CASHFLOW_SUMMARY in widgets:
+                income = sum((c.income for c in by_category.values()), Decimal("0"))
+                expense = sum((c.expense for c in by_category.values()), Decimal("0"))
+                response.cashflow_summary = CashflowSummaryResponse(
+                    income=income, expense=expense, total=income - expense
+                )
+            if DashboardWidget.CATEGORIES_SUMMARY in widgets:
+                categories = self.category_service.get_by_user_id(user_id).results
+                response.categories_summary = self._build_category_summaries(
+                    categories,
+                    {
+                        category_id: CategoryAggregationData(
+                            net_signed_amount=c.income - c.expense,
+                            transaction_count=c.transaction_count,
+                        )
+                        for category_id, c in by_category.items()
+                    },
+                    parameters.full_list,
+                )
+
+        if DashboardWidget.RECENT_TRANSACTIONS in widgets:
+            response.recent_transactions = self.transaction_service.get_recent(
+                user_id, RecentTransactionsParams(limit=parameters.recent_limit)
+            )
+        return response
+
     def get_balance_history_response(
         self,
         user_id: UUID,
@@ -342,6 +448,44 @@ class ReportingService:
         Return balance history for charts or lists. Validates inputs and builds response.
         Uses BalanceEngine (O(1) queries).
         """
+        self._validate_balance_history(from_date, to_date, period)
+        points_data = self.balance_engine.get_balance_history(
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+            period=period.value,
+            base_currency=currency,
+            account_id=account_id,
+        )
+        return self._build_balance_history_response(currency, period, points_data)
+
+    async def get_balance_history_response_async(
+        self,
+        user_id: UUID,
+        from_date: date,
+        to_date: date,
+        currency: str,
+        period: TransactionSummaryPeriod = TransactionSummaryPeriod.DAY,
+        account_id: Optional[UUID] = None,
+    ) -> BalanceHistoryResponse:
+        """Same as get_balance_history_response, on AsyncBalanceEngine."""
+        if self.async_balance_engine is None:
+            raise RuntimeError("ReportingService has no AsyncBalanceEngine")
+        self._validate_balance_history(from_date, to_date, period)
+        points_data = await self.async_balance_engine.get_balance_history(
+            user_id=user_id,
+            from_date=from_date,
+            to_date=to_date,
+            period=period.value,
+            base_currency=currency,
+            account_id=account_id,
+        )
+        return self._build_balance_history_response(currency, period, points_data)
+
+    @staticmethod
+    def _validate_balance_history(
+        from_date: date, to_date: date, period: TransactionSummaryPeriod
+    ) -> None:
         if from_date > to_date:
             raise HTTPException(
                 status_code=422, detail="'from' must be before or equal to 'to'"
@@ -351,21 +495,17 @@ class ReportingService:
                 status_code=422,
                 detail="period must be one of: day, week, month (year not supported)",
             )
-        period_str = period.value
-        points_data = self.balance_engine.get_balance_history(
-            user_id=user_id,
-            from_date=from_date,
-            to_date=to_date,
-            period=period_str,
-            base_currency=currency,
-            account_id=account_id,
-        )
+
+    @staticmethod
+    def _build_balance_history_response(
+        currency: str, period: TransactionSummaryPeriod, points_data: List[dict]
+    ) -> BalanceHistoryResponse:
         points = [
             BalanceHistoryPoint(date=p["date"], balance=p["balance"])
             for p in points_data
         ]
         return BalanceHistoryResponse(
-            currency=currency, period=period_str, points=points
+            currency=currency, period=period.value, points=points
         )
 
     def _normalize_period_start(self, value: object) -> date:
@@ -410,6 +550,13 @@ class ReportingService:
             for bucket in bucket_dates
         }
 
+        fx_table = None
+        if parameters.currency is None:
+            fx_table = self.fx_service.rate_table(
+                {(row["currency"] or output_currency, output_currency) for row in rows},
+                bucket_dates,
+            )
+
         for row in rows:
             period_start = self._normalize_period_start(row["period_start"])
             if period_start not in aggregates:
@@ -418,12 +565,12 @@ class ReportingService:
             income = row["income"]
             expense_abs = row["expense_abs"]
 
-            if parameters.currency is None:
+            if fx_table is not None:
                 from_currency = row["currency"] or output_currency
-                income = self.fx_service.convert(
+                income = fx_table.convert(
                     income, from_currency, output_currency, period_start
                 )
-                expense_abs = self.fx_service.convert(
+                expense_abs = fx_table.convert(
                     expense_abs, from_currency, output_currency, period_start
                 )
 
@@ -1,31 +1,70 @@
+import csv
+import io
+import json
 import logging
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.entities.category import CategoryType
 from app.entities.concept import Concept
 from app.entities.tag import Tag
-from app.entities.transaction import Transaction, TransactionType
+from app.entities.transaction import (
+    Transaction,
+    TransactionSource,
+    TransactionType,
+)
+from app.repository.account_daily_balance_repository import (
+    AccountDailyBalanceRepository,
+)
 from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
+from app.repository.category_month_total_repository import (
+    CategoryMonthTotalRepository,
+    RollupKey,
+)
+from app.repository.daily_cashflow_total_repository import (
+    CashflowKey,
+    DailyCashflowTotalRepository,
+)
 from app.repository.transaction_repository import TransactionRepository
 from app.schemas.base_schemas import SearchResponse
 from app.schemas.category_schemas import CategoryResponseBase
 from app.schemas.concept_schemas import ConceptTransactionCreate
 from app.schemas.reporting_schemas import (
     CategoryAggregationData,
+    CategoryCashflowData,
     TransactionSummaryPeriod,
 )
 from app.schemas.tag_schemas import TagTransactionCreate
 from app.schemas.transaction_schemas import (
+    TRANSACTION_EXPORT_COLUMNS,
     AccountRelatedEntity,
     RecentTransactionsParams,
     RecentTransactionsResponse,
+    StatementFormat,
+    TransactionBulkCreate,
+    TransactionBulkResponse,
     TransactionCreate,
+    TransactionExportFormat,
+    TransactionImportParams,
+    TransactionImportResponse,
+    TransactionPageParams,
+    TransactionPageResponse,
     TransactionRelatedEntity,
     TransactionResponse,
     TransactionSearch,
@@ -38,13 +77,47 @@ from app.services.account_service import AccountService
 from app.services.base_service import BaseService
 from app.services.category_service import CategoryService
 from app.services.concept_service import ConceptService
+from app.services.reporting_cache_service import ReportingCacheService
 from app.services.tag_service import TagService
-from app.shared.helpers.date_helper import first_day_of_month
+from app.shared.helpers.cursor_helper import (
+    TransactionCursor,
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+)
+from app.shared.helpers.date_helper import (
+    align_period_start,
+    first_day_of_month,
+    split_whole_months,
+)
+from app.shared.helpers.money_helper import format_amount, to_minor
+from app.shared.helpers.statement_helper import (
+    StatementRow,
+    chunked,
+    iter_csv_statement,
+    iter_ofx_statement,
+    normalize_description,
+    statement_row_hash,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class LedgerEntry(NamedTuple):
+    """Signed amount of one transaction plus the keys of every projection it feeds."""
+
+    account_id: UUID
+    date: date
+    amount: Decimal
+    user_id: Optional[UUID] = None
+    category_id: Optional[UUID] = None
+    currency: Optional[str] = None
+    transaction_type: Optional[str] = None
+
+
 class TransactionService(BaseService[Transaction]):
+    # Rows parsed, deduped and inserted per round trip by import_statement
+    IMPORT_CHUNK_SIZE = 500
+
     def __init__(
         self,
         db: Session,
@@ -53,6 +126,16 @@ class TransactionService(BaseService[Transaction]):
         concept_service: ConceptService,
         tag_service: TagService,
         balance_snapshot_repository: Optional[BalanceSnapshotRepository] = None,
+        account_daily_balance_repository: Optional[
+            AccountDailyBalanceRepository
+        ] = None,
+        snapshot_invalidation_mode: str = "delta",
+        reporting_cache: Optional[ReportingCacheService] = None,
+        category_month_total_repository: Optional[CategoryMonthTotalRepository] = None,
+        daily_cashflow_total_repository: Optional[DailyCashflowTotalRepository] = None,
+        *,
+        category_rollup_reads: bool = False,
+        cashflow_rollup_reads: bool = False,
     ):
         repository = TransactionRepository(db)
         super().__init__(db, repository, Transaction)
@@ -60,8 +143,21 @@ class TransactionService(BaseService[Transaction]):
         self.category_service = category_service
         self.concept_service = concept_service
         self.tag_service = tag_service
-        # Optional: invalidate balance snapshots on edit/delete (reporting optimization)
+        # Optional: keep balance snapshots in sync on every write (reporting optimization)
         self.balance_snapshot_repository = balance_snapshot_repository
+        self.snapshot_invalidation_mode = snapshot_invalidation_mode
+        # Optional: running-balance ledger maintained on every write (reporting optimization)
+        self.account_daily_balance_repository = account_daily_balance_repository
+        # Optional: per-user reporting response cache, invalidated after each write
+        self.reporting_cache = reporting_cache
+        # Optional: category month rollup maintained on every write, and read by
+        # category summaries only once backfilled (category_rollup_reads)
+        self.category_month_total_repository = category_month_total_repository
+        self.category_rollup_reads = category_rollup_reads
+        # Optional: daily cashflow rollup maintained on every write, and read by
+        # cashflow history only once backfilled (cashflow_rollup_reads)
+        self.daily_cashflow_total_repository = daily_cashflow_total_repository
+        self.cashflow_rollup_reads = cashflow_rollup_reads
 
     def get(self, transaction_id: UUID, user_id: UUID) -> TransactionResponse:
         """Retrieve a transaction ensuring it belongs to the requesting user."""
@@ -85,6 +181,98 @@ class TransactionService(BaseService[Transaction]):
             logger.error(f"Error searching transactions: {str(e)}")
             raise HTTPException(status_code=500, detail="Error searching transactions")
 
+    def search_page(
+        self,
+        user_id: UUID,
+        search_params: TransactionSearch,
+        page: TransactionPageParams,
+    ) -> TransactionPageResponse:
+        """Keyset-paginated search; next_cursor is None on the last page."""
+        try:
+            after = (
+                decode_transaction_cursor(page.cursor)
+                if page.cursor is not None
+                else None
+            )
+            rows, has_more = self.repository.search_page(
+                user_id, search_params, page.limit, after
+            )
+            responses = [self._build_transaction_response(tx) for tx in rows]
+            next_cursor = None
+            if has_more and rows:
+                last = rows[-1]
+                next_cursor = encode_transaction_cursor(
+                    TransactionCursor(last.date, last.created_at, last.id)
+                )
+            return TransactionPageResponse(
+                total=len(responses), results=responses, next_cursor=next_cursor
+            )
+        except Exception as e:
+            logger.error(f"Error searching transactions: {str(e)}")
+            raise HTTPException(status_code=500, detail="Error searching transactions")
+
+    def export(
+        self,
+        user_id: UUID,
+        search_params: TransactionSearch,
+        export_format: TransactionExportFormat,
+        session_factory: Callable[[], Session],
+    ) -> Iterator[str]:
+        """
+        Stream filtered transactions as NDJSON lines or CSV rows.
+
+        Rows come straight from a server-side cursor and are serialized one at a
+        time; no ORM entities or TransactionResponse objects are built, so memory
+        stays flat regardless of ledger size. The cursor runs on its own session
+        from `session_factory`, opened and closed by the returned generator: the
+        request session may already be closed while the response streams.
+        """
+        db = session_factory()
+        try:
+            rows = TransactionRepository(db).iter_export_rows(user_id, search_params)
+            if export_format == TransactionExportFormat.CSV:
+                yield from self._iter_export_csv(rows)
+            else:
+                yield from self._iter_export_ndjson(rows)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _export_values(row: Any) -> List[Optional[str]]:
+        values: List[Optional[str]] = []
+        for column in TRANSACTION_EXPORT_COLUMNS:
+            value = getattr(row, column)
+            if value is None:
+                values.append(None)
+            elif column == "amount":
+                values.append(format_amount(value, row.account_currency))
+            elif isinstance(value, (date, datetime)):
+                values.append(value.isoformat())
+            else:
+                values.append(str(value))
+        return values
+
+    def _iter_export_ndjson(self, rows: Iterator[Any]) -> Iterator[str]:
+        for row in rows:
+            record = dict(zip(TRANSACTION_EXPORT_COLUMNS, self._export_values(row)))
+            yield json.dumps(record, separators=(",", ":")) + "\n"
+
+    def _iter_export_csv(self, rows: Iterator[Any]) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def _drain() -> str:
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return chunk
+
+        writer.writerow(TRANSACTION_EXPORT_COLUMNS)
+        yield _drain()
+        for row in rows:
+            writer.writerow(["" if v is None else v for v in self._export_values(row)])
+            yield _drain()
+
     def get_recent(
         self, user_id: UUID, params: RecentTransactionsParams
     ) -> RecentTransactionsResponse:
@@ -123,6 +311,8 @@ class TransactionService(BaseService[Transaction]):
 
         This method provides both aggregation and count data for category summaries efficiently.
         Net-signed means: income transactions add to the total, expense transactions subtract.
+        With the category month rollup enabled, whole months are read from the rollup and
+        only partial first/last months scan raw transactions.
 
         Args:
             user_id: User ID to filter transactions
@@ -138,10 +328,7 @@ class TransactionService(BaseService[Transaction]):
         Returns:
             Dictionary mapping category_id to CategoryAggregationData DTO
         """
-        return self.repository.get_net_signed_amounts_and_counts_by_category(
-            user_id=user_id,
-            date_from=date_from,
-            date_to=date_to,
+        raw_filters = dict(
             category_ids=category_ids,
             account_id=account_id,
             currency=currency,
@@ -149,6 +336,53 @@ class TransactionService(BaseService[Transaction]):
             amount_max=amount_max,
             source=source,
         )
+        # Per-row filters (amount range, source) are not rollup dimensions
+        rollup = self.category_month_total_repository
+        if not self.category_rollup_reads:
+            rollup = None
+        whole_months, edges = split_whole_months(date_from, date_to)
+        if (
+            not rollup
+            or whole_months is None
+            or amount_min is not None
+            or amount_max is not None
+            or source is not None
+        ):
+            return self.repository.get_net_signed_amounts_and_counts_by_category(
+                user_id=user_id, date_from=date_from, date_to=date_to, **raw_filters
+            )
+
+        # Whole months from the rollup; raw rows only for partial edge months
+        parts = [
+            rollup.get_net_signed_amounts_and_counts_by_category(
+                user_id,
+                whole_months[0],
+                whole_months[1],
+                category_ids,
+                account_id=account_id,
+                currency=currency,
+            )
+        ]
+        for edge_from, edge_to in edges:
+            parts.append(
+                self.repository.get_net_signed_amounts_and_counts_by_category(
+                    user_id=user_id, date_from=edge_from, date_to=edge_to, **raw_filters
+                )
+            )
+        merged: Dict[UUID, CategoryAggregationData] = {}
+        for part in parts:
+            for category_id, data in part.items():
+                current = merged.get(category_id)
+                if current is None:
+                    merged[category_id] = data
+                else:
+                    merged[category_id] = CategoryAggregationData(
+                        net_signed_amount=current.net_signed_amount
+                        + data.net_signed_amount,
+                        transaction_count=current.transaction_count
+                        + data.transaction_count,
+                    )
+        return merged
 
     def get_cashflow_summary(
         self,
@@ -180,6 +414,41 @@ class TransactionService(BaseService[Transaction]):
             source=source,
         )
 
+    def get_cashflow_by_category(
+        self, user_id: UUID, date_from: date, date_to: date
+    ) -> Dict[UUID, CategoryCashflowData]:
+        """Income, expense and count per category for a date range (one scan)."""
+        return self.repository.get_cashflow_by_category(
+            user_id=user_id, date_from=date_from, date_to=date_to
+        )
+
+    def get_cashflow_summaries(
+        self,
+        user_id: UUID,
+        ranges: List[tuple[date, date]],
+        category_ids: Optional[List[UUID]] = None,
+        *,
+        account_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        amount_min: Optional[Decimal] = None,
+        amount_max: Optional[Decimal] = None,
+        source: Optional[str] = None,
+    ) -> List[tuple[Decimal, Decimal, Decimal]]:
+        """
+        Get (income, expense, total) for several date ranges in a single query.
+        Same filters as get_cashflow_summary; results follow the order of ranges.
+        """
+        return self.repository.get_cashflow_summaries(
+            user_id=user_id,
+            ranges=ranges,
+            category_ids=category_ids,
+            account_id=account_id,
+            currency=currency,
+            amount_min=amount_min,
+            amount_max=amount_max,
+            source=source,
+        )
+
     def get_cashflow_history_grouped(
         self,
         user_id: UUID,
@@ -194,19 +463,58 @@ class TransactionService(BaseService[Transaction]):
         amount_max: Optional[Decimal] = None,
         source: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Thin wrapper delegating historical cashflow aggregation to repository."""
-        return self.repository.get_cashflow_history_grouped(
-            user_id=user_id,
-            date_from=date_from,
-            date_to=date_to,
-            period=period,
+        """
+        Historical cashflow rows grouped by period bucket and currency.
+
+        With the daily cashflow rollup enabled, day rows are read by index range
+        and folded into buckets here; per-row filters (amount range, source)
+        still group raw transactions in SQL.
+        """
+        rollup = self.daily_cashflow_total_repository
+        if not self.cashflow_rollup_reads:
+            rollup = None
+        if (
+            not rollup
+            or amount_min is not None
+            or amount_max is not None
+            or source is not None
+        ):
+            return self.repository.get_cashflow_history_grouped(
+                user_id=user_id,
+                date_from=date_from,
+                date_to=date_to,
+                period=period,
+                account_id=account_id,
+                category_id=category_id,
+                currency=currency,
+                amount_min=amount_min,
+                amount_max=amount_max,
+                source=source,
+            )
+
+        buckets: Dict[tuple[date, Optional[str]], Dict[str, Any]] = {}
+        for row in rollup.get_cashflow_by_day(
+            user_id,
+            date_from,
+            date_to,
             account_id=account_id,
             category_id=category_id,
             currency=currency,
-            amount_min=amount_min,
-            amount_max=amount_max,
-            source=source,
-        )
+        ):
+            period_start = align_period_start(row["day"], period)
+            key = (period_start, currency if currency is not None else row["currency"])
+            bucket = buckets.setdefault(
+                key,
+                {
+                    "period_start": period_start,
+                    "currency": key[1],
+                    "income": Decimal("0"),
+                    "expense_abs": Decimal("0"),
+                },
+            )
+            bucket["income"] += row["income"]
+            bucket["expense_abs"] += row["expense_abs"]
+        return sorted(buckets.values(), key=lambda b: b["period_start"])
 
     def get_net_signed_sum_for_account(
         self, account_id: UUID, date_from: date, date_to: date
@@ -243,25 +551,14 @@ class TransactionService(BaseService[Transaction]):
 
         if tags:
             self.repository.attach_tags(created_transaction, tags)
+        self._invalidate_reporting_cache(created_transaction.user_id)
 
         return self._build_transaction_response(created_transaction)
 
     def update(self, id: UUID, obj_in: Any, **kwargs: Any) -> TransactionResponse:
         """Update a transaction and return its response representation."""
-        # On edit: future balance snapshots must be invalidated (reporting optimization)
-        old_transaction = self.repository.get(id)
         updated_transaction = super().update(id, obj_in, **kwargs)
-        if self.balance_snapshot_repository:
-            if old_transaction:
-                from_date_old = first_day_of_month(old_transaction.date)
-                self.balance_snapshot_repository.delete_future_snapshots(
-                    old_transaction.account_id, from_date_old
-                )
-            from_date_new = first_day_of_month(updated_transaction.date)
-            self.balance_snapshot_repository.delete_future_snapshots(
-                updated_transaction.account_id, from_date_new
-            )
-            self.db.commit()
+        self._invalidate_reporting_cache(updated_transaction.user_id)
         return self._build_transaction_response(updated_transaction)
 
     def create_transfer_transaction(
@@ -316,9 +613,12 @@ class TransactionService(BaseService[Transaction]):
         to_transaction = obj_in.build_to_transaction(
             user_id, transfer_id, transfer_category.id
         )
-        # Add transactions to database
+        # Add transactions to database (ledger deltas are committed with each leg)
+        self._apply_ledger_entries(added=[self._ledger_entry(from_transaction)])
         created_from_transaction = self.repository.add(from_transaction)
+        self._apply_ledger_entries(added=[self._ledger_entry(to_transaction)])
         created_to_transaction = self.repository.add(to_transaction)
+        self._invalidate_reporting_cache(user_id)
 
         # Refresh transactions to ensure relationships are loaded
         self.db.refresh(created_from_transaction)
@@ -334,6 +634,253 @@ class TransactionService(BaseService[Transaction]):
             to_transaction=to_response,
         )
 
+    def create_bulk(
+        self, payload: TransactionBulkCreate, *, user_id: UUID
+    ) -> TransactionBulkResponse:
+        """
+        Create many transactions in one unit of work.
+
+        Ownership of every referenced account, category, concept and tag is
+        checked with one IN query per entity; rows are inserted with
+        executemany and committed once. All-or-nothing: any invalid row rejects
+        the whole batch.
+        """
+        items = payload.transactions
+        valid_types = {t.value for t in TransactionType}
+        current_date = datetime.now(timezone.utc).date()
+        for index, item in enumerate(items):
+            if item.type not in valid_types:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid transaction type at index {index}",
+                )
+            if item.amount == 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Transaction amount cannot be zero at index {index}",
+                )
+            if item.date > current_date:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Transaction date cannot be in the future at index {index}",
+                )
+
+        currencies = self.account_service.repository.get_currencies_for_user(
+            user_id, {item.account_id for item in items}
+        )
+        owned_categories = self.category_service.repository.get_owned_ids(
+            user_id, {item.category_id for item in items}
+        )
+        owned_concepts = self.concept_service.repository.get_owned_ids(
+            user_id, {item.concept_id for item in items if item.concept_id}
+        )
+        owned_tags = self.tag_service.repository.get_owned_ids(
+            user_id, {tag_id for item in items for tag_id in item.tag_ids or []}
+        )
+
+        now = datetime.now(timezone.utc)
+        rows: List[dict] = []
+        tag_links: List[dict] = []
+        entries: List[LedgerEntry] = []
+        for index, item in enumerate(items):
+            if item.account_id not in currencies:
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Account not found or access denied at index {index}",
+                )
+            if item.category_id not in owned_categories:
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Category not found or access denied at index {index}",
+                )
+            if item.concept_id and item.concept_id not in owned_concepts:
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Concept not found or access denied at index {index}",
+                )
+            tag_ids = list(dict.fromkeys(item.tag_ids or []))
+            if any(tag_id not in owned_tags for tag_id in tag_ids):
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Tag not found or access denied at index {index}",
+                )
+
+            row = self._bulk_row(
+                user_id,
+                item.account_id,
+                item.category_id,
+                item.type,
+                item.amount,
+                item.date,
+                account_currency=currencies[item.account_id],
+                created_at=now,
+                concept_id=item.concept_id,
+                currency=item.currency,
+                source=item.source,
+            )
+            rows.append(row)
+            tag_links.extend(
+                {"id": uuid4(), "transaction_id": row["id"], "tag_id": tag_id}
+                for tag_id in tag_ids
+            )
+            entries.append(
+                self._signed_entry(
+                    item.account_id,
+                    item.date,
+                    item.amount,
+                    item.type,
+                    user_id=user_id,
+                    category_id=item.category_id,
+                    currency=item.currency,
+                )
+            )
+
+        try:
+            self.repository.insert_many(rows, tag_links)
+            self._apply_bulk_ledger_entries(entries)
+            self.db.commit()
+        except SQLAlchemyError as exc:
+            self.db.rollback()
+            logger.error(f"Database error in create_bulk for user {user_id}: {exc}")
+            raise HTTPException(
+                status_code=500, detail="Error creating transactions"
+            ) from exc
+
+        logger.info(f"Bulk created {len(rows)} transaction(s) for user {user_id}")
+        self._invalidate_reporting_cache(user_id)
+        return TransactionBulkResponse(
+            created=len(rows), ids=[row["id"] for row in rows]
+        )
+
+    def import_statement(
+        self,
+        lines: Iterable[str],
+        params: TransactionImportParams,
+        *,
+        user_id: UUID,
+    ) -> TransactionImportResponse:
+        """
+        Stream a CSV/OFX bank statement into the account, one bulk insert per chunk.
+
+        Positive amounts become income, negative ones expense. Payees map to the
+        user's concepts by normalized name. Rows whose statement_row_hash already
+        exists on the account are skipped, so re-importing an overlapping
+        statement is idempotent; each chunk commits on its own, and a failed
+        import can simply be re-run. Identical rows (same date, amount and
+        description) within one statement are all kept: each hashes with its
+        occurrence index, so only rows sharing an OFX FITID collapse into one.
+        """
+        account_id = params.account_id
+        currencies = self.account_service.repository.get_currencies_for_user(
+            user_id, [account_id]
+        )
+        if account_id not in currencies:
+            raise HTTPException(
+                status_code=403, detail="Account not found or access denied"
+            )
+        if params.category_id not in self.category_service.repository.get_owned_ids(
+            user_id, [params.category_id]
+        ):
+            raise HTTPException(
+                status_code=403, detail="Category not found or access denied"
+            )
+
+        parse = (
+            iter_ofx_statement
+            if params.format == StatementFormat.OFX
+            else iter_csv_statement
+        )
+        concept_index = self.concept_service.repository.get_name_index(user_id)
+        current_date = datetime.now(timezone.utc).date()
+        imported = skipped = 0
+        # Identical rows seen so far in this statement, keyed by content.
+        occurrences: Dict[Tuple[date, Decimal, str], int] = {}
+        try:
+            for chunk in chunked(parse(lines), self.IMPORT_CHUNK_SIZE):
+                hashed: Dict[str, StatementRow] = {}
+                for row in chunk:
+                    row_date, amount, description, _ = row
+                    if row_date > current_date:
+                        raise ValueError(
+                            f"Transaction date cannot be in the future: {row_date}"
+                        )
+                    if amount == 0:
+                        continue
+                    content = (row_date, amount, normalize_description(description))
+                    occurrence = occurrences.get(content, 0)
+                    occurrences[content] = occurrence + 1
+                    hashed.setdefault(
+                        statement_row_hash(account_id, row, occurrence), row
+                    )
+                existing = self.repository.get_existing_import_hashes(
+                    account_id, hashed.keys()
+                )
+                skipped += len(chunk) - len(hashed) + len(existing)
+                now = datetime.now(timezone.utc)
+                rows: List[dict] = []
+                for import_hash, (row_date, amount, description, _) in hashed.items():
+                    if import_hash in existing:
+                        continue
+                    transaction_type = TransactionType.EXPENSE
+                    if amount > 0:
+                        transaction_type = TransactionType.INCOME
+                    row = self._bulk_row(
+                        user_id,
+                        account_id,
+                        params.category_id,
+                        transaction_type.value,
+                        abs(amount),
+                        row_date,
+                        account_currency=currencies[account_id],
+                        created_at=now,
+                        concept_id=concept_index.get(
+                            normalize_description(description)
+                        ),
+                        currency=currencies[account_id],
+                        source=TransactionSource.IMPORT.value,
+                    )
+                    row["import_hash"] = import_hash
+                    rows.append(row)
+                if not rows:
+                    continue
+                try:
+                    self.repository.insert_many(rows, [])
+                    self._apply_bulk_ledger_entries(
+                        [
+                            self._signed_entry(
+                                account_id,
+                                row["date"],
+                                row["amount"],
+                                row["type"],
+                                user_id=user_id,
+                                category_id=row["category_id"],
+                                currency=row["currency"],
+                            )
+                            for row in rows
+                        ]
+                    )
+                    self.db.commit()
+                except SQLAlchemyError as exc:
+                    self.db.rollback()
+                    logger.error(
+                        f"Database error in import_statement for user {user_id}: {exc}"
+                    )
+                    raise HTTPException(
+                        status_code=500, detail="Error importing transactions"
+                    ) from exc
+                imported += len(rows)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        finally:
+            if imported:
+                self._invalidate_reporting_cache(user_id)
+
+        logger.info(
+            f"Imported {imported} transaction(s) into account {account_id} "
+            f"for user {user_id}; skipped {skipped}"
+        )
+        return TransactionImportResponse(imported=imported, skipped=skipped)
+
     def before_create(self, obj_in: Transaction, **kwargs: Any) -> bool:
         """Validate transaction before creation"""
         # Validate transaction type before other business rules
@@ -397,6 +944,9 @@ class TransactionService(BaseService[Transaction]):
                 status_code=400, detail="Transaction date cannot be in the future"
             )
 
+        # Flushed now, committed together with the insert by repository.add
+        self._apply_ledger_entries(added=[self._ledger_entry(obj_in)])
+
         return True
 
     def before_update(self, id: UUID, obj_in: Any, **kwargs: Any) -> bool:
@@ -465,6 +1015,19 @@ class TransactionService(BaseService[Transaction]):
             if type_value not in valid_types:
                 raise HTTPException(status_code=400, detail="Invalid transaction type")
 
+        # Move the entry on the ledger and future balance snapshots. Flushed now,
+        # committed together with the row by repository.update.
+        if (
+            self.account_daily_balance_repository
+            or self.balance_snapshot_repository
+            or self.category_month_total_repository
+            or self.daily_cashflow_total_repository
+        ):
+            self._apply_ledger_entries(
+                removed=[self._ledger_entry(existing_transaction)],
+                added=[self._updated_ledger_entry(existing_transaction, obj_in)],
+            )
+
         return True
 
     def before_delete(self, id: UUID, **kwargs: Any) -> Transaction:
@@ -485,16 +1048,14 @@ class TransactionService(BaseService[Transaction]):
                     "Use DELETE /transactions/transfer/{transfer_id}."
                 ),
             )
-        # On delete: future balance snapshots must be invalidated (reporting optimization)
-        if self.balance_snapshot_repository:
-            from_date = first_day_of_month(existing_transaction.date)
-            self.balance_snapshot_repository.delete_future_snapshots(
-                existing_transaction.account_id, from_date
-            )
+        # On delete: reverse the entry on the ledger and future balance snapshots
+        self._apply_ledger_entries(removed=[self._ledger_entry(existing_transaction)])
         return existing_transaction
 
     def delete(self, id: UUID, **kwargs: Any) -> Transaction:
-        return super().delete(id, **kwargs)
+        deleted_transaction = super().delete(id, **kwargs)
+        self._invalidate_reporting_cache(deleted_transaction.user_id)
+        return deleted_transaction
 
     def delete_transfer(self, transfer_id: UUID, **kwargs: Any) -> None:
         """Delete both transactions in a transfer pair."""
@@ -525,15 +1086,13 @@ class TransactionService(BaseService[Transaction]):
 
         try:
             for t in transactions:
-                if self.balance_snapshot_repository:
-                    self.balance_snapshot_repository.delete_future_snapshots(
-                        t.account_id, first_day_of_month(t.date)
-                    )
+                self._apply_ledger_entries(removed=[self._ledger_entry(t)])
                 self.repository.delete(t.id, auto_commit=False)
             self.db.commit()
         except Exception:
             self.db.rollback()
             raise
+        self._invalidate_reporting_cache(user_id)
 
     def update_transfer(
         self, transfer_id: UUID, obj_in: TransferUpdate, **kwargs: Any
@@ -605,11 +1164,11 @@ class TransactionService(BaseService[Transaction]):
                 status_code=400, detail="From and to account cannot be the same"
             )
 
-        # Save old state before updating for snapshot invalidation
-        old_from_account_id = from_transaction.account_id
-        old_from_date = from_transaction.date
-        old_to_account_id = to_transaction.account_id
-        old_to_date = to_transaction.date
+        # Save old state before updating for ledger and snapshot patching
+        old_entries = [
+            self._ledger_entry(from_transaction),
+            self._ledger_entry(to_transaction),
+        ]
 
         try:
             updated_from = self.repository.update(
@@ -631,24 +1190,19 @@ class TransactionService(BaseService[Transaction]):
                 auto_commit=False,
             )
 
-            if self.balance_snapshot_repository:
-                self.balance_snapshot_repository.delete_future_snapshots(
-                    old_from_account_id, first_day_of_month(old_from_date)
-                )
-                self.balance_snapshot_repository.delete_future_snapshots(
-                    old_to_account_id, first_day_of_month(old_to_date)
-                )
-                self.balance_snapshot_repository.delete_future_snapshots(
-                    updated_from.account_id, first_day_of_month(updated_from.date)
-                )
-                self.balance_snapshot_repository.delete_future_snapshots(
-                    updated_to.account_id, first_day_of_month(updated_to.date)
-                )
+            self._apply_ledger_entries(
+                removed=old_entries,
+                added=[
+                    self._ledger_entry(updated_from),
+                    self._ledger_entry(updated_to),
+                ],
+            )
 
             self.db.commit()
         except Exception:
             self.db.rollback()
             raise
+        self._invalidate_reporting_cache(user_id)
 
         self.db.refresh(updated_from)
         self.db.refresh(updated_to)
@@ -659,6 +1213,218 @@ class TransactionService(BaseService[Transaction]):
             to_transaction=self._build_transaction_response(updated_to),
         )
 
+    @staticmethod
+    def _signed_entry(
+        account_id: UUID,
+        transaction_date: Any,
+        amount: Any,
+        transaction_type: str,
+        *,
+        user_id: Optional[UUID] = None,
+        category_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+    ) -> LedgerEntry:
+        signed = Decimal(str(amount))
+        if transaction_type != TransactionType.INCOME.value:
+            signed = -signed
+        if isinstance(transaction_date, datetime):
+            transaction_date = transaction_date.date()
+        return LedgerEntry(
+            account_id,
+            transaction_date,
+            signed,
+            user_id,
+            category_id,
+            currency,
+            transaction_type,
+        )
+
+    @classmethod
+    def _ledger_entry(cls, transaction: Transaction) -> LedgerEntry:
+        """Signed ledger entry of a transaction; income adds, expense subtracts."""
+        return cls._signed_entry(
+            transaction.account_id,
+            transaction.date,
+            transaction.amount,
+            transaction.type,
+            user_id=transaction.user_id,
+            category_id=transaction.category_id,
+            currency=transaction.currency,
+        )
+
+    @classmethod
+    def _updated_ledger_entry(
+        cls, transaction: Transaction, obj_in: Any
+    ) -> LedgerEntry:
+        """Ledger entry after repository.update applies the non-None fields of obj_in."""
+
+        def _field(name: str) -> Any:
+            value = getattr(obj_in, name, None)
+            return getattr(transaction, name) if value is None else value
+
+        return cls._signed_entry(
+            _field("account_id"),
+            _field("date"),
+            _field("amount"),
+            _field("type"),
+            user_id=transaction.user_id,
+            category_id=_field("category_id"),
+            currency=_field("currency"),
+        )
+
+    def _apply_ledger_entries(
+        self,
+        *,
+        removed: Optional[List[LedgerEntry]] = None,
+        added: Optional[List[LedgerEntry]] = None,
+    ) -> None:
+        """
+        Reverse `removed` and apply `added` on the running-balance ledger, on
+        balance snapshots and on the category month rollup (no commit; lands in
+        the same unit of work as the write).
+        """
+        for entry in removed or []:
+            self._apply_ledger_delta(entry.account_id, entry.date, -entry.amount)
+        for entry in added or []:
+            self._apply_ledger_delta(entry.account_id, entry.date, entry.amount)
+        self._apply_rollup_entries(removed=removed, added=added)
+
+    def _apply_rollup_entries(
+        self,
+        *,
+        removed: Optional[List[LedgerEntry]] = None,
+        added: Optional[List[LedgerEntry]] = None,
+    ) -> None:
+        """
+        Fold entries into one (net_amount, count) delta per category month and
+        one (income, expense_abs) delta per cashflow day.
+        """
+        monthly = self.category_month_total_repository
+        daily = self.daily_cashflow_total_repository
+        if not monthly and not daily:
+            return
+        month_deltas: Dict[RollupKey, tuple[Decimal, int]] = {}
+        day_deltas: Dict[CashflowKey, tuple[Decimal, Decimal]] = {}
+        for entries, sign in ((removed or [], -1), (added or [], 1)):
+            for entry in entries:
+                if entry.category_id is None:
+                    continue
+                month_key = (
+                    entry.user_id,
+                    entry.category_id,
+                    entry.account_id,
+                    first_day_of_month(entry.date),
+                    entry.currency,
+                )
+                amount, count = month_deltas.get(month_key, (Decimal("0"), 0))
+                month_deltas[month_key] = (amount + sign * entry.amount, count + sign)
+
+                day_key = (
+                    entry.user_id,
+                    entry.account_id,
+                    entry.category_id,
+                    entry.currency,
+                    entry.date,
+                )
+                income, expense_abs = day_deltas.get(
+                    day_key, (Decimal("0"), Decimal("0"))
+                )
+                # entry.amount is signed; cashflow columns hold stored amounts
+                if entry.transaction_type == TransactionType.INCOME.value:
+                    income += sign * entry.amount
+                else:
+                    expense_abs -= sign * entry.amount
+                day_deltas[day_key] = (income, expense_abs)
+        if monthly:
+            monthly.apply_deltas(month_deltas)
+        if daily:
+            daily.apply_deltas(day_deltas)
+
+    def _apply_ledger_delta(
+        self, account_id: UUID, entry_date: date, delta: Decimal
+    ) -> None:
+        if self.account_daily_balance_repository:
+            self.account_daily_balance_repository.apply_delta(
+                account_id, entry_date, delta
+            )
+        if not self.balance_snapshot_repository:
+            return
+        if self.snapshot_invalidation_mode == "delete":
+            self.balance_snapshot_repository.delete_future_snapshots(
+                account_id, first_day_of_month(entry_date)
+            )
+        else:
+            self.balance_snapshot_repository.apply_delta(account_id, entry_date, delta)
+
+    @staticmethod
+    def _bulk_row(
+        user_id: UUID,
+        account_id: UUID,
+        category_id: UUID,
+        transaction_type: str,
+        amount: Decimal,
+        transaction_date: date,
+        *,
+        account_currency: Optional[str],
+        created_at: datetime,
+        concept_id: Optional[UUID] = None,
+        currency: Optional[str] = None,
+        source: str = TransactionSource.MANUAL.value,
+    ) -> dict:
+        """
+        Column dict for TransactionRepository.insert_many.
+
+        Core inserts skip the mapper's before_insert hook, so amount_minor is
+        derived here from the account currency.
+        """
+        return {
+            "id": uuid4(),
+            "user_id": user_id,
+            "account_id": account_id,
+            "category_id": category_id,
+            "concept_id": concept_id,
+            "type": transaction_type,
+            "amount": amount,
+            "amount_minor": to_minor(amount, account_currency),
+            "currency": currency,
+            "date": transaction_date,
+            "source": source,
+            "created_at": created_at,
+            "updated_at": None,
+        }
+
+    def _apply_bulk_ledger_entries(self, entries: List[LedgerEntry]) -> None:
+        """
+        Ledger, snapshot and rollup upkeep for a batch of added entries.
+
+        The ledger gets one delta per (account, day) and the rollup one per
+        category month, rather than per row. Snapshots are invalidated once per
+        account from the month of its earliest new entry; the month-end job
+        rebuilds them.
+        """
+        daily: Dict[tuple[UUID, date], Decimal] = {}
+        earliest: Dict[UUID, date] = {}
+        for account_id, entry_date, signed, *_ in entries:
+            key = (account_id, entry_date)
+            daily[key] = daily.get(key, Decimal("0")) + signed
+            if account_id not in earliest or entry_date < earliest[account_id]:
+                earliest[account_id] = entry_date
+        self._apply_rollup_entries(added=entries)
+        if self.account_daily_balance_repository:
+            for (account_id, entry_date), delta in sorted(daily.items()):
+                self.account_daily_balance_repository.apply_delta(
+                    account_id, entry_date, delta
+                )
+        if self.balance_snapshot_repository:
+            for account_id, entry_date in earliest.items():
+                self.balance_snapshot_repository.delete_future_snapshots(
+                    account_id, first_day_of_month(entry_date)
+                )
+
+    def _invalidate_reporting_cache(self, user_id: UUID) -> None:
+        if self.reporting_cache:
+            self.reporting_cache.bump_generation(user_id)
+
     def _build_search_response(
         self, transactions: List[Transaction]
     ) -> SearchResponse[TransactionResponse]:
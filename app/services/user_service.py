@@ -1,18 +1,60 @@
 from typing import Any, Optional, cast
+from uuid import UUID
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from app.entities.user import User
 from app.repository.user_repository import UserRepository
 from app.services.base_service import BaseService
+from app.shared.helpers.cache_helper import TTLCache
 
 
 class UserService(BaseService[User]):
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, user_cache: Optional[TTLCache] = None) -> None:
         repository = UserRepository(db)
         super().__init__(db, repository, User)
+        # Optional: short-TTL cache of authenticated users, keyed by token sub
+        self.user_cache = user_cache
 
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address"""
         result = self.repository.get_by_email(email)
         return cast(Optional[User], result)
+
+    def get_authenticated(self, user_id: UUID) -> User:
+        """
+        Get the user behind a verified token.
+
+        With the user cache enabled, hits skip the database and return a detached
+        copy of the row (column attributes only; relationships are not loaded).
+        """
+        if self.user_cache is None:
+            return self.get(user_id)
+        cached = self.user_cache.get(user_id)
+        if cached is not None:
+            return cast(User, cached)
+        user = self.get(user_id)
+        self.user_cache.set(user_id, self._detached_copy(user))
+        return user
+
+    def update(self, id: UUID, obj_in: User, **kwargs: Any) -> User:
+        result = super().update(id, obj_in, **kwargs)
+        self._invalidate_user_cache(id)
+        return result
+
+    def delete(self, id: UUID, **kwargs: Any) -> User:
+        result = super().delete(id, **kwargs)
+        self._invalidate_user_cache(id)
+        return result
+
+    def _invalidate_user_cache(self, user_id: UUID) -> None:
+        if self.user_cache is not None:
+            self.user_cache.delete(user_id)
+
+    @staticmethod
+    def _detached_copy(user: User) -> User:
+        """Transient User with the loaded column values, safe to share across sessions."""
+        return User(
+            **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        )
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Protocol, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache with an optional per-entry TTL.
+
+    Process-local: each worker keeps its own copy, so entries must be safe to
+    serve for up to `ttl_seconds` after the source data changes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class CacheBackend(Protocol):
+    """Minimal string key/value store used for shared response caching."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """CacheBackend over a process-local TTLCache (one copy per worker)."""
+
+    def __init__(self, maxsize: int, ttl_seconds: Optional[float] = None):
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        self._cache.set(key, value, ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class LocalRedisClient:
+    """
+    In-process stand-in for the subset of the redis-py client used by
+    RedisCacheBackend (get / set with ex / delete). For tests only; not shared
+    across processes. Evicts least recently used keys beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        self._cache = TTLCache(maxsize=maxsize, clock=clock)
+
+    def get(self, name: str) -> Optional[bytes]:
+        return self._cache.get(name)
+
+    def set(self, name: str, value: str, ex: Optional[int] = None) -> bool:
+        self._cache.set(name, value.encode("utf-8"), ex)
+        return True
+
+    def delete(self, *names: str) -> int:
+        deleted = 0
+        for name in names:
+            if name in self._cache:
+                self._cache.delete(name)
+                deleted += 1
+        return deleted
+
+
+class RedisCacheBackend:
+    """CacheBackend over a Redis-compatible client (shared across workers)."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        """Connect with redis-py (the `redis` extra)."""
+        if not url:
+            raise ValueError("REDIS_URL is required for the redis cache backend")
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "The redis package is required for REDIS_URL; install the redis "
+                "extra (pip install '.[redis]')"
+            ) from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        self.client.set(key, value, ex=ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+
+class TransactionCursor(NamedTuple):
+    """Keyset position in the (date DESC, created_at DESC, id DESC) ordering."""
+
+    date: date
+    created_at: Optional[datetime]
+    id: UUID
+
+
+def encode_transaction_cursor(cursor: TransactionCursor) -> str:
+    """Encode a keyset position as an opaque, URL-safe token."""
+    payload = {
+        "d": cursor.date.isoformat(),
+        "c": cursor.created_at.isoformat() if cursor.created_at else None,
+        "i": str(cursor.id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_transaction_cursor(token: str) -> TransactionCursor:
+    """
+    Decode a token produced by encode_transaction_cursor.
+
+    Raises ValueError if the token is malformed so schema validation can
+    surface it as a 422.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at = payload["c"]
+        return TransactionCursor(
+            date=date.fromisoformat(payload["d"]),
+            created_at=(
+                datetime.fromisoformat(created_at) if created_at is not None else None
+            ),
+            id=UUID(payload["i"]),
+        )
+    except (binascii.Error, UnicodeError, TypeError, KeyError, ValueError) as exc:
+        raise ValueError("Invalid cursor.") from exc
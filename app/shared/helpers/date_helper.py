@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import TYPE_CHECKING, Iterator, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from app.schemas.reporting_schemas import TransactionSummaryPeriod
@@ -12,6 +12,42 @@ def first_day_of_month(d: date) -> date:
     return d.replace(day=1)
 
 
+def last_day_of_month(d: date) -> date:
+    """Last day of the month for date d."""
+    if d.month == 12:
+        return date(d.year, 12, 31)
+    return date(d.year, d.month + 1, 1) - timedelta(days=1)
+
+
+def split_whole_months(
+    date_from: date, date_to: date
+) -> Tuple[Optional[Tuple[date, date]], List[Tuple[date, date]]]:
+    """
+    Split [date_from, date_to] into whole calendar months and partial edges.
+
+    Returns (whole, edges): whole is (first_month, last_month) as first days of
+    month, or None when no month is fully covered; edges are the remaining
+    inclusive (from, to) ranges, at most one before and one after the months.
+    """
+    if date_from > date_to:
+        return None, []
+    first_month = first_day_of_month(date_from)
+    if first_month < date_from:
+        first_month = last_day_of_month(date_from) + timedelta(days=1)
+    last_month = first_day_of_month(date_to)
+    if last_day_of_month(date_to) > date_to:
+        last_month = first_day_of_month(last_month - timedelta(days=1))
+    if first_month > last_month:
+        return None, [(date_from, date_to)]
+
+    edges: List[Tuple[date, date]] = []
+    if date_from < first_month:
+        edges.append((date_from, first_month - timedelta(days=1)))
+    if date_to > last_day_of_month(last_month):
+        edges.append((last_day_of_month(last_month) + timedelta(days=1), date_to))
+    return (first_month, last_month), edges
+
+
 def iter_dates(from_date: date, to_date: date, period: str) -> Iterator[date]:
     """
     Yield dates from from_date to to_date (inclusive) following the given period.
@@ -163,6 +199,40 @@ def next_period_start(value: date, period: TransactionSummaryPeriod) -> date:
     raise ValueError(f"Unsupported period '{period.value}'")
 
 
+def previous_period_start(value: date, period: TransactionSummaryPeriod) -> date:
+    """Return previous bucket start for the given period (value must be aligned)."""
+    from app.schemas.reporting_schemas import TransactionSummaryPeriod
+
+    if period == TransactionSummaryPeriod.DAY:
+        return value - timedelta(days=1)
+    if period == TransactionSummaryPeriod.WEEK:
+        return value - timedelta(days=7)
+    if period == TransactionSummaryPeriod.MONTH:
+        if value.month == 1:
+            return date(value.year - 1, 12, 1)
+        return date(value.year, value.month - 1, 1)
+    if period == TransactionSummaryPeriod.YEAR:
+        return date(value.year - 1, 1, 1)
+    raise ValueError(f"Unsupported period '{period.value}'")
+
+
+def build_trailing_periods(
+    last_start: date, period: TransactionSummaryPeriod, count: int
+) -> List[Tuple[date, date]]:
+    """
+    Build `count` consecutive inclusive (start, end) buckets ending with the bucket
+    that starts at `last_start`, oldest first.
+    """
+    starts = [align_period_start(last_start, period)]
+    while len(starts) < count:
+        starts.append(previous_period_start(starts[-1], period))
+    starts.reverse()
+    return [
+        (start, next_period_start(start, period) - timedelta(days=1))
+        for start in starts
+    ]
+
+
 def build_period_buckets(
     date_from: date, date_to: date, period: TransactionSummaryPeriod
 ) -> list[date]:
@@ -0,0 +1,44 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Clients may cache the body but must revalidate with If-None-Match before use.
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: Any) -> str:
+    """Weak ETag over JSON-serializable parts (dates, UUIDs and tuples included)."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return f'W/"{hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def apply_etag(
+    request: Request, response: Response, etag: Optional[str]
+) -> Optional[Response]:
+    """
+    Attach the ETag to the response. Returns a bodyless 304 when the request's
+    If-None-Match already matches; the route should return it as-is. A None
+    ETag (conditional GETs disabled) leaves the response untouched.
+    """
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import csv
+import json
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Tuple
+
+FxRateRecord = Tuple[str, str, date, Decimal]
+
+FX_RATE_FIELDS = ("base", "quote", "date", "rate")
+
+
+def _parse_record(raw: Mapping[str, Any], position: str) -> FxRateRecord:
+    try:
+        base = str(raw["base"]).strip().upper()
+        quote = str(raw["quote"]).strip().upper()
+        rate_date = date.fromisoformat(str(raw["date"]).strip()[:10])
+        rate = Decimal(str(raw["rate"]).strip())
+    except (KeyError, ValueError, InvalidOperation) as exc:
+        raise ValueError(f"Invalid FX rate at {position}: {exc}") from exc
+    if not base or not quote or base == quote:
+        raise ValueError(f"Invalid FX rate at {position}: bad currency pair")
+    if not rate.is_finite() or rate <= 0:
+        raise ValueError(f"Invalid FX rate at {position}: rate must be positive")
+    return (base, quote, rate_date, rate)
+
+
+def parse_fx_rates(records: Iterable[Mapping[str, Any]]) -> List[FxRateRecord]:
+    return [_parse_record(r, f"record {i}") for i, r in enumerate(records, start=1)]
+
+
+def read_fx_rates_file(path: str | Path) -> List[FxRateRecord]:
+    """
+    Read (base, quote, date, rate) records from a local CSV or JSON file.
+
+    CSV needs a header with base,quote,date,rate. JSON is a list of objects with
+    the same keys, or {"rates": [...]}. Rates are parsed from their text form so
+    they stay Decimal-exact. Raises ValueError on the first invalid record.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        payload = json.loads(path.read_text(encoding="utf-8"), parse_float=str)
+        records = payload.get("rates", []) if isinstance(payload, dict) else payload
+        return parse_fx_rates(records)
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = set(FX_RATE_FIELDS) - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Missing CSV columns: {', '.join(sorted(missing))}")
+        # Line numbers are 1-based and include the header row.
+        return [
+            _parse_record(row, f"line {i}") for i, row in enumerate(reader, start=2)
+        ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Optional
+
+# ISO 4217 minor-unit exponents that differ from the default of 2.
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "BHD": 3,
+    "CLP": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "PYG": 0,
+    "TND": 3,
+    "UGX": 0,
+    "VND": 0,
+}
+DEFAULT_EXPONENT = 2
+
+
+def currency_exponent(currency: Optional[str]) -> int:
+    """Number of minor-unit digits for a currency (2 when unknown or missing)."""
+    if not currency:
+        return DEFAULT_EXPONENT
+    return CURRENCY_EXPONENTS.get(currency.upper(), DEFAULT_EXPONENT)
+
+
+def to_minor(amount: Decimal, currency: Optional[str]) -> int:
+    """
+    Amount in integer minor units of currency (e.g. cents).
+
+    Sub-minor fractions are rounded half away from zero, matching SQL ROUND on
+    NUMERIC so backfilled and newly written values agree.
+    """
+    exponent = currency_exponent(currency)
+    scaled = Decimal(str(amount)).scaleb(exponent)
+    return int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def from_minor(minor: int, currency: Optional[str]) -> Decimal:
+    """Decimal amount for integer minor units, at the currency's exponent."""
+    return Decimal(minor) / (10 ** currency_exponent(currency))
+
+
+def format_amount(amount: Decimal, currency: Optional[str]) -> str:
+    """
+    Plain decimal string with at least the currency's minor-unit digits.
+
+    Never rounds: digits beyond the exponent (or a driver's padded scale) are
+    kept when significant and dropped when zero.
+    """
+    value = Decimal(str(amount)).normalize()
+    places = max(currency_exponent(currency), -int(value.as_tuple().exponent))
+    return f"{value:.{places}f}"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, List, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+T = TypeVar("T")
+
+_SESSION_INFO_KEY = "request_cache"
+
+
+class RequestCache:
+    """
+    Identity map of reference collections (a user's accounts, categories) for one
+    unit of work.
+
+    Bound to a Session, which the API opens per request, so every repository and
+    service built on that session shares one instance and each collection is
+    loaded at most once per request. Any write through the session (flush, ORM
+    bulk UPDATE/DELETE/INSERT) or a rollback clears it, so reads after a write
+    in the same request see the new rows.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[Hashable, List[Any]] = {}
+
+    @classmethod
+    def for_session(cls, db: Session) -> "RequestCache":
+        """The session's cache, created and hooked to its write events on first use."""
+        cache = db.info.get(_SESSION_INFO_KEY)
+        if cache is None:
+            cache = cls()
+            db.info[_SESSION_INFO_KEY] = cache
+            event.listen(db, "after_flush", cache.clear)
+            event.listen(db, "after_rollback", cache.clear)
+            event.listen(db, "do_orm_execute", cache._on_execute)
+        return cache
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], List[T]]) -> List[T]:
+        """Return the cached list for key, loading it once; callers get a copy."""
+        if key not in self._data:
+            self._data[key] = list(loader())
+        return list(self._data[key])
+
+    def clear(self, *_: Any) -> None:
+        self._data.clear()
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        if state.is_update or state.is_delete or state.is_insert:
+            self.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
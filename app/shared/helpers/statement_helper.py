@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import re
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+# (date, signed amount, description, bank transaction id); positive amounts are
+# income. The id is the OFX FITID, None when the statement carries none (CSV).
+StatementRow = Tuple[date, Decimal, str, Optional[str]]
+
+T = TypeVar("T")
+
+CSV_DATE_COLUMNS = ("date", "posted", "transaction date")
+CSV_AMOUNT_COLUMNS = ("amount",)
+CSV_DESCRIPTION_COLUMNS = ("description", "payee", "name", "memo")
+
+# <TAG>value or </TAG>; OFX 1.x (SGML) leaves most element tags unclosed.
+_OFX_TOKEN = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(text: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form used for dedupe and concept matching."""
+    return _WHITESPACE.sub(" ", (text or "").strip()).casefold()
+
+
+def statement_row_hash(account_id: UUID, row: StatementRow, occurrence: int = 0) -> str:
+    """
+    Dedupe key of an imported row: sha256 of (account_id, FITID) when the bank
+    provides one; otherwise of (account_id, date, amount, normalized description)
+    plus `occurrence`, the row's index among identical rows of the same
+    statement, so two genuine -4.50 Coffee rows stay distinct and a re-import
+    lines up with both. Amount is normalized so 10.5 and 10.50 match.
+    """
+    row_date, amount, description, fitid = row
+    if fitid:
+        key = f"{account_id}|fitid|{fitid}"
+    else:
+        parts = [
+            str(account_id),
+            row_date.isoformat(),
+            format(amount.normalize(), "f"),
+            normalize_description(description),
+        ]
+        if occurrence:
+            parts.append(str(occurrence))
+        key = "|".join(parts)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield lists of up to `size` items without materializing the iterable."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _parse_amount(raw: str, position: str) -> Decimal:
+    try:
+        amount = Decimal(raw.strip().replace(",", ""))
+    except InvalidOperation as exc:
+        raise ValueError(f"Invalid amount at {position}: {raw!r}") from exc
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount at {position}: {raw!r}")
+    return amount
+
+
+def _pick_column(fieldnames: List[str], candidates: Tuple[str, ...]) -> Optional[str]:
+    by_name = {name.strip().casefold(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in by_name:
+            return by_name[candidate]
+    return None
+
+
+def iter_csv_statement(lines: Iterable[str]) -> Iterator[StatementRow]:
+    """
+    Stream rows from a CSV statement with a header row.
+
+    Needs a date column (ISO YYYY-MM-DD) and a signed amount column; the
+    description is taken from the first of description/payee/name/memo present.
+    Raises ValueError on the first invalid row.
+    """
+    reader = csv.DictReader(lines)
+    fieldnames = list(reader.fieldnames or [])
+    date_column = _pick_column(fieldnames, CSV_DATE_COLUMNS)
+    amount_column = _pick_column(fieldnames, CSV_AMOUNT_COLUMNS)
+    if date_column is None or amount_column is None:
+        raise ValueError("CSV statement needs date and amount columns")
+    description_column = _pick_column(fieldnames, CSV_DESCRIPTION_COLUMNS)
+
+    # Line numbers are 1-based and include the header row.
+    for line, record in enumerate(reader, start=2):
+        position = f"line {line}"
+        raw_date = (record.get(date_column) or "").strip()
+        try:
+            row_date = date.fromisoformat(raw_date[:10])
+        except ValueError as exc:
+            raise ValueError(f"Invalid date at {position}: {raw_date!r}") from exc
+        amount = _parse_amount(record.get(amount_column) or "", position)
+        description = ""
+        if description_column:
+            description = record.get(description_column) or ""
+        yield (row_date, amount, description.strip(), None)
+
+
+def iter_ofx_statement(lines: Iterable[str]) -> Iterator[StatementRow]:
+    """
+    Stream <STMTTRN> entries from an OFX 1.x (SGML) or 2.x (XML) statement.
+
+    Uses DTPOSTED, TRNAMT, NAME (MEMO when NAME is missing) and FITID. Only
+    the transaction being read is held in memory.
+    """
+    current: Optional[Dict[str, str]] = None
+    count = 0
+    for line in lines:
+        for closing, tag, value in _OFX_TOKEN.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if closing:
+                    if current is not None:
+                        count += 1
+                        yield _ofx_row(current, f"transaction {count}")
+                    current = None
+                else:
+                    current = {}
+            elif current is not None and not closing:
+                current[tag] = value.strip()
+    if current is not None:
+        raise ValueError("Unterminated STMTTRN in OFX statement")
+
+
+def _ofx_row(fields: Dict[str, str], position: str) -> StatementRow:
+    raw_date = fields.get("DTPOSTED", "")
+    try:
+        row_date = date(int(raw_date[0:4]), int(raw_date[4:6]), int(raw_date[6:8]))
+    except ValueError as exc:
+        raise ValueError(f"Invalid DTPOSTED at {position}: {raw_date!r}") from exc
+    amount = _parse_amount(fields.get("TRNAMT", ""), position)
+    description = fields.get("NAME") or fields.get("MEMO") or ""
+    return (row_date, amount, description, fields.get("FITID") or None)
@@ -0,0 +1,43 @@
+"""
+Load historical FX rates from a local CSV or JSON file into fx_rates.
+
+Run from the repository root after docs/migrations/005_fx_rates.sql:
+
+    python -m commands.load_fx_rates rates.csv
+    python -m commands.load_fx_rates rates.json
+
+CSV columns: base,quote,date,rate (1 base = rate quote). Existing
+(base, quote, date) rows are overwritten, so reloading a file is safe.
+"""
+
+import argparse
+import sys
+
+from app.config.database import get_session_factory
+from app.repository.fx_rate_repository import FxRateRepository
+from app.services.fx_service import FxService
+from app.shared.helpers.fx_rates_file_helper import read_fx_rates_file
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="CSV or JSON rate file")
+    args = parser.parse_args(argv)
+
+    try:
+        records = read_fx_rates_file(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Could not read {args.path}: {e}")
+        return 1
+
+    db = get_session_factory()()
+    try:
+        written = FxService(FxRateRepository(db)).load_rates(records)
+    finally:
+        db.close()
+    print(f"Loaded {written} FX rates from {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Materialize month-start balance snapshots for every active account.
+
+Run from the repository root (e.g. from cron on the 1st of each month):
+
+    python -m commands.materialize_snapshots
+    python -m commands.materialize_snapshots --from 2024-01 --to 2025-06
+
+Idempotent: months that already have a snapshot for an account are skipped.
+"""
+
+import argparse
+import sys
+from datetime import date, datetime
+
+from app.config.database import get_session_factory
+from app.engines.balance.snapshot_materializer import (
+    DEFAULT_BATCH_SIZE,
+    materialize_snapshots,
+)
+
+
+def _parse_month(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid month '{value}', use YYYY-MM")
+
+
+def main(argv=None) -> int:
+    current_month = date.today().replace(day=1)
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--from",
+        dest="from_month",
+        type=_parse_month,
+        default=None,
+        help="First month to materialize (YYYY-MM). Defaults to --to.",
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_month",
+        type=_parse_month,
+        default=current_month,
+        help="Last month to materialize (YYYY-MM). Defaults to the current month.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Accounts per insert batch.",
+    )
+    args = parser.parse_args(argv)
+    from_month = args.from_month or args.to_month
+    if from_month > args.to_month:
+        parser.error("--from must not be after --to")
+
+    created = materialize_snapshots(
+        get_session_factory(), from_month, args.to_month, args.batch_size
+    )
+    print(f"Created {created} snapshots ({from_month:%Y-%m} to {args.to_month:%Y-%m})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+-- Migration 004: Create account_daily_balances running-balance ledger
+--
+-- Balance-as-of used to replay every transaction up to as_of on each request.
+-- This table keeps, per account and per day with activity, the running net of
+-- all transactions up to and including that day. TransactionService maintains it
+-- incrementally on create/update/delete, so balance(as_of) becomes one indexed
+-- lookup per account: initial_balance + latest running_net on or before as_of.
+--
+-- Like balance_snapshots, rows are native account currency only and can be
+-- rebuilt from transactions at any time (see backfill below).
+--
+-- Rollout: (1) create the table, (2) deploy with BALANCE_LEDGER_WRITES_ENABLED=true
+-- so every write maintains it, (3) run the backfill, (4) set
+-- BALANCE_LEDGER_ENABLED=true to read it. The backfill is rerunnable with writes
+-- live: it locks the table against writers until it commits. Keep writes enabled
+-- while reads are off; if they were ever off, re-run the backfill before reads.
+
+-- UP
+CREATE TABLE IF NOT EXISTS account_daily_balances (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  account_id UUID NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
+  balance_date DATE NOT NULL,
+  running_net NUMERIC NOT NULL DEFAULT 0,
+
+  -- The unique constraint doubles as the (account_id, balance_date) lookup index.
+  CONSTRAINT uq_account_daily_balances_day UNIQUE (account_id, balance_date)
+);
+
+COMMENT ON COLUMN account_daily_balances.running_net IS 'Sum of signed transaction amounts with date <= balance_date; excludes initial_balance.';
+
+-- Backfill (idempotent rebuild; waits for in-flight writers, blocks new ones)
+BEGIN;
+LOCK TABLE account_daily_balances IN SHARE ROW EXCLUSIVE MODE;
+DELETE FROM account_daily_balances;
+INSERT INTO account_daily_balances (account_id, balance_date, running_net)
+SELECT
+  account_id,
+  date,
+  SUM(SUM(CASE WHEN type = 'income' THEN amount ELSE -amount END))
+    OVER (PARTITION BY account_id ORDER BY date)
+FROM transactions
+GROUP BY account_id, date;
+COMMIT;
+
+-- DOWN
+-- DROP TABLE IF EXISTS account_daily_balances;
@@ -0,0 +1,29 @@
+-- Migration 005: Create fx_rates historical exchange-rate table
+--
+-- FxService used six hard-coded rates and ignored as_of. This table stores one
+-- rate per (base, quote, day); FxService uses the latest rate on or before the
+-- requested date, so conversions are correct per date. Rows are reference data
+-- loaded in bulk from CSV/JSON files:
+--
+--   python -m commands.load_fx_rates rates.csv
+--
+-- Reads are enabled by setting FX_RATES_ENABLED=true AFTER this migration has
+-- been applied. Pairs without stored rates fall back to the built-in MVP rates.
+
+-- UP
+CREATE TABLE IF NOT EXISTS fx_rates (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  base TEXT NOT NULL,
+  quote TEXT NOT NULL,
+  rate_date DATE NOT NULL,
+  rate NUMERIC NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  -- The unique constraint doubles as the (base, quote, rate_date) as_of index.
+  CONSTRAINT uq_fx_rates_pair_date UNIQUE (base, quote, rate_date)
+);
+
+COMMENT ON COLUMN fx_rates.rate IS '1 unit of base = rate units of quote, as of rate_date.';
+
+-- DOWN
+-- DROP TABLE IF EXISTS fx_rates;
@@ -0,0 +1,33 @@
+-- Migration 006: Add transactions.amount_minor (integer minor units)
+--
+-- amount is an unbounded NUMERIC, so every balance sum is NUMERIC arithmetic in
+-- SQL and Decimal arithmetic in BalanceEngine. amount_minor stores the same
+-- amount as a BIGINT in minor units of the ACCOUNT currency (cents for USD/MXN/EUR,
+-- whole units for JPY, thousandths for KWD; see app/shared/helpers/money_helper.py).
+-- The Transaction mapper keeps it in step on every insert/update; sub-minor
+-- fractions are rounded half away from zero, the same as ROUND below.
+--
+-- REQUIRED before deploy: the Transaction entity maps amount_minor
+-- unconditionally, so every transaction SELECT and INSERT uses the column
+-- whatever LEDGER_MINOR_UNITS_ENABLED says. Apply the ALTER before rolling out.
+--
+-- Balance reads use it when LEDGER_MINOR_UNITS_ENABLED=true, set AFTER this
+-- migration (including the backfill) has been applied.
+
+-- UP
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS amount_minor BIGINT;
+
+-- Backfill (idempotent); keep the exponent list in sync with CURRENCY_EXPONENTS.
+UPDATE transactions t
+SET amount_minor = ROUND(
+  t.amount * POWER(10::NUMERIC, CASE
+    WHEN UPPER(a.currency) IN ('CLP', 'ISK', 'JPY', 'KRW', 'PYG', 'UGX', 'VND') THEN 0
+    WHEN UPPER(a.currency) IN ('BHD', 'IQD', 'JOD', 'KWD', 'LYD', 'OMR', 'TND') THEN 3
+    ELSE 2
+  END)
+)::BIGINT
+FROM accounts a
+WHERE a.id = t.account_id;
+
+-- DOWN
+-- ALTER TABLE transactions DROP COLUMN IF EXISTS amount_minor;
@@ -0,0 +1,23 @@
+-- Migration 007: Add transactions.import_hash (statement import dedupe key)
+--
+-- Rows created by POST /transactions/import store the sha256 of
+-- (account_id, OFX FITID) or, without one, of (account_id, date, amount,
+-- normalized description, occurrence index among identical rows of the
+-- statement); see app/shared/helpers/statement_helper.py. The unique index makes re-importing
+-- an overlapping statement idempotent: the service skips hashes that already
+-- exist with one IN query per chunk, and the index is the backstop for
+-- concurrent imports. Manual transactions leave import_hash NULL, which the
+-- unique index does not constrain.
+--
+-- REQUIRED before deploy: the Transaction entity maps import_hash
+-- unconditionally, so every transaction SELECT and INSERT uses the column.
+
+-- UP
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS import_hash TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_transactions_account_import_hash
+ON transactions (account_id, import_hash);
+
+-- DOWN
+-- DROP INDEX IF EXISTS uq_transactions_account_import_hash;
+-- ALTER TABLE transactions DROP COLUMN IF EXISTS import_hash;
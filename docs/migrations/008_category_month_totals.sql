@@ -0,0 +1,62 @@
+-- Migration 008: Create category_month_totals rollup
+--
+-- Category summaries used to GROUP BY category_id over every raw transaction in
+-- the range (joined to accounts for is_deleted) on each request. This table keeps
+-- the net-signed amount and count per (category, account, month, currency).
+-- TransactionService maintains it incrementally on create/update/delete, bulk
+-- create and statement import, so whole months are read from here and raw rows
+-- are scanned only for partial first/last months. A yearly summary reads at
+-- most categories x accounts x 12 rows.
+--
+-- account_id is kept so soft-deleted accounts are still excluded at read time.
+-- currency is the transaction currency (the currency filter of the summary).
+-- Rows can be rebuilt from transactions at any time (see backfill below).
+--
+-- Rollout: (1) create the table, (2) deploy with CATEGORY_ROLLUP_WRITES_ENABLED=true
+-- so every write maintains it, (3) run the backfill, (4) set
+-- CATEGORY_ROLLUP_ENABLED=true to read it. The backfill is rerunnable with writes
+-- live: it locks the table against writers until it commits. Keep writes enabled
+-- while reads are off; if they were ever off, re-run the backfill before reads.
+
+-- UP
+CREATE TABLE IF NOT EXISTS category_month_totals (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id UUID NOT NULL REFERENCES profiles(id),
+  category_id UUID NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+  account_id UUID NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
+  month DATE NOT NULL,
+  currency TEXT,
+  net_amount NUMERIC NOT NULL DEFAULT 0,
+  count INTEGER NOT NULL DEFAULT 0
+);
+
+-- Summary reads: one user, a range of months.
+CREATE INDEX IF NOT EXISTS ix_category_month_totals_user_month
+ON category_month_totals (user_id, month);
+
+-- Write path: one row per (category, account, month, currency) key. Unique, with
+-- NULL currency folded to '', so writers upsert with INSERT ... ON CONFLICT and
+-- two concurrent first writes to a month cannot create duplicate rows.
+CREATE UNIQUE INDEX IF NOT EXISTS ix_category_month_totals_key
+ON category_month_totals (category_id, account_id, month, COALESCE(currency, ''));
+
+-- Backfill (idempotent rebuild; waits for in-flight writers, blocks new ones)
+BEGIN;
+LOCK TABLE category_month_totals IN SHARE ROW EXCLUSIVE MODE;
+DELETE FROM category_month_totals;
+INSERT INTO category_month_totals
+  (user_id, category_id, account_id, month, currency, net_amount, count)
+SELECT
+  user_id,
+  category_id,
+  account_id,
+  date_trunc('month', date)::DATE,
+  currency,
+  SUM(CASE WHEN type = 'income' THEN amount ELSE -amount END),
+  COUNT(*)
+FROM transactions
+GROUP BY user_id, category_id, account_id, date_trunc('month', date), currency;
+COMMIT;
+
+-- DOWN
+-- DROP TABLE IF EXISTS category_month_totals;
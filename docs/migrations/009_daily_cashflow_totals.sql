@@ -0,0 +1,61 @@
+-- Migration 009: Create daily_cashflow_totals rollup
+--
+-- Cashflow history grouped every raw transaction in range by a strftime /
+-- date_trunc bucket expression, which no index can serve. This table keeps
+-- income and expense_abs per (user, account, category, currency, day).
+-- TransactionService maintains it incrementally on every write; cashflow
+-- history reads the days in range through ix_daily_cashflow_totals_user_day and
+-- folds them into day/week/month/year buckets, so a multi-year chart reads at
+-- most one row per active day and key instead of every transaction.
+--
+-- account_id is kept so soft-deleted accounts are still excluded at read time.
+-- Rows can be rebuilt from transactions at any time (see backfill below).
+--
+-- Rollout: (1) create the table, (2) deploy with CASHFLOW_ROLLUP_WRITES_ENABLED=true
+-- so every write maintains it, (3) run the backfill, (4) set
+-- CASHFLOW_ROLLUP_ENABLED=true to read it. The backfill is rerunnable with writes
+-- live: it locks the table against writers until it commits. Keep writes enabled
+-- while reads are off; if they were ever off, re-run the backfill before reads.
+
+-- UP
+CREATE TABLE IF NOT EXISTS daily_cashflow_totals (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id UUID NOT NULL REFERENCES profiles(id),
+  account_id UUID NOT NULL REFERENCES accounts(id) ON DELETE CASCADE,
+  category_id UUID NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+  currency TEXT,
+  day DATE NOT NULL,
+  income NUMERIC NOT NULL DEFAULT 0,
+  expense_abs NUMERIC NOT NULL DEFAULT 0
+);
+
+-- History reads: one user, a range of days.
+CREATE INDEX IF NOT EXISTS ix_daily_cashflow_totals_user_day
+ON daily_cashflow_totals (user_id, day);
+
+-- Write path: one row per (account, category, day, currency) key. Unique, with
+-- NULL currency folded to '', so writers upsert with INSERT ... ON CONFLICT and
+-- two concurrent first writes to a day cannot create duplicate rows.
+CREATE UNIQUE INDEX IF NOT EXISTS ix_daily_cashflow_totals_key
+ON daily_cashflow_totals (account_id, category_id, day, COALESCE(currency, ''));
+
+-- Backfill (idempotent rebuild; waits for in-flight writers, blocks new ones)
+BEGIN;
+LOCK TABLE daily_cashflow_totals IN SHARE ROW EXCLUSIVE MODE;
+DELETE FROM daily_cashflow_totals;
+INSERT INTO daily_cashflow_totals
+  (user_id, account_id, category_id, currency, day, income, expense_abs)
+SELECT
+  user_id,
+  account_id,
+  category_id,
+  currency,
+  date,
+  SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END),
+  SUM(CASE WHEN type = 'expense' THEN amount ELSE 0 END)
+FROM transactions
+GROUP BY user_id, account_id, category_id, currency, date;
+COMMIT;
+
+-- DOWN
+-- DROP TABLE IF EXISTS daily_cashflow_totals;
@@ -0,0 +1,24 @@
+-- Migration 010: Create ledger_versions write counters
+--
+-- Conditional GETs (ETag / If-None-Match) fingerprinted the ledger with
+-- count(*) and max(updated_at) over six tables, which is O(the user's history)
+-- on every poll and missed fx_rates loads. This table keeps one counter per
+-- scope: one per user (scope = user id) plus 'fx_rates' and 'epoch'. Every ORM write to a
+-- user's transactions, accounts, categories, concepts, tags or tag links, and
+-- every FX rate load, increments the counter in the same transaction; the ETag
+-- reads both counters by primary key.
+--
+-- Required before LEDGER_ETAG_ENABLED=true: only then do the app's sessions bump
+-- these counters and the GETs read them. Missing rows read as version 0; no
+-- backfill. Writes made while the flag is off are not counted, so each startup
+-- with it on bumps the 'epoch' scope, which is part of every tag; change the flag
+-- with a full restart rather than a rolling one.
+
+-- UP
+CREATE TABLE IF NOT EXISTS ledger_versions (
+  scope TEXT PRIMARY KEY,
+  version BIGINT NOT NULL DEFAULT 0
+);
+
+-- DOWN
+-- DROP TABLE IF EXISTS ledger_versions;
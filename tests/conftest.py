@@ -38,8 +38,10 @@ def _configure_test_environment() -> None:
 
     from app.config.database import reset_database_state
     from app.config.settings import reload_settings
+    from app.dependencies.auth_dependency import reload_jwt_secret
 
     reload_settings()
+    reload_jwt_secret()
     reset_database_state()
 
     try:
@@ -87,7 +89,11 @@ def query_counter(db_engine):
 @pytest.fixture(scope="session")
 def db_session_factory(db_engine):
     """Provide a sessionmaker bound to the test database engine."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    from app.entities.ledger_version import track_ledger_versions
+
+    return track_ledger_versions(
+        sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -147,3 +153,34 @@ def create_registered_user(client: TestClient, auth_headers: Dict[str, str]):
         return client.post("/api/v1/users", json=payload, headers=auth_headers)
 
     return _create
+
+
+@pytest.fixture
+def settings_env(request):
+    """
+    Override settings through environment variables for one test.
+
+    Parametrize indirectly with a dict of variables to apply before the test,
+    e.g. ``{"BALANCE_LEDGER_ENABLED": "true"}``; the fixture returns a callable
+    that applies further overrides mid-test. Settings and the caches derived
+    from them are reloaded on every change and restored at teardown.
+    """
+    from app.config.settings import reload_settings
+    from app.dependencies.reporting_cache_dependencies import reset_reporting_cache
+    from app.services.fx_service import clear_rate_cache
+
+    def _reload() -> None:
+        reload_settings()
+        clear_rate_cache()
+        reset_reporting_cache()
+
+    with pytest.MonkeyPatch.context() as mp:
+
+        def _apply(**overrides: str) -> None:
+            for name, value in overrides.items():
+                mp.setenv(name, value)
+            _reload()
+
+        _apply(**getattr(request, "param", {}))
+        yield _apply
+    _reload()
@@ -225,3 +225,181 @@ class TestAccountSoftDelete:
         # Account still visible to owner A
         r = client.get(f"/api/v1/accounts/{acc_id}", headers=headers_a)
         assert r.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"LEDGER_MINOR_UNITS_ENABLED": "true"}], indirect=True
+)
+def test_currency_change_blocked_once_account_has_transactions(
+    client, auth_headers, settings_env
+):
+    """Balances read amount_minor in the account currency; it cannot change."""
+    assert _create_user(client, auth_headers).status_code == 200
+    r = client.post(
+        "/api/v1/accounts",
+        json={"name": "Cash", "type": "cash", "currency": "USD"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    acc_id = r.json()["id"]
+
+    # No transactions yet: the currency can still be corrected
+    r = client.put(
+        f"/api/v1/accounts/{acc_id}", json={"currency": "EUR"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    assert r.json()["currency"] == "EUR"
+
+    r = client.post(
+        "/api/v1/categories",
+        json={"name": "Food", "type": "expense"},
+        headers=auth_headers,
+    )
+    assert r.status_code in {200, 201}
+    r = client.post(
+        "/api/v1/transactions",
+        json={
+            "account_id": acc_id,
+            "category_id": r.json()["id"],
+            "type": "expense",
+            "amount": "10.50",
+            "currency": "EUR",
+            "date": "2025-01-10",
+            "source": "manual",
+        },
+        headers=auth_headers,
+    )
+    assert r.status_code in {200, 201}
+
+    r = client.put(
+        f"/api/v1/accounts/{acc_id}", json={"currency": "JPY"}, headers=auth_headers
+    )
+    assert r.status_code == 409
+    r = client.put(
+        f"/api/v1/accounts/{acc_id}",
+        json={"name": "Wallet", "currency": "EUR"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert r.json()["name"] == "Wallet"
+
+
+def test_currency_change_rescales_amount_minor(
+    client, auth_headers, db_session_factory
+):
+    """With minor-units reads off the change is allowed and amount_minor follows."""
+    from app.entities.transaction import Transaction
+
+    assert _create_user(client, auth_headers).status_code == 200
+    r = client.post(
+        "/api/v1/accounts",
+        json={"name": "Cash", "type": "cash", "currency": "USD"},
+        headers=auth_headers,
+    )
+    acc_id = r.json()["id"]
+    r = client.post(
+        "/api/v1/categories",
+        json={"name": "Food", "type": "expense"},
+        headers=auth_headers,
+    )
+    r = client.post(
+        "/api/v1/transactions",
+        json={
+            "account_id": acc_id,
+            "category_id": r.json()["id"],
+            "type": "expense",
+            "amount": "10.50",
+            "currency": "USD",
+            "date": "2025-01-10",
+            "source": "manual",
+        },
+        headers=auth_headers,
+    )
+    assert r.status_code in {200, 201}
+
+    r = client.put(
+        f"/api/v1/accounts/{acc_id}", json={"currency": "JPY"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    assert r.json()["currency"] == "JPY"
+    db = db_session_factory()
+    try:
+        assert db.query(Transaction.amount_minor).scalar() == 11
+    finally:
+        db.close()
+
+
+def test_request_cache_lists_accounts_once_per_unit_of_work(
+    client, auth_headers, user_id, db_session_factory, query_counter
+):
+    """Accounts are loaded once per session and reloaded after a write."""
+    from app.entities.account import Account
+    from app.repository.account_repository import AccountRepository
+    from app.shared.helpers.request_cache_helper import RequestCache
+
+    assert _create_user(client, auth_headers).status_code == 200
+    r = client.post(
+        "/api/v1/accounts",
+        json={"name": "Cash", "type": "cash", "currency": "USD"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+
+    db = db_session_factory()
+    try:
+        cache = RequestCache.for_session(db)
+        assert RequestCache.for_session(db) is cache
+        engine_repo = AccountRepository(db, cache)
+        service_repo = AccountRepository(db, cache)
+
+        query_counter[0] = 0
+        assert len(engine_repo.get_by_user_id(user_id)) == 1
+        assert len(service_repo.get_by_user_id(user_id)) == 1
+        assert query_counter[0] == 1
+
+        db.add(Account(user_id=user_id, name="Bank", type="debit_card", currency="USD"))
+        db.flush()
+        assert {a.name for a in service_repo.get_by_user_id(user_id)} == {
+            "Cash",
+            "Bank",
+        }
+        db.rollback()
+    finally:
+        db.close()
+
+
+def test_balance_rows_filter_in_sql_without_orm_entities(
+    client, auth_headers, user_id, db_session_factory
+):
+    """Engines read active accounts as column tuples, filtered in SQL."""
+    from app.repository.account_repository import (
+        AccountBalanceRow,
+        AccountRepository,
+    )
+
+    assert _create_user(client, auth_headers).status_code == 200
+    ids = {}
+    for name in ("Cash", "Bank", "Old"):
+        r = client.post(
+            "/api/v1/accounts",
+            json={"name": name, "type": "cash", "currency": "USD"},
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+        ids[name] = uuid.UUID(r.json()["id"])
+    r = client.delete(f"/api/v1/accounts/{ids['Old']}", headers=auth_headers)
+    assert r.status_code == 204
+
+    db = db_session_factory()
+    try:
+        repo = AccountRepository(db)
+        rows = repo.get_balance_rows(user_id)
+        assert {row.name for row in rows} == {"Cash", "Bank"}
+        assert all(isinstance(row, AccountBalanceRow) for row in rows)
+        assert len(db.identity_map) == 0
+
+        only = repo.get_balance_rows(user_id, ids["Bank"])
+        assert [row.id for row in only] == [ids["Bank"]]
+        assert repo.get_balance_rows(user_id, ids["Old"]) == []
+    finally:
+        db.close()
@@ -1,5 +1,7 @@
 from calendar import monthrange
 from datetime import date
+from decimal import Decimal
+from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
@@ -479,6 +481,36 @@ def test_balance_history_query_count(client, auth_headers, query_counter):
     )
 
 
+def test_balance_history_loads_inputs_in_one_round_trip(
+    client, auth_headers, query_counter
+):
+    """Snapshots, opening sums and in-range rows come from a single query."""
+    _create_user(client, auth_headers, currency="USD")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    for _ in range(3):
+        account = _create_account(client, auth_headers)
+        for day in ("2025-11-15", "2025-12-05"):
+            _create_transaction(
+                client,
+                auth_headers,
+                account["id"],
+                category["id"],
+                "10.00",
+                "expense",
+                day,
+            )
+
+    query_counter[0] = 0
+    r = client.get(
+        "/api/v1/reporting/balance/history?from=2025-12-01&to=2025-12-31&period=week",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    # Current user + accounts + balance history inputs.
+    assert query_counter[0] <= 3
+    assert r.json()["points"][-1]["balance"] == "2940.00"
+
+
 # -------------------------------------------------------------------------
 # Cashflow history endpoint tests
 # -------------------------------------------------------------------------
@@ -928,3 +960,1764 @@ def test_period_comparison_trend_up(client, auth_headers):
     )
     assert r.status_code == 200
     assert r.json()["summary"]["trend"] == "up"
+
+
+def test_build_trailing_periods():
+    """Unit test for date_helper.build_trailing_periods."""
+    from app.schemas.reporting_schemas import TransactionSummaryPeriod
+    from app.shared.helpers.date_helper import build_trailing_periods
+
+    buckets = build_trailing_periods(
+        date(2026, 2, 28), TransactionSummaryPeriod.MONTH, 3
+    )
+    assert buckets == [
+        (date(2025, 12, 1), date(2025, 12, 31)),
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 2, 1), date(2026, 2, 28)),
+    ]
+
+
+def test_period_comparison_periods_requires_period(client, auth_headers):
+    """periods > 1 is only valid together with period."""
+    _create_user(client, auth_headers)
+    r = client.get(
+        "/api/v1/reporting/period-comparison"
+        "?date_from=2026-01-01&date_to=2026-01-31&periods=3",
+        headers=auth_headers,
+    )
+    assert r.status_code == 422
+
+
+def test_period_comparison_trailing_months(client, auth_headers):
+    """period=month&periods=3 compares the last 3 months with the 3 before them."""
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers, currency="USD")
+    salary = _create_category(client, auth_headers, "Salary", "income")
+    food = _create_category(client, auth_headers, "Food", "expense")
+
+    def months_back(n: int) -> date:
+        today = date.today()
+        year, month = divmod(today.year * 12 + today.month - 1 - n, 12)
+        return date(year, month + 1, 1)
+
+    # Current window: months -2..0; previous window: months -5..-3
+    this_month, two_ago, four_ago = months_back(0), months_back(2), months_back(4)
+
+    for category, amount, kind, day in (
+        (salary, "300.00", "income", this_month),
+        (food, "20.00", "expense", two_ago),
+        (salary, "100.00", "income", four_ago),
+        (food, "5.00", "expense", four_ago),
+    ):
+        _create_transaction(
+            client,
+            auth_headers,
+            account["id"],
+            category["id"],
+            amount,
+            kind,
+            day.isoformat(),
+        )
+
+    r = client.get(
+        "/api/v1/reporting/period-comparison?period=month&periods=3",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    data = r.json()
+    assert data["current_period"]["start"] == two_ago.isoformat()
+    assert data["current_period"]["income"] == "300.00"
+    assert data["current_period"]["expense"] == "20.00"
+    assert data["previous_period"]["start"] == months_back(5).isoformat()
+    assert data["previous_period"]["net"] == "95.00"
+    assert data["summary"]["trend"] == "up"
+    assert len(data["current_breakdown"]) == 3
+    assert len(data["previous_breakdown"]) == 3
+    assert data["previous_breakdown"][1]["start"] == four_ago.isoformat()
+    assert data["previous_breakdown"][1]["net"] == "95.00"
+    assert data["previous_breakdown"][0]["net"] == "0.00"
+    assert data["current_breakdown"][-1]["income"] == "300.00"
+
+    r = client.get(
+        "/api/v1/reporting/period-comparison?period=month"
+        f"&periods=3&category_id={food['id']}",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert r.json()["current_period"]["expense"] == "20.00"
+    assert r.json()["previous_period"]["income"] == "0.00"
+
+
+# -------------------------------------------------------------------------
+# Running-balance ledger (BALANCE_LEDGER_ENABLED)
+# -------------------------------------------------------------------------
+
+
+BALANCE_LEDGER = {"BALANCE_LEDGER_ENABLED": "true"}
+
+
+def _balances_by_account(client, auth_headers, as_of: str) -> dict:
+    r = client.get(
+        f"/api/v1/reporting/balance/accounts?as_of={as_of}", headers=auth_headers
+    )
+    assert r.status_code == 200
+    return {a["account_id"]: a["balance_native"] for a in r.json()["accounts"]}
+
+
+@pytest.mark.parametrize("settings_env", [BALANCE_LEDGER], indirect=True)
+def test_balance_ledger_matches_replay_after_edits(client, auth_headers, settings_env):
+    """Ledger balances equal snapshot/replay balances after create/update/delete/transfer."""
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    savings = _create_account(client, auth_headers, "Savings", "USD")
+    category = _create_category(client, auth_headers, "Ledger", "expense")
+
+    _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "200.00",
+        "income",
+        "2025-01-10",
+    )
+    edited = _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "50.00",
+        "expense",
+        "2025-02-05",
+    )
+    removed = _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "30.00",
+        "expense",
+        "2025-03-01",
+    )
+    r = client.post(
+        "/api/v1/transactions/transfer",
+        json={
+            "from_account_id": checking["id"],
+            "to_account_id": savings["id"],
+            "amount": "100.00",
+            "date": "2025-02-20",
+        },
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+
+    # Move the expense to another month and change its amount, then delete one.
+    r = client.put(
+        f"/api/v1/transactions/{edited['id']}",
+        json={"amount": "75.00", "date": "2025-01-20"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = client.delete(f"/api/v1/transactions/{removed['id']}", headers=auth_headers)
+    assert r.status_code == 204
+
+    checkpoints = ["2025-01-15", "2025-01-31", "2025-02-28", "2025-06-30"]
+    ledger = {d: _balances_by_account(client, auth_headers, d) for d in checkpoints}
+
+    assert ledger["2025-01-15"][checking["id"]] == "1200.00"
+    assert ledger["2025-06-30"][checking["id"]] == "1025.00"
+    assert ledger["2025-06-30"][savings["id"]] == "1100.00"
+
+    settings_env(BALANCE_LEDGER_ENABLED="false")
+    for d in checkpoints:
+        assert _balances_by_account(client, auth_headers, d) == ledger[d]
+
+
+@pytest.mark.parametrize("settings_env", [BALANCE_LEDGER], indirect=True)
+def test_balance_ledger_query_count(client, auth_headers, settings_env, query_counter):
+    """With the ledger, GET /balance reads one lookup for all accounts."""
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    for day in ("2025-01-05", "2025-02-05", "2025-03-05"):
+        _create_transaction(
+            client, auth_headers, account["id"], category["id"], "10.00", "expense", day
+        )
+
+    query_counter[0] = 0
+    r = client.get("/api/v1/reporting/balance?as_of=2025-12-31", headers=auth_headers)
+    assert r.status_code == 200
+    assert r.json()["balance"] == "970.00"
+    # user lookup + accounts + ledger lookup
+    assert query_counter[0] <= 3
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"BALANCE_LEDGER_WRITES_ENABLED": "true"}], indirect=True
+)
+def test_balance_ledger_maintained_before_reads_are_enabled(
+    client, auth_headers, db_session_factory, settings_env
+):
+    """Write-only mode keeps the ledger in step while balances still replay."""
+    from app.entities.account_daily_balance import AccountDailyBalance
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    for day in ("2025-01-05", "2025-02-05"):
+        _create_transaction(
+            client, auth_headers, account["id"], category["id"], "10.00", "expense", day
+        )
+    replayed = _balances_by_account(client, auth_headers, "2025-02-28")
+
+    db = db_session_factory()
+    try:
+        assert db.query(AccountDailyBalance).count() == 2
+    finally:
+        db.close()
+
+    settings_env(BALANCE_LEDGER_WRITES_ENABLED="false", BALANCE_LEDGER_ENABLED="true")
+    assert _balances_by_account(client, auth_headers, "2025-02-28") == replayed
+    assert replayed[account["id"]] == "980.00"
+
+
+def test_balance_ledger_first_write_tolerates_concurrent_insert(
+    client, auth_headers, db_session_factory
+):
+    """A day row inserted by a concurrent write is shifted, not re-inserted."""
+    from app.entities.account_daily_balance import AccountDailyBalance
+    from app.repository.account_daily_balance_repository import (
+        AccountDailyBalanceRepository,
+    )
+
+    _create_user(client, auth_headers, currency="USD")
+    account_id = UUID(_create_account(client, auth_headers)["id"])
+    day = date(2025, 3, 1)
+
+    db = db_session_factory()
+    try:
+        repo = AccountDailyBalanceRepository(db)
+        # The competing writer got its row in first
+        repo._insert_day_if_missing(account_id, day, Decimal("0"))
+        repo._insert_day_if_missing(account_id, day, Decimal("0"))
+        repo.apply_delta(account_id, day, Decimal("-10"))
+        repo.apply_delta(account_id, day, Decimal("-5"))
+        db.commit()
+
+        rows = db.query(AccountDailyBalance).filter_by(account_id=account_id).all()
+        assert len(rows) == 1
+        assert Decimal(str(rows[0].running_net)) == Decimal("-15")
+    finally:
+        db.close()
+
+
+def test_balance_ledger_serializes_writes_on_different_days(
+    client, auth_headers, db_session_factory
+):
+    """A write on an earlier day waits for, and then shifts, a new later day row."""
+    import threading
+
+    from sqlalchemy import event
+
+    from app.entities.account_daily_balance import AccountDailyBalance
+    from app.repository.account_daily_balance_repository import (
+        AccountDailyBalanceRepository,
+    )
+
+    _create_user(client, auth_headers, currency="USD")
+    account_id = UUID(_create_account(client, auth_headers)["id"])
+    earlier, later = date(2025, 3, 1), date(2025, 3, 10)
+
+    db = db_session_factory()
+    try:
+        AccountDailyBalanceRepository(db).apply_delta(
+            account_id, earlier, Decimal("-10")
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    writer_a = db_session_factory()
+    errors = []
+    statements = []
+    event.listen(
+        writer_a,
+        "do_orm_execute",
+        lambda state: statements.append(str(state.statement)),
+    )
+
+    def _write_earlier_day() -> None:
+        writer_b = db_session_factory()
+        try:
+            AccountDailyBalanceRepository(writer_b).apply_delta(
+                account_id, earlier, Decimal("-1")
+            )
+            writer_b.commit()
+        except Exception as exc:  # surfaced by the assertion below
+            errors.append(exc)
+        finally:
+            writer_b.close()
+
+    try:
+        # Writer A seeds the later day from the committed -10 and holds its
+        # transaction open while writer B writes the earlier day.
+        AccountDailyBalanceRepository(writer_a).apply_delta(
+            account_id, later, Decimal("-5")
+        )
+        thread = threading.Thread(target=_write_earlier_day)
+        thread.start()
+        thread.join(timeout=0.2)
+        writer_a.commit()
+        thread.join()
+    finally:
+        writer_a.close()
+
+    assert errors == []
+    # The account row is locked before the ledger is read for the seed.
+    assert "FROM accounts" in statements[0]
+    assert "account_daily_balances" in statements[1]
+    db = db_session_factory()
+    try:
+        rows = (
+            db.query(AccountDailyBalance.balance_date, AccountDailyBalance.running_net)
+            .filter(AccountDailyBalance.account_id == account_id)
+            .order_by(AccountDailyBalance.balance_date)
+            .all()
+        )
+        assert [(d, Decimal(str(net))) for d, net in rows] == [
+            (earlier, Decimal("-11")),
+            (later, Decimal("-16")),
+        ]
+    finally:
+        db.close()
+
+
+def test_minor_units_mode_matches_decimal_balances(
+    client, auth_headers, db_session_factory, settings_env
+):
+    """amount_minor follows amount and account currency; integer mode agrees."""
+    from app.engines.balance import materialize_snapshots
+    from app.entities.transaction import Transaction
+
+    _create_user(client, auth_headers, currency="USD")
+    usd = _create_account(client, auth_headers, "Checking", "USD")
+    jpy = _create_account(client, auth_headers, "Yen", "JPY")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        usd["id"],
+        category["id"],
+        "12.34",
+        "expense",
+        "2025-01-10",
+    )
+    moved = _create_transaction(
+        client, auth_headers, usd["id"], category["id"], "0.10", "income", "2025-02-03"
+    )
+    r = client.put(
+        f"/api/v1/transactions/{moved['id']}",
+        json={"account_id": jpy["id"], "amount": "500"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 2, 1))
+
+    db = db_session_factory()
+    try:
+        assert sorted(r.amount_minor for r in db.query(Transaction).all()) == [
+            500,
+            1234,
+        ]
+    finally:
+        db.close()
+
+    def reports():
+        history = client.get(
+            "/api/v1/reporting/balance/history?from=2025-01-01&to=2025-03-01"
+            "&period=month&account_id=" + usd["id"],
+            headers=auth_headers,
+        )
+        assert history.status_code == 200
+        return (
+            _balances_by_account(client, auth_headers, "2025-02-15"),
+            [p["balance"] for p in history.json()["points"]],
+        )
+
+    decimal_reports = reports()
+    assert decimal_reports == (
+        {usd["id"]: "987.66", jpy["id"]: "1500.00"},
+        ["1000.00", "987.66", "987.66"],
+    )
+    settings_env(LEDGER_MINOR_UNITS_ENABLED="true")
+    assert reports() == decimal_reports
+
+
+# -------------------------------------------------------------------------
+# Snapshot-bounded balance windows
+# -------------------------------------------------------------------------
+
+
+def test_balance_counts_transactions_on_snapshot_date(client, auth_headers):
+    """Snapshots exclude their own day, so reads after creation must add it back."""
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "30.00",
+        "expense",
+        "2025-03-01",
+    )
+    _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "20.00",
+        "expense",
+        "2025-02-10",
+    )
+
+    # First read lazily creates the 2025-03-01 snapshot; second read uses it.
+    for _ in range(2):
+        r = client.get(
+            "/api/v1/reporting/balance?as_of=2025-03-15", headers=auth_headers
+        )
+        assert r.status_code == 200
+        assert r.json()["balance"] == "950.00"
+
+    r = client.get(
+        "/api/v1/reporting/balance/history?from=2025-02-28&to=2025-03-02&period=day",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert [p["balance"] for p in r.json()["points"]] == [
+        "980.00",
+        "950.00",
+        "950.00",
+    ]
+
+
+def test_window_sums_batch_past_sqlite_compound_select_limit(
+    client, auth_headers, db_session_factory
+):
+    """More windows than SQLite allows in one UNION ALL still get one sum each."""
+    from app.repository.transaction_repository import TransactionRepository
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "10.00",
+        "expense",
+        "2025-01-10",
+    )
+    account_id = UUID(account["id"])
+    windows = [
+        (account_id, None, date(2025, 1, 31) if i % 2 else date(2025, 1, 1))
+        for i in range(501)
+    ]
+
+    db = db_session_factory()
+    try:
+        sums = TransactionRepository(db).get_net_signed_sums_for_windows(windows)
+    finally:
+        db.close()
+    assert len(sums) == 501
+    assert sums[:4] == [Decimal("0"), Decimal("-10"), Decimal("0"), Decimal("-10")]
+    assert sums[500] == Decimal("0")
+
+
+# -------------------------------------------------------------------------
+# Snapshot materialization (offline; reads never write)
+# -------------------------------------------------------------------------
+
+
+def test_snapshot_scheduler_refused_with_multiple_workers():
+    """Each worker would start its own scheduler thread."""
+    from pydantic import ValidationError
+
+    from app.config.settings import Settings
+
+    with pytest.raises(ValidationError, match="SNAPSHOT_SCHEDULER_ENABLED"):
+        Settings(SNAPSHOT_SCHEDULER_ENABLED=True, WEB_CONCURRENCY=2)
+    assert Settings(SNAPSHOT_SCHEDULER_ENABLED=True).SNAPSHOT_SCHEDULER_ENABLED
+
+
+def _snapshot_balances(db_session_factory) -> dict:
+    from app.entities.balance_snapshot import BalanceSnapshot
+
+    db = db_session_factory()
+    try:
+        return {
+            (str(s.account_id), s.snapshot_date.isoformat()): format(s.balance, ".2f")
+            for s in db.query(BalanceSnapshot).all()
+        }
+    finally:
+        db.close()
+
+
+def test_balance_reads_do_not_create_snapshots(
+    client, auth_headers, db_session_factory
+):
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client, auth_headers, account["id"], category["id"], "10.00", "expense"
+    )
+
+    r = client.get("/api/v1/reporting/balance", headers=auth_headers)
+    assert r.json()["balance"] == "990.00"
+    r = client.get("/api/v1/reporting/balance/accounts", headers=auth_headers)
+    assert r.status_code == 200
+    assert _snapshot_balances(db_session_factory) == {}
+
+
+def test_materialize_snapshots_chains_months(client, auth_headers, db_session_factory):
+    from app.engines.balance import materialize_snapshots
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    for amount, day in (("10.00", "2025-01-01"), ("20.00", "2025-02-14")):
+        _create_transaction(
+            client, auth_headers, account["id"], category["id"], amount, "expense", day
+        )
+
+    created = materialize_snapshots(
+        db_session_factory, date(2025, 1, 1), date(2025, 3, 1)
+    )
+    assert created == 3
+    assert _snapshot_balances(db_session_factory) == {
+        (account["id"], "2025-01-01"): "1000.00",
+        (account["id"], "2025-02-01"): "990.00",
+        (account["id"], "2025-03-01"): "970.00",
+    }
+    # Idempotent: existing snapshots are skipped.
+    assert (
+        materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 3, 1))
+        == 0
+    )
+
+    r = client.get(
+        "/api/v1/reporting/balance/history?from=2025-01-01&to=2025-03-01&period=month",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert [p["balance"] for p in r.json()["points"]] == [
+        "990.00",
+        "990.00",
+        "970.00",
+    ]
+
+
+def test_latest_snapshot_per_account_returns_one_row_each(
+    client, auth_headers, db_session_factory
+):
+    from uuid import UUID, uuid4
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.engines.balance import materialize_snapshots
+    from app.entities.balance_snapshot import BalanceSnapshot
+    from app.repository.balance_snapshot_repository import BalanceSnapshotRepository
+
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    savings = _create_account(client, auth_headers, "Savings", "USD")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "10.00",
+        "expense",
+        "2025-01-20",
+    )
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 4, 1))
+
+    ids = [UUID(checking["id"]), UUID(savings["id"]), uuid4()]
+    db = db_session_factory()
+    try:
+        repo = BalanceSnapshotRepository(db)
+        latest = repo.get_latest_snapshots_for_accounts(ids, date(2025, 3, 15))
+        assert [
+            (s.snapshot_date, format(s.balance, ".2f")) if s else None
+            for s in (latest[i] for i in ids)
+        ] == [(date(2025, 3, 1), "990.00"), (date(2025, 3, 1), "1000.00"), None]
+        before = repo.get_latest_before_for_accounts(ids, date(2025, 2, 1))
+        assert [s.snapshot_date if s else None for s in (before[i] for i in ids)] == [
+            date(2025, 1, 1),
+            date(2025, 1, 1),
+            None,
+        ]
+    finally:
+        db.close()
+
+    # Postgres takes DISTINCT ON instead of the window function (compiled only).
+    pg = Session(bind=create_engine("postgresql+psycopg2://user@localhost/db"))
+    query = BalanceSnapshotRepository(pg)._latest_per_account_query(
+        ids, BalanceSnapshot.snapshot_date <= date(2025, 3, 15)
+    )
+    sql = str(query.statement.compile(dialect=pg.bind.dialect))
+    assert "DISTINCT ON (balance_snapshots.account_id)" in sql
+    assert "row_number" not in sql
+
+
+def test_snapshot_delta_patching_keeps_chain_exact(
+    client, auth_headers, db_session_factory
+):
+    """Writes before materialized snapshots patch them to the rebuilt values."""
+    from app.engines.balance import materialize_snapshots
+    from app.entities.balance_snapshot import BalanceSnapshot
+
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    savings = _create_account(client, auth_headers, "Savings", "USD")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    edited = _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "40.00",
+        "expense",
+        "2025-02-10",
+    )
+    removed = _create_transaction(
+        client,
+        auth_headers,
+        checking["id"],
+        category["id"],
+        "15.00",
+        "income",
+        "2025-03-01",
+    )
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 5, 1))
+
+    # Create, move across accounts and months, delete, and transfer.
+    _create_transaction(
+        client,
+        auth_headers,
+        savings["id"],
+        category["id"],
+        "5.00",
+        "expense",
+        "2025-01-31",
+    )
+    r = client.put(
+        f"/api/v1/transactions/{edited['id']}",
+        json={"amount": "60.00", "date": "2025-04-02", "account_id": savings["id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = client.delete(f"/api/v1/transactions/{removed['id']}", headers=auth_headers)
+    assert r.status_code == 204
+    r = client.post(
+        "/api/v1/transactions/transfer",
+        json={
+            "from_account_id": checking["id"],
+            "to_account_id": savings["id"],
+            "amount": "100.00",
+            "date": "2025-02-20",
+        },
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    transfer_id = r.json()["transfer_id"]
+    r = client.put(
+        f"/api/v1/transactions/transfer/{transfer_id}",
+        json={"amount": "70.00", "date": "2025-01-05"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+
+    patched = _snapshot_balances(db_session_factory)
+    assert len(patched) == 10
+
+    db = db_session_factory()
+    try:
+        db.query(BalanceSnapshot).delete()
+        db.commit()
+    finally:
+        db.close()
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 5, 1))
+    assert _snapshot_balances(db_session_factory) == patched
+
+    r = client.delete(
+        f"/api/v1/transactions/transfer/{transfer_id}", headers=auth_headers
+    )
+    assert r.status_code == 204
+    assert (
+        _snapshot_balances(db_session_factory)[(checking["id"], "2025-05-01")]
+        == "1000.00"
+    )
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"SNAPSHOT_INVALIDATION_MODE": "delete"}], indirect=True
+)
+def test_snapshot_delete_invalidation_mode(
+    client, auth_headers, db_session_factory, settings_env
+):
+    from app.engines.balance import materialize_snapshots
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Test", "expense")
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 3, 1))
+
+    _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "10.00",
+        "expense",
+        "2025-02-10",
+    )
+    assert set(_snapshot_balances(db_session_factory)) == {
+        (account["id"], "2025-01-01")
+    }
+    r = client.get("/api/v1/reporting/balance?as_of=2025-03-15", headers=auth_headers)
+    assert r.json()["balance"] == "990.00"
+
+
+# -------------------------------------------------------------------------
+# FX rate table
+# -------------------------------------------------------------------------
+
+
+def test_fx_rate_table_matches_convert():
+    from decimal import Decimal
+
+    from app.services.fx_service import FxService
+
+    fx = FxService()
+    days = [date(2025, 1, 1), date(2025, 1, 2)]
+    table = fx.rate_table([("MXN", "USD"), ("USD", "USD"), ("GBP", "USD")], days)
+
+    assert table.rate("MXN", "USD", days[1]) == Decimal("0.057")
+    assert table.convert(Decimal("1000.00"), "MXN", "USD", days[0]) == fx.convert(
+        Decimal("1000.00"), "MXN", "USD", days[0]
+    )
+    assert table.convert(Decimal("5"), "USD", "USD", days[0]) == Decimal("5")
+    assert table.convert(Decimal("5"), "GBP", "USD", days[0]) == Decimal("5")
+    with pytest.raises(KeyError):
+        table.convert(Decimal("5"), "MXN", "USD", date(2025, 1, 3))
+
+
+def test_balance_history_converts_each_currency(client, auth_headers):
+    _create_user(client, auth_headers, currency="USD")
+    _create_account(client, auth_headers, "Dollars", "USD")
+    pesos = _create_account(client, auth_headers, "Pesos", "MXN")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        pesos["id"],
+        category["id"],
+        "100.00",
+        "expense",
+        "2025-01-02",
+        currency="MXN",
+    )
+
+    r = client.get(
+        "/api/v1/reporting/balance/history?from=2025-01-01&to=2025-01-02&period=day",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    # 1000 USD + 1000 MXN * 0.057, then 900 MXN after the expense.
+    assert [p["balance"] for p in r.json()["points"]] == ["1057.00", "1051.30"]
+
+
+def test_read_fx_rates_file_csv_and_json(tmp_path):
+    from decimal import Decimal
+
+    from app.shared.helpers.fx_rates_file_helper import read_fx_rates_file
+
+    csv_path = tmp_path / "rates.csv"
+    csv_path.write_text("base,quote,date,rate\nmxn,usd,2025-01-01,0.0571\n")
+    json_path = tmp_path / "rates.json"
+    json_path.write_text(
+        '{"rates": [{"base": "MXN", "quote": "USD", "date": "2025-01-01", '
+        '"rate": 0.0571}]}'
+    )
+    expected = [("MXN", "USD", date(2025, 1, 1), Decimal("0.0571"))]
+    assert read_fx_rates_file(csv_path) == expected
+    assert read_fx_rates_file(json_path) == expected
+
+    bad_path = tmp_path / "bad.csv"
+    bad_path.write_text("base,quote,date,rate\nMXN,USD,2025-01-01,-1\n")
+    with pytest.raises(ValueError, match="line 2"):
+        read_fx_rates_file(bad_path)
+
+
+@pytest.mark.parametrize("settings_env", [{"FX_RATES_ENABLED": "true"}], indirect=True)
+def test_fx_rates_table_converts_per_date(
+    client, auth_headers, db_session_factory, settings_env, tmp_path, query_counter
+):
+    from app.repository.fx_rate_repository import FxRateRepository
+    from app.services.fx_service import FxService
+    from app.shared.helpers.fx_rates_file_helper import read_fx_rates_file
+
+    rates_path = tmp_path / "rates.csv"
+    rates_path.write_text(
+        "base,quote,date,rate\n"
+        "MXN,USD,2024-12-31,0.05\n"
+        "MXN,USD,2025-01-03,0.06\n"
+        "MXN,USD,2025-02-01,0.07\n"
+    )
+    db = db_session_factory()
+    try:
+        fx = FxService(FxRateRepository(db))
+        assert fx.load_rates(read_fx_rates_file(rates_path)) == 3
+    finally:
+        db.close()
+
+    _create_user(client, auth_headers, currency="USD")
+    _create_account(client, auth_headers, "Pesos", "MXN")
+
+    r = client.get(
+        "/api/v1/reporting/balance/history?from=2025-01-02&to=2025-01-04&period=day",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    # 2025-01-02 carries the 2024-12-31 rate forward.
+    assert [p["balance"] for p in r.json()["points"]] == ["50.00", "60.00", "60.00"]
+
+    r = client.get("/api/v1/reporting/balance?as_of=2025-01-20", headers=auth_headers)
+    assert r.json()["balance"] == "60.00"
+    # Second lookup for the same (pair, date) is served from the rate cache:
+    # user + accounts + snapshots + window sums, no fx_rates.
+    query_counter[0] = 0
+    r = client.get("/api/v1/reporting/balance?as_of=2025-01-20", headers=auth_headers)
+    assert r.json()["balance"] == "60.00"
+    assert query_counter[0] <= 4
+
+
+# -------------------------------------------------------------------------
+# Reporting response cache (REPORTING_CACHE_ENABLED)
+# -------------------------------------------------------------------------
+
+
+@pytest.fixture
+def local_redis(monkeypatch):
+    """Serve REDIS_URL from the in-process LocalRedisClient instead of a server."""
+    from app.shared.helpers.cache_helper import LocalRedisClient, RedisCacheBackend
+
+    monkeypatch.setattr(
+        RedisCacheBackend,
+        "from_url",
+        classmethod(lambda cls, url: cls(LocalRedisClient(maxsize=10_000))),
+    )
+
+
+def with_reporting_cache(test):
+    """Run `test` with the reporting cache on each backend."""
+    backends = [
+        {"REPORTING_CACHE_ENABLED": "true", "REPORTING_CACHE_BACKEND": "memory"},
+        {
+            "REPORTING_CACHE_ENABLED": "true",
+            "REPORTING_CACHE_BACKEND": "redis",
+            "REDIS_URL": "redis://localhost:6379/0",
+        },
+    ]
+    test = pytest.mark.parametrize(
+        "settings_env", backends, ids=["memory", "redis"], indirect=True
+    )(test)
+    return pytest.mark.usefixtures("local_redis")(test)
+
+
+def test_memory_reporting_cache_refused_with_multiple_workers():
+    """A per-process cache cannot see other workers' invalidations."""
+    from pydantic import ValidationError
+
+    from app.config.settings import Settings
+
+    with pytest.raises(ValidationError):
+        Settings(REPORTING_CACHE_ENABLED=True, WEB_CONCURRENCY=2)
+    settings = Settings(
+        REPORTING_CACHE_ENABLED=True,
+        REPORTING_CACHE_BACKEND="redis",
+        REDIS_URL="redis://localhost:6379/0",
+        WEB_CONCURRENCY=2,
+    )
+    assert settings.WEB_CONCURRENCY == 2
+
+
+def test_redis_reporting_cache_requires_url():
+    """No silent per-process fallback when REDIS_URL is missing."""
+    from pydantic import ValidationError
+
+    from app.config.settings import Settings
+    from app.shared.helpers.cache_helper import LocalRedisClient, RedisCacheBackend
+
+    with pytest.raises(ValidationError, match="REDIS_URL"):
+        Settings(REPORTING_CACHE_ENABLED=True, REPORTING_CACHE_BACKEND="redis")
+    with pytest.raises(ValueError):
+        RedisCacheBackend.from_url("")
+
+    client = LocalRedisClient(maxsize=2)
+    for key in ("a", "b", "c"):
+        client.set(key, key)
+    assert client.get("a") is None
+    assert client.get("c") == b"c"
+
+
+REPORTING_CACHE_URLS = [
+    "/api/v1/reporting/categories-summary?date_from=2025-01-01&date_to=2025-12-31",
+    "/api/v1/reporting/cashflow-summary?date_from=2025-01-01&date_to=2025-12-31",
+    "/api/v1/reporting/period-comparison?date_from=2025-02-01&date_to=2025-02-28",
+    "/api/v1/reporting/cashflow/history?date_from=2025-01-01&date_to=2025-03-31",
+    "/api/v1/reporting/balance?as_of=2025-12-31",
+    "/api/v1/reporting/balance/accounts?as_of=2025-12-31",
+    "/api/v1/reporting/balance/history?from=2025-01-01&to=2025-03-31",
+]
+
+
+@with_reporting_cache
+def test_reporting_cache_hits_match_uncached_responses(
+    client, auth_headers, settings_env, query_counter
+):
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Food", "expense")
+    _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "12.50",
+        "expense",
+        "2025-02-10",
+    )
+
+    for url in REPORTING_CACHE_URLS:
+        first = client.get(url, headers=auth_headers)
+        assert first.status_code == 200, url
+        query_counter[0] = 0
+        second = client.get(url, headers=auth_headers)
+        assert second.content == first.content, url
+        # Only the user lookup reaches the database.
+        assert query_counter[0] <= 1, url
+
+
+@with_reporting_cache
+def test_reporting_cache_invalidated_by_writes(client, auth_headers, settings_env):
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Food", "expense")
+    url = "/api/v1/reporting/balance?as_of=2025-12-31"
+
+    assert client.get(url, headers=auth_headers).json()["balance"] == "1000.00"
+    created = _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "40.00",
+        "expense",
+        "2025-03-01",
+    )
+    assert client.get(url, headers=auth_headers).json()["balance"] == "960.00"
+
+    r = client.put(
+        f"/api/v1/transactions/{created['id']}",
+        json={"amount": "25.00"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    assert client.get(url, headers=auth_headers).json()["balance"] == "975.00"
+
+    r = client.delete(f"/api/v1/transactions/{created['id']}", headers=auth_headers)
+    assert r.status_code == 204
+    assert client.get(url, headers=auth_headers).json()["balance"] == "1000.00"
+
+    # Account writes change balances too.
+    _create_account(client, auth_headers, "Savings")
+    assert client.get(url, headers=auth_headers).json()["balance"] == "2000.00"
+    r = client.delete(f"/api/v1/accounts/{account['id']}", headers=auth_headers)
+    assert r.status_code in {200, 204}
+    assert client.get(url, headers=auth_headers).json()["balance"] == "1000.00"
+
+
+@with_reporting_cache
+def test_reporting_cache_is_per_user(client, settings_env):
+    import os
+    import uuid
+
+    import jwt
+
+    balances = []
+    for initial in ("100.00", "200.00"):
+        token = jwt.encode(
+            {"sub": str(uuid.uuid4())}, os.environ["JWT_SECRET_KEY"], algorithm="HS256"
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        _create_user(client, headers, email=f"{initial}@example.com", currency="USD")
+        r = client.post(
+            "/api/v1/accounts",
+            json={
+                "name": "Cash",
+                "type": "cash",
+                "currency": "USD",
+                "initial_balance": initial,
+            },
+            headers=headers,
+        )
+        assert r.status_code == 200
+        r = client.get("/api/v1/reporting/balance?as_of=2025-12-31", headers=headers)
+        balances.append(r.json()["balance"])
+    assert balances == ["100.00", "200.00"]
+
+
+# -------------------------------------------------------------------------
+# ETag / If-None-Match
+# -------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"LEDGER_ETAG_ENABLED": "true"}], indirect=True
+)
+def test_etag_returns_304_until_ledger_changes(
+    client, auth_headers, query_counter, settings_env
+):
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    category = _create_category(client, auth_headers, "Food", "expense")
+    created = _create_transaction(
+        client,
+        auth_headers,
+        account["id"],
+        category["id"],
+        "40.00",
+        "expense",
+        "2025-03-01",
+    )
+    urls = [
+        "/api/v1/reporting/balance?as_of=2025-12-31",
+        "/api/v1/reporting/cashflow-summary?date_from=2025-01-01&date_to=2025-12-31",
+        "/api/v1/transactions/recent?limit=10",
+    ]
+    etags = {}
+    for url in urls:
+        r = client.get(url, headers=auth_headers)
+        assert r.status_code == 200
+        etags[url] = r.headers["etag"]
+        assert etags[url].startswith('W/"')
+
+        query_counter[0] = 0
+        r = client.get(url, headers={**auth_headers, "If-None-Match": etags[url]})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["etag"] == etags[url]
+        # user lookup + ledger version only; no balance or search queries
+        assert query_counter[0] == 2
+    assert len(set(etags.values())) == len(urls)
+
+    # A different query is a different representation.
+    r = client.get(
+        "/api/v1/reporting/balance?as_of=2025-06-30",
+        headers={**auth_headers, "If-None-Match": etags[urls[0]]},
+    )
+    assert r.status_code == 200
+
+    # Edits, deletes and account deletes each invalidate the tag.
+    r = client.put(
+        f"/api/v1/transactions/{created['id']}",
+        json={"amount": "25.00"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    for url in urls:
+        r = client.get(url, headers={**auth_headers, "If-None-Match": etags[url]})
+        assert r.status_code == 200
+        etags[url] = r.headers["etag"]
+
+    r = client.delete(f"/api/v1/transactions/{created['id']}", headers=auth_headers)
+    assert r.status_code == 204
+    r = client.get(urls[0], headers={**auth_headers, "If-None-Match": etags[urls[0]]})
+    assert r.status_code == 200
+    assert r.json()["balance"] == "1000.00"
+    etags[urls[0]] = r.headers["etag"]
+
+    r = client.delete(f"/api/v1/accounts/{account['id']}", headers=auth_headers)
+    assert r.status_code in {200, 204}
+    r = client.get(urls[0], headers={**auth_headers, "If-None-Match": etags[urls[0]]})
+    assert r.status_code == 200
+    assert r.json()["balance"] == "0.00"
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"LEDGER_ETAG_ENABLED": "true"}], indirect=True
+)
+def test_etag_follows_ledger_version_counters(
+    client, auth_headers, user_id, db_session_factory, settings_env
+):
+    """Concept renames and FX rate loads bump the counters the ETag reads."""
+    from app.repository.fx_rate_repository import FxRateRepository
+    from app.repository.ledger_version_repository import LedgerVersionRepository
+
+    _create_user(client, auth_headers, currency="USD")
+    url = "/api/v1/transactions/recent?limit=10"
+    r = client.get(url, headers=auth_headers)
+    etag = r.headers["etag"]
+
+    r = client.post("/api/v1/concept/", json={"name": "rent"}, headers=auth_headers)
+    assert r.status_code == 201
+    concept_id = r.json()["id"]
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    r = client.put(
+        f"/api/v1/concept/{concept_id}", json={"name": "home"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    db = db_session_factory()
+    try:
+        before = LedgerVersionRepository(db).get_ledger_version(user_id)
+        FxRateRepository(db).upsert_many(
+            [("USD", "MXN", date(2025, 1, 2), Decimal("17.5"))]
+        )
+        db.commit()
+        after = LedgerVersionRepository(db).get_ledger_version(user_id)
+    finally:
+        db.close()
+    assert after == (before[0], before[1] + 1, before[2])
+
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 304
+
+
+def test_etag_disabled_by_default(client, auth_headers, user_id, db_engine):
+    """With LEDGER_ETAG_ENABLED off: no ETag, no 304s and no counter bumps."""
+    from sqlalchemy.orm import sessionmaker
+
+    from app.entities.concept import Concept
+    from app.entities.ledger_version import LedgerVersion
+
+    _create_user(client, auth_headers, currency="USD")
+    url = "/api/v1/transactions/recent?limit=10"
+    r = client.get(url, headers=auth_headers)
+    assert r.status_code == 200
+    assert "etag" not in r.headers
+    r = client.get(url, headers={**auth_headers, "If-None-Match": "*"})
+    assert r.status_code == 200
+
+    # Sessions outside a tracked factory never touch ledger_versions.
+    db = sessionmaker(bind=db_engine)()
+    try:
+        db.add(Concept(user_id=user_id, name="rent"))
+        db.commit()
+        assert db.query(LedgerVersion).filter_by(scope=str(user_id)).first() is None
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"LEDGER_ETAG_ENABLED": "true"}], indirect=True
+)
+def test_etag_changes_with_epoch(
+    client, auth_headers, db_session_factory, settings_env
+):
+    """A startup epoch bump invalidates tags issued before counting was off."""
+    from app.repository.ledger_version_repository import LedgerVersionRepository
+
+    _create_user(client, auth_headers, currency="USD")
+    url = "/api/v1/transactions/recent?limit=10"
+    etag = client.get(url, headers=auth_headers).headers["etag"]
+
+    db = db_session_factory()
+    try:
+        LedgerVersionRepository(db).bump_epoch()
+        db.commit()
+    finally:
+        db.close()
+    r = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+def test_etag_if_none_match_parsing():
+    from app.shared.helpers.etag_helper import build_etag, etag_matches
+
+    etag = build_etag("user", "/balance", 1)
+    assert etag == build_etag("user", "/balance", 1)
+    assert etag != build_etag("user", "/balance", 2)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+# -------------------------------------------------------------------------
+# Async read path (ASYNC_DATABASE_ENABLED)
+# -------------------------------------------------------------------------
+
+
+def test_async_balance_history_matches_sync(
+    client, auth_headers, db_session_factory, monkeypatch, settings_env
+):
+    pytest.importorskip("aiosqlite")
+    from app.config.database import reset_async_database_state
+    from app.engines.balance import materialize_snapshots
+
+    _create_user(client, auth_headers, currency="USD")
+    dollars = _create_account(client, auth_headers, "Dollars", "USD")
+    pesos = _create_account(client, auth_headers, "Pesos", "MXN")
+    category = _create_category(client, auth_headers, "Test", "expense")
+    for account, amount, day in (
+        (dollars, "10.00", "2025-01-01"),
+        (pesos, "100.00", "2025-01-20"),
+        (dollars, "20.00", "2025-02-14"),
+    ):
+        _create_transaction(
+            client,
+            auth_headers,
+            account["id"],
+            category["id"],
+            amount,
+            "expense",
+            day,
+            currency=account["currency"],
+        )
+    materialize_snapshots(db_session_factory, date(2025, 1, 1), date(2025, 2, 1))
+
+    urls = [
+        "/api/v1/reporting/balance/history?from=2025-01-15&to=2025-03-01&period=week",
+        "/api/v1/reporting/balance/history?from=2025-01-01&to=2025-03-01&period=month"
+        f"&account_id={dollars['id']}",
+    ]
+    sync_bodies = [client.get(url, headers=auth_headers).json() for url in urls]
+
+    from app.engines.balance_engine import AsyncBalanceEngine
+
+    calls = []
+    original = AsyncBalanceEngine.get_balance_history
+
+    async def _spy(self, *args, **kwargs):
+        calls.append(args)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncBalanceEngine, "get_balance_history", _spy)
+    settings_env(ASYNC_DATABASE_ENABLED="true")
+    try:
+        async_bodies = [client.get(url, headers=auth_headers).json() for url in urls]
+    finally:
+        reset_async_database_state()
+
+    assert len(calls) == len(urls)
+    assert async_bodies == sync_bodies
+    assert sync_bodies[1]["points"][-1]["balance"] == "970.00"
+
+
+# -------------------------------------------------------------------------
+# Category month rollup (CATEGORY_ROLLUP_ENABLED)
+# -------------------------------------------------------------------------
+
+
+CATEGORY_ROLLUP = {"CATEGORY_ROLLUP_ENABLED": "true"}
+
+
+def _category_totals(client, auth_headers, query: str) -> dict:
+    r = client.get(
+        f"/api/v1/reporting/categories-summary?full_list=false&{query}",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    return {
+        c["id"]: (Decimal(str(c["transaction_amount"])), c["transaction_count"])
+        for c in r.json()["results"]
+    }
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"CATEGORY_ROLLUP_WRITES_ENABLED": "true"}], indirect=True
+)
+def test_category_rollup_maintained_before_reads_are_enabled(
+    client, auth_headers, db_session_factory, settings_env
+):
+    """Write-only mode keeps the rollup in step while summaries still scan raw rows."""
+    from app.entities.category_month_total import CategoryMonthTotal
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    food = _create_category(client, auth_headers, "Food", "expense")
+    for day in ("2025-01-05", "2025-02-05", "2025-02-15"):
+        _create_transaction(
+            client, auth_headers, account["id"], food["id"], "10.00", "expense", day
+        )
+    query = "date_from=2025-01-01&date_to=2025-12-31"
+    raw = _category_totals(client, auth_headers, query)
+
+    db = db_session_factory()
+    try:
+        assert db.query(CategoryMonthTotal).count() == 2
+    finally:
+        db.close()
+
+    settings_env(CATEGORY_ROLLUP_WRITES_ENABLED="false", CATEGORY_ROLLUP_ENABLED="true")
+    assert _category_totals(client, auth_headers, query) == raw
+    assert raw[food["id"]] == (Decimal("-30.00"), 3)
+
+
+def test_category_rollup_upserts_one_row_per_key(
+    client, auth_headers, user_id, db_session_factory
+):
+    """Writers from separate sessions add to one row per key, NULL currency too."""
+    from sqlalchemy.exc import IntegrityError
+
+    from app.entities.category_month_total import CategoryMonthTotal
+    from app.repository.category_month_total_repository import (
+        CategoryMonthTotalRepository,
+    )
+
+    _create_user(client, auth_headers, currency="USD")
+    account_id = UUID(_create_account(client, auth_headers)["id"])
+    category_id = UUID(_create_category(client, auth_headers, "Food", "expense")["id"])
+    month = date(2025, 3, 1)
+
+    for delta in (Decimal("-10"), Decimal("-5")):
+        db = db_session_factory()
+        try:
+            CategoryMonthTotalRepository(db).apply_deltas(
+                {
+                    (user_id, category_id, account_id, month, currency): (delta, 1)
+                    for currency in ("USD", None)
+                }
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    db = db_session_factory()
+    try:
+        rows = db.query(CategoryMonthTotal).filter_by(category_id=category_id).all()
+        assert sorted(
+            (row.currency or "", Decimal(str(row.net_amount)), row.count)
+            for row in rows
+        ) == [("", Decimal("-15"), 2), ("USD", Decimal("-15"), 2)]
+
+        db.add(
+            CategoryMonthTotal(
+                user_id=user_id,
+                category_id=category_id,
+                account_id=account_id,
+                month=month,
+                currency=None,
+            )
+        )
+        with pytest.raises(IntegrityError):
+            db.flush()
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("settings_env", [CATEGORY_ROLLUP], indirect=True)
+def test_category_rollup_matches_raw_scan_after_edits(
+    client, auth_headers, settings_env
+):
+    """Rollup-backed summaries equal raw scans after create/update/delete/migrate."""
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    food = _create_category(client, auth_headers, "Food", "expense")
+    dining = _create_category(client, auth_headers, "Dining", "expense")
+    salary = _create_category(client, auth_headers, "Salary", "income")
+
+    created = [
+        _create_transaction(
+            client, auth_headers, checking["id"], category["id"], amount, kind, day
+        )
+        for category, amount, kind, day in (
+            (salary, "900.00", "income", "2025-01-31"),
+            (food, "40.00", "expense", "2025-02-10"),
+            (food, "15.00", "expense", "2025-03-03"),
+            (dining, "25.00", "expense", "2025-04-20"),
+        )
+    ]
+    edited, removed = created[1], created[2]
+
+    # Move the expense to another month and category, then delete one.
+    r = client.put(
+        f"/api/v1/transactions/{edited['id']}",
+        json={"amount": "45.00", "date": "2025-03-15", "category_id": dining["id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = client.delete(f"/api/v1/transactions/{removed['id']}", headers=auth_headers)
+    assert r.status_code == 204
+    r = client.post(
+        f"/api/v1/categories/{dining['id']}/migrate",
+        json={"target_category_id": food["id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 204
+
+    ranges = [
+        "date_from=2025-01-01&date_to=2025-12-31",  # whole months only
+        "date_from=2025-01-15&date_to=2025-04-20",  # partial edges
+        "date_from=2025-03-02&date_to=2025-03-20",  # inside one month
+    ]
+    rollup = {q: _category_totals(client, auth_headers, q) for q in ranges}
+
+    year = rollup[ranges[0]]
+    assert year[food["id"]] == (Decimal("-70.00"), 2)
+    assert year[salary["id"]] == (Decimal("900.00"), 1)
+    assert dining["id"] not in year
+
+    settings_env(CATEGORY_ROLLUP_ENABLED="false")
+    for q in ranges:
+        assert _category_totals(client, auth_headers, q) == rollup[q]
+
+
+CASHFLOW_ROLLUP = {"CASHFLOW_ROLLUP_ENABLED": "true"}
+
+
+def _cashflow_points(client, auth_headers, query: str) -> list:
+    r = client.get(f"/api/v1/reporting/cashflow/history?{query}", headers=auth_headers)
+    assert r.status_code == 200
+    return r.json()["points"]
+
+
+@pytest.mark.parametrize(
+    "settings_env", [{"CASHFLOW_ROLLUP_WRITES_ENABLED": "true"}], indirect=True
+)
+def test_cashflow_rollup_maintained_before_reads_are_enabled(
+    client, auth_headers, db_session_factory, settings_env
+):
+    """Write-only mode keeps the rollup in step while history still groups raw rows."""
+    from app.entities.daily_cashflow_total import DailyCashflowTotal
+
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers)
+    food = _create_category(client, auth_headers, "Food", "expense")
+    for day in ("2025-01-05", "2025-02-05", "2025-02-05"):
+        _create_transaction(
+            client, auth_headers, account["id"], food["id"], "10.00", "expense", day
+        )
+    query = "date_from=2025-01-01&date_to=2025-03-31&period=month&currency=USD"
+    raw = _cashflow_points(client, auth_headers, query)
+
+    db = db_session_factory()
+    try:
+        assert db.query(DailyCashflowTotal).count() == 2
+    finally:
+        db.close()
+
+    settings_env(CASHFLOW_ROLLUP_WRITES_ENABLED="false", CASHFLOW_ROLLUP_ENABLED="true")
+    assert _cashflow_points(client, auth_headers, query) == raw
+    assert [p["expense"] for p in raw] == ["10.00", "20.00", "0.00"]
+
+
+def test_cashflow_rollup_upserts_one_row_per_key(
+    client, auth_headers, user_id, db_session_factory
+):
+    """Writers from separate sessions add to one day row per key, NULL currency too."""
+    from sqlalchemy.exc import IntegrityError
+
+    from app.entities.daily_cashflow_total import DailyCashflowTotal
+    from app.repository.daily_cashflow_total_repository import (
+        DailyCashflowTotalRepository,
+    )
+
+    _create_user(client, auth_headers, currency="USD")
+    account_id = UUID(_create_account(client, auth_headers)["id"])
+    category_id = UUID(_create_category(client, auth_headers, "Food", "expense")["id"])
+    day = date(2025, 3, 10)
+
+    for income, expense_abs in (
+        (Decimal("0"), Decimal("10")),
+        (Decimal("3"), Decimal("5")),
+    ):
+        db = db_session_factory()
+        try:
+            DailyCashflowTotalRepository(db).apply_deltas(
+                {
+                    (user_id, account_id, category_id, currency, day): (
+                        income,
+                        expense_abs,
+                    )
+                    for currency in ("USD", None)
+                }
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    db = db_session_factory()
+    try:
+        rows = db.query(DailyCashflowTotal).filter_by(category_id=category_id).all()
+        assert sorted(
+            (
+                row.currency or "",
+                Decimal(str(row.income)),
+                Decimal(str(row.expense_abs)),
+            )
+            for row in rows
+        ) == [("", Decimal("3"), Decimal("15")), ("USD", Decimal("3"), Decimal("15"))]
+
+        db.add(
+            DailyCashflowTotal(
+                user_id=user_id,
+                account_id=account_id,
+                category_id=category_id,
+                currency=None,
+                day=day,
+            )
+        )
+        with pytest.raises(IntegrityError):
+            db.flush()
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("settings_env", [CASHFLOW_ROLLUP], indirect=True)
+def test_cashflow_rollup_matches_raw_grouping_after_edits(
+    client, auth_headers, settings_env
+):
+    """Rollup-backed cashflow history equals raw grouping after edits."""
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    food = _create_category(client, auth_headers, "Food", "expense")
+    dining = _create_category(client, auth_headers, "Dining", "expense")
+    salary = _create_category(client, auth_headers, "Salary", "income")
+
+    created = [
+        _create_transaction(
+            client, auth_headers, checking["id"], category["id"], amount, kind, day
+        )
+        for category, amount, kind, day in (
+            (salary, "900.00", "income", "2025-01-31"),
+            (food, "40.00", "expense", "2025-02-10"),
+            (food, "15.00", "expense", "2025-03-03"),
+            (dining, "25.00", "expense", "2025-04-20"),
+        )
+    ]
+    edited, removed = created[1], created[2]
+
+    r = client.put(
+        f"/api/v1/transactions/{edited['id']}",
+        json={"amount": "45.00", "date": "2025-03-15", "category_id": dining["id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = client.delete(f"/api/v1/transactions/{removed['id']}", headers=auth_headers)
+    assert r.status_code == 204
+    r = client.post(
+        f"/api/v1/categories/{dining['id']}/migrate",
+        json={"target_category_id": food["id"]},
+        headers=auth_headers,
+    )
+    assert r.status_code == 204
+
+    queries = [
+        f"date_from=2025-01-01&date_to=2025-12-31&period={period}&currency=USD"
+        for period in ("day", "week", "month", "year")
+    ] + [
+        f"date_from=2025-01-01&date_to=2025-06-30&period=month"
+        f"&category_id={food['id']}&currency=USD",
+    ]
+    rollup = {q: _cashflow_points(client, auth_headers, q) for q in queries}
+
+    months = {p["period_start"]: p for p in rollup[queries[2]]}
+    assert months["2025-01-01"]["income"] == "900.00"
+    assert months["2025-02-01"]["expense"] == "0.00"
+    assert months["2025-03-01"]["expense"] == "45.00"
+    assert months["2025-04-01"]["expense"] == "25.00"
+
+    settings_env(CASHFLOW_ROLLUP_ENABLED="false")
+    for q in queries:
+        assert _cashflow_points(client, auth_headers, q) == rollup[q]
+
+
+@pytest.mark.parametrize(
+    "settings_env",
+    [{**BALANCE_LEDGER, **CATEGORY_ROLLUP, **CASHFLOW_ROLLUP}],
+    indirect=True,
+)
+def test_rollups_match_raw_reads_after_bulk_import_and_transfers(
+    client, auth_headers, settings_env
+):
+    """Batched ledger and rollup upkeep (bulk, import, transfers) equals raw reads."""
+    _create_user(client, auth_headers, currency="USD")
+    checking = _create_account(client, auth_headers, "Checking", "USD")
+    savings = _create_account(client, auth_headers, "Savings", "USD")
+    food = _create_category(client, auth_headers, "Food", "expense")
+    salary = _create_category(client, auth_headers, "Salary", "income")
+
+    r = client.post(
+        "/api/v1/transactions/bulk",
+        json={
+            "transactions": [
+                {
+                    "account_id": account["id"],
+                    "category_id": category["id"],
+                    "type": kind,
+                    "amount": amount,
+                    "currency": "USD",
+                    "date": day,
+                }
+                for account, category, kind, amount, day in (
+                    (checking, salary, "income", "900.00", "2025-01-31"),
+                    (checking, food, "expense", "40.00", "2025-02-10"),
+                    (checking, food, "expense", "40.00", "2025-02-10"),
+                    (savings, food, "expense", "12.00", "2025-02-10"),
+                )
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert r.status_code == 201
+
+    r = client.post(
+        "/api/v1/transactions/import",
+        params={
+            "account_id": checking["id"],
+            "category_id": food["id"],
+            "format": "csv",
+        },
+        content=(
+            "Date,Amount,Description\n"
+            "2025-02-10,-4.50,Coffee\n"
+            "2025-02-10,-4.50,Coffee\n"
+            "2025-03-05,120.00,Refund\n"
+        ).encode("utf-8"),
+        headers={**auth_headers, "Content-Type": "text/plain"},
+    )
+    assert r.json() == {"imported": 3, "skipped": 0}
+
+    transfers = []
+    for amount, day in (("100.00", "2025-02-20"), ("30.00", "2025-03-01")):
+        r = client.post(
+            "/api/v1/transactions/transfer",
+            json={
+                "from_account_id": checking["id"],
+                "to_account_id": savings["id"],
+                "amount": amount,
+                "date": day,
+            },
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+        transfers.append(r.json()["transfer_id"])
+    r = client.put(
+        f"/api/v1/transactions/transfer/{transfers[0]}",
+        json={"amount": "150.00", "date": "2025-03-20"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    r = client.delete(
+        f"/api/v1/transactions/transfer/{transfers[1]}", headers=auth_headers
+    )
+    assert r.status_code == 204
+
+    ranges = [
+        "date_from=2025-01-01&date_to=2025-12-31",
+        "date_from=2025-02-10&date_to=2025-03-10",
+    ]
+    cashflow = [
+        f"{q}&period={period}&currency=USD"
+        for q in ranges
+        for period in ("day", "month")
+    ]
+    checkpoints = ["2025-02-10", "2025-03-31"]
+
+    def reads():
+        return (
+            [_category_totals(client, auth_headers, q) for q in ranges],
+            [_cashflow_points(client, auth_headers, q) for q in cashflow],
+            [_balances_by_account(client, auth_headers, d) for d in checkpoints],
+        )
+
+    rollup = reads()
+    assert rollup[0][0][food["id"]] == (Decimal("19.00"), 6)
+    assert rollup[2][1] == {checking["id"]: "1781.00", savings["id"]: "1138.00"}
+
+    settings_env(
+        BALANCE_LEDGER_ENABLED="false",
+        CATEGORY_ROLLUP_ENABLED="false",
+        CASHFLOW_ROLLUP_ENABLED="false",
+    )
+    assert reads() == rollup
+
+
+# -------------------------------------------------------------------------
+# Dashboard
+# -------------------------------------------------------------------------
+
+
+def test_dashboard_matches_standalone_endpoints(client, auth_headers):
+    """Every dashboard widget equals the response of its standalone endpoint."""
+    _create_user(client, auth_headers, currency="USD")
+    account = _create_account(client, auth_headers, "Checking", "USD")
+    food = _create_category(client, auth_headers, "Food", "expense")
+    salary = _create_category(client, auth_headers, "Salary", "income")
+    _create_transaction(
+        client, auth_headers, account["id"], salary["id"], "500.00", "income"
+    )
+    _create_transaction(client, auth_headers, account["id"], food["id"], "45.50")
+
+    r = client.get("/api/v1/reporting/dashboard", headers=auth_headers)
+    assert r.status_code == 200
+    dashboard = r.json()
+
+    expected = {
+        "balance": "/api/v1/reporting/balance",
+        "balance_accounts": "/api/v1/reporting/balance/accounts",
+        "cashflow_summary": "/api/v1/reporting/cashflow-summary?period=month",
+        "categories_summary": "/api/v1/reporting/categories-summary?period=month",
+        "recent_transactions": "/api/v1/transactions/recent?limit=5",
+    }
+    for widget, url in expected.items():
+        standalone = client.get(url, headers=auth_headers)
+        assert standalone.status_code == 200
+        assert dashboard[widget] == standalone.json(), widget
+
+    assert dashboard["cashflow_summary"]["total"] == "454.50"
+
+
+def test_dashboard_selected_widgets_only(client, auth_headers):
+    """Unrequested widgets are null; summaries do not need a base currency."""
+    _create_user(client, auth_headers)
+    r = client.get(
+        "/api/v1/reporting/dashboard"
+        "?widgets=cashflow_summary&widgets=categories_summary"
+        "&date_from=2026-01-01&date_to=2026-01-31",
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+    data = r.json()
+    assert data["balance"] is None
+    assert data["recent_transactions"] is None
+    assert data["cashflow_summary"]["income"] == "0.00"
+
+    r = client.get("/api/v1/reporting/dashboard?widgets=balance", headers=auth_headers)
+    assert r.status_code == 422
+
+    r = client.get(
+        "/api/v1/reporting/dashboard?widgets=cashflow_summary&date_from=2026-01-01",
+        headers=auth_headers,
+    )
+    assert r.status_code == 422
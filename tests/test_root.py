@@ -37,3 +37,72 @@ def test_docs_access(client):
         assert resp_docs.status_code == 404
         assert resp_redoc.status_code == 404
         assert resp_openapi.status_code == 404
+
+
+def test_db_pool_endpoint_disabled_by_default(client):
+    assert client.get("/health/db-pool").status_code == 404
+
+
+def test_db_pool_endpoint_reports_usage(client, monkeypatch):
+    from app.config.settings import reload_settings
+
+    monkeypatch.setenv("DB_POOL_METRICS_ENABLED", "true")
+    reload_settings()
+    try:
+        resp = client.get("/health/db-pool")
+    finally:
+        monkeypatch.delenv("DB_POOL_METRICS_ENABLED")
+        reload_settings()
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["pool_class"] == "TimedQueuePool"
+    assert data["size"] == get_settings().DB_POOL_SIZE
+    assert data["checked_out"] >= 0
+    assert data["overflow"] >= 0
+    assert data["wait"]["checkouts"] >= 1
+    assert data["wait"]["max_wait_ms"] >= data["wait"]["avg_wait_ms"] >= 0
+
+
+def test_timed_queue_pool_records_timeouts(tmp_path):
+    import sqlalchemy
+    from sqlalchemy import exc
+
+    from app.config.db_pool import TimedQueuePool, pool_status
+
+    engine = sqlalchemy.create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    try:
+        held = engine.connect()
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        status = pool_status(engine.pool)
+        assert status["checked_out"] == 1
+        assert status["wait"]["checkouts"] == 1
+        assert status["wait"]["timeouts"] == 1
+        assert status["wait"]["max_wait_ms"] >= 10
+        held.close()
+    finally:
+        engine.dispose()
+
+
+def test_null_pool_mode(monkeypatch):
+    from sqlalchemy.pool import NullPool
+
+    from app.config.database import _pool_kwargs
+    from app.config.settings import reload_settings
+
+    monkeypatch.setenv("DB_POOL_MODE", "null")
+    reload_settings()
+    try:
+        kwargs = _pool_kwargs("postgresql://u:p@localhost:6543/db", timed=True)
+    finally:
+        monkeypatch.delenv("DB_POOL_MODE")
+        reload_settings()
+    assert kwargs["poolclass"] is NullPool
+    assert "pool_size" not in kwargs
@@ -10,11 +10,17 @@ from app.schemas.transaction_schemas import (
     RecentTransactionsParams,
     TransactionBase,
     TransactionCreate,
+    TransactionPageParams,
     TransactionResponse,
     TransactionSearch,
     TransactionSearchType,
     TransactionUpdate,
 )
+from app.shared.helpers.cursor_helper import (
+    TransactionCursor,
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+)
 
 
 class TestTransactionBase:
@@ -549,3 +555,33 @@ class TestRecentTransactionsParams:
     def test_recent_transactions_params_accepts_valid_limit(self, valid_limit):
         params = RecentTransactionsParams(limit=valid_limit)
         assert params.limit == valid_limit
+
+
+class TestTransactionPageParams:
+    def test_page_params_default_is_unpaginated(self):
+        params = TransactionPageParams()
+        assert params.is_paginated is False
+
+    def test_page_params_cursor_requires_limit(self):
+        with pytest.raises(ValidationError) as exc:
+            TransactionPageParams(cursor="abc")
+        assert "'cursor' requires 'limit'." in str(exc.value)
+
+    @pytest.mark.parametrize("invalid_limit", [0, 101])
+    def test_page_params_limit_bounds(self, invalid_limit):
+        with pytest.raises(ValidationError):
+            TransactionPageParams(limit=invalid_limit)
+
+    def test_page_params_accepts_round_tripped_cursor(self):
+        cursor = TransactionCursor(
+            date(2024, 1, 15), datetime(2024, 1, 15, 10, 30), uuid.uuid4()
+        )
+        token = encode_transaction_cursor(cursor)
+        params = TransactionPageParams(limit=20, cursor=token)
+        assert params.is_paginated is True
+        assert decode_transaction_cursor(token) == cursor
+
+    def test_page_params_rejects_malformed_cursor(self):
+        with pytest.raises(ValidationError) as exc:
+            TransactionPageParams(limit=20, cursor="%%%")
+        assert "Invalid cursor." in str(exc.value)
@@ -397,3 +397,27 @@ class TestTransactionService:
 
         assert result is True
         service.category_service.get.assert_called_once_with(category_id)
+
+    def test_export_streams_on_its_own_session(self, service, mock_db):
+        """Export opens its session lazily and closes it once streaming ends"""
+        from app.schemas.transaction_schemas import TransactionExportFormat
+
+        export_db = Mock(spec=Session)
+        session_factory = Mock(return_value=export_db)
+        with patch(
+            "app.services.transaction_service.TransactionRepository"
+        ) as repository_cls:
+            repository_cls.return_value.iter_export_rows.return_value = iter([])
+            stream = service.export(
+                uuid.uuid4(),
+                TransactionSearch(),
+                TransactionExportFormat.CSV,
+                session_factory,
+            )
+            session_factory.assert_not_called()
+            chunks = list(stream)
+
+        assert chunks[0].startswith("id,")
+        repository_cls.assert_called_once_with(export_db)
+        export_db.close.assert_called_once()
+        mock_db.execute.assert_not_called()
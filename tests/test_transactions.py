@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 import uuid
 from datetime import date, timedelta
 from decimal import Decimal
@@ -600,6 +603,138 @@ class TestTransactionSearch:
         )
         assert r.status_code == 422
 
+    def test_search_transactions_cursor_pagination(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Keyset pages cover the full ordered history without gaps or repeats"""
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers)
+        category = _create_category(client, auth_headers)
+
+        for day in (15, 16, 16, 17, 18):
+            _create_transaction(
+                client,
+                auth_headers,
+                account["id"],
+                "10.00",
+                "expense",
+                category["id"],
+                f"2024-01-{day}",
+            )
+
+        full = client.get("/api/v1/transactions", headers=auth_headers).json()
+        assert full["next_cursor"] is None
+
+        collected = []
+        cursor = None
+        while True:
+            url = "/api/v1/transactions?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            r = client.get(url, headers=auth_headers)
+            assert r.status_code == 200
+            body = r.json()
+            assert len(body["results"]) <= 2
+            collected.extend(tx["id"] for tx in body["results"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert collected == [tx["id"] for tx in full["results"]]
+
+    def test_search_transactions_cursor_invalid_params(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Malformed cursor, cursor without limit and oversized limit are rejected"""
+        _create_user(client, auth_headers)
+
+        for query in ("limit=10&cursor=not-a-cursor", "cursor=abc", "limit=1000"):
+            r = client.get(f"/api/v1/transactions?{query}", headers=auth_headers)
+            assert r.status_code == 422
+
+    def test_export_transactions_ndjson(self, client: TestClient, auth_headers: dict):
+        """NDJSON export streams one flat record per matching transaction"""
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers)
+        category = _create_category(client, auth_headers)
+        _create_transaction(
+            client,
+            auth_headers,
+            account["id"],
+            "100.00",
+            "expense",
+            category["id"],
+            "2024-01-15",
+        )
+        _create_transaction(
+            client,
+            auth_headers,
+            account["id"],
+            "250.50",
+            "income",
+            category["id"],
+            "2024-01-16",
+        )
+
+        r = client.get("/api/v1/transactions/export?type=income", headers=auth_headers)
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in r.text.splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["amount"] == "250.50"
+        assert lines[0]["type"] == "income"
+        assert lines[0]["account_name"] == account["name"]
+        assert lines[0]["category_name"] == category["name"]
+        assert lines[0]["date"] == "2024-01-16"
+
+    def test_export_transactions_csv(self, client: TestClient, auth_headers: dict):
+        """CSV export has a header row and rows in search order"""
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers)
+        category = _create_category(client, auth_headers)
+        for day in ("2024-01-15", "2024-01-17"):
+            _create_transaction(
+                client,
+                auth_headers,
+                account["id"],
+                "10.00",
+                "expense",
+                category["id"],
+                day,
+            )
+
+        r = client.get("/api/v1/transactions/export?format=csv", headers=auth_headers)
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/csv")
+        assert "transactions.csv" in r.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(r.text)))
+        assert [row["date"] for row in rows] == ["2024-01-17", "2024-01-15"]
+        assert rows[0]["concept_name"] == ""
+
+    def test_export_keeps_currency_precision(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Amounts keep their currency's minor units and are never rounded"""
+        _create_user(client, auth_headers)
+        dinars = _create_account(client, auth_headers, "Dinars", "KWD")
+        yen = _create_account(client, auth_headers, "Yen", "JPY")
+        _create_transaction(
+            client, auth_headers, dinars["id"], "1.234", "expense", None, "2024-01-15"
+        )
+        _create_transaction(
+            client, auth_headers, yen["id"], "1500", "expense", None, "2024-01-16"
+        )
+
+        r = client.get("/api/v1/transactions/export", headers=auth_headers)
+        assert r.status_code == 200
+        lines = [json.loads(line) for line in r.text.splitlines()]
+        assert [(line["account_name"], line["amount"]) for line in lines] == [
+            ("Yen", "1500"),
+            ("Dinars", "1.234"),
+        ]
+
     def test_search_transactions_by_amount_range(
         self, client: TestClient, auth_headers: dict
     ):
@@ -1506,3 +1641,292 @@ class TestTransferSingleLegDeletionGuard:
 
         r = client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
         assert r.status_code == 204
+
+
+class TestTransactionBulkCreate:
+    """POST /transactions/bulk validates set-wise and inserts all-or-nothing."""
+
+    def _bulk_item(self, account_id: str, category_id: str, **overrides):
+        item = {
+            "account_id": account_id,
+            "category_id": category_id,
+            "type": "expense",
+            "amount": "10.00",
+            "currency": "USD",
+            "date": "2024-01-15",
+        }
+        item.update(overrides)
+        return item
+
+    def test_bulk_create_inserts_rows_with_tags(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Bulk Acc")
+        category = _create_category(client, auth_headers)
+        concept = _create_concept(client, auth_headers, name="Bulk Concept")
+        r = client.post(
+            "/api/v1/tags",
+            json={"name": "bulk-tag", "color": "#0000ff"},
+            headers=auth_headers,
+        )
+        assert r.status_code == 201
+        tag_id = r.json()["id"]
+
+        items = [
+            self._bulk_item(account["id"], category["id"], amount="12.50"),
+            self._bulk_item(
+                account["id"],
+                category["id"],
+                type="income",
+                amount="40.00",
+                date="2024-02-01",
+                concept_id=concept["id"],
+                tag_ids=[tag_id, tag_id],
+            ),
+        ]
+        r = client.post(
+            "/api/v1/transactions/bulk",
+            json={"transactions": items},
+            headers=auth_headers,
+        )
+        assert r.status_code == 201
+        body = r.json()
+        assert body["created"] == 2
+        assert len(body["ids"]) == 2
+
+        created = client.get(
+            f"/api/v1/transactions/{body['ids'][1]}", headers=auth_headers
+        ).json()
+        assert Decimal(created["amount"]) == Decimal("40.00")
+        assert created["concept"]["id"] == concept["id"]
+        assert [tag["id"] for tag in created["tags"]] == [tag_id]
+
+    def test_bulk_create_rejects_foreign_category(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Bulk Acc")
+        category = _create_category(client, auth_headers)
+
+        items = [
+            self._bulk_item(account["id"], category["id"]),
+            self._bulk_item(account["id"], str(uuid.uuid4())),
+        ]
+        r = client.post(
+            "/api/v1/transactions/bulk",
+            json={"transactions": items},
+            headers=auth_headers,
+        )
+        assert r.status_code == 403
+        assert "index 1" in r.json()["detail"]
+
+        # Nothing from the rejected batch was written
+        r = client.get(
+            f"/api/v1/transactions?account_id={account['id']}", headers=auth_headers
+        )
+        assert r.json()["total"] == 0
+
+    def test_bulk_create_rejects_future_date(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Bulk Acc")
+        category = _create_category(client, auth_headers)
+        future = (date.today() + timedelta(days=2)).isoformat()
+
+        r = client.post(
+            "/api/v1/transactions/bulk",
+            json={
+                "transactions": [
+                    self._bulk_item(account["id"], category["id"], date=future)
+                ]
+            },
+            headers=auth_headers,
+        )
+        assert r.status_code == 400
+
+    def test_bulk_create_rejects_empty_batch(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        r = client.post(
+            "/api/v1/transactions/bulk",
+            json={"transactions": []},
+            headers=auth_headers,
+        )
+        assert r.status_code == 422
+
+
+class TestTransactionStatementImport:
+    """POST /transactions/import streams a statement and dedupes re-imports."""
+
+    CSV_STATEMENT = (
+        "Date,Amount,Description\n"
+        "2024-03-01,-12.50,Coffee  Shop\n"
+        "2024-03-02,2500.00,Salary\n"
+        "2024-03-03,-40.00,Groceries\n"
+    )
+
+    def _import(self, client, auth_headers, account_id, category_id, body, fmt="csv"):
+        return client.post(
+            "/api/v1/transactions/import",
+            params={
+                "account_id": account_id,
+                "category_id": category_id,
+                "format": fmt,
+            },
+            content=body.encode("utf-8"),
+            headers={**auth_headers, "Content-Type": "text/plain"},
+        )
+
+    def test_csv_import_is_idempotent(self, client: TestClient, auth_headers: dict):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+        concept = _create_concept(client, auth_headers, name="coffee shop")
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], self.CSV_STATEMENT
+        )
+        assert r.status_code == 200
+        assert r.json() == {"imported": 3, "skipped": 0}
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], self.CSV_STATEMENT
+        )
+        assert r.status_code == 200
+        assert r.json() == {"imported": 0, "skipped": 3}
+
+        r = client.get(
+            f"/api/v1/transactions?account_id={account['id']}", headers=auth_headers
+        )
+        results = r.json()["results"]
+        assert len(results) == 3
+        coffee = next(tx for tx in results if Decimal(tx["amount"]) == Decimal("12.5"))
+        assert coffee["type"] == "expense"
+        assert coffee["source"] == "import"
+        assert coffee["concept"]["id"] == concept["id"]
+
+    def test_csv_import_keeps_repeated_rows(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+        statement = (
+            "Date,Amount,Description\n"
+            "2024-03-01,-4.50,Coffee\n"
+            "2024-03-01,-4.50,Coffee\n"
+            "2024-03-01,-4.50,coffee \n"
+        )
+
+        r = self._import(client, auth_headers, account["id"], category["id"], statement)
+        assert r.status_code == 200
+        assert r.json() == {"imported": 3, "skipped": 0}
+
+        r = self._import(client, auth_headers, account["id"], category["id"], statement)
+        assert r.json() == {"imported": 0, "skipped": 3}
+
+        # A later statement with one more identical row imports only that one.
+        r = self._import(
+            client,
+            auth_headers,
+            account["id"],
+            category["id"],
+            statement + "2024-03-01,-4.50,Coffee\n",
+        )
+        assert r.json() == {"imported": 1, "skipped": 3}
+
+    def test_ofx_import_dedupes_by_fitid(self, client: TestClient, auth_headers: dict):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+        statement = (
+            "<OFX><BANKTRANLIST>\n"
+            "<STMTTRN><DTPOSTED>20240305<TRNAMT>-4.50<FITID>A1<NAME>Coffee</STMTTRN>\n"
+            "<STMTTRN><DTPOSTED>20240305<TRNAMT>-4.50<FITID>A2<NAME>Coffee</STMTTRN>\n"
+            "<STMTTRN><DTPOSTED>20240305<TRNAMT>-4.50<FITID>A2<NAME>Coffee</STMTTRN>\n"
+            "</BANKTRANLIST></OFX>\n"
+        )
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], statement, "ofx"
+        )
+        assert r.status_code == 200
+        assert r.json() == {"imported": 2, "skipped": 1}
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], statement, "ofx"
+        )
+        assert r.json() == {"imported": 0, "skipped": 3}
+
+    def test_ofx_import(self, client: TestClient, auth_headers: dict):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+        statement = (
+            "OFXHEADER:100\n"
+            "<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n"
+            "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240305120000<TRNAMT>-4.20"
+            "<NAME>Bakery</STMTTRN>\n"
+            "<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20240306\n<TRNAMT>100.00\n"
+            "<MEMO>Refund\n</STMTTRN>\n"
+            "</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>\n"
+        )
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], statement, "ofx"
+        )
+        assert r.status_code == 200
+        assert r.json() == {"imported": 2, "skipped": 0}
+
+    def test_import_rejects_invalid_rows(self, client: TestClient, auth_headers: dict):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+
+        r = self._import(
+            client,
+            auth_headers,
+            account["id"],
+            category["id"],
+            "Date,Amount\nnot-a-date,1.00\n",
+        )
+        assert r.status_code == 400
+        assert "line 2" in r.json()["detail"]
+
+    @pytest.mark.parametrize(
+        "settings_env", [{"STATEMENT_IMPORT_MAX_BYTES": "64"}], indirect=True
+    )
+    def test_import_rejects_oversized_body(
+        self, client: TestClient, auth_headers: dict, settings_env
+    ):
+        _create_user(client, auth_headers)
+        account = _create_account(client, auth_headers, name="Import Acc")
+        category = _create_category(client, auth_headers)
+
+        r = self._import(
+            client, auth_headers, account["id"], category["id"], self.CSV_STATEMENT
+        )
+        assert r.status_code == 413
+
+        # Chunked bodies carry no Content-Length and are capped while streaming.
+        r = client.post(
+            "/api/v1/transactions/import",
+            params={"account_id": account["id"], "category_id": category["id"]},
+            content=iter([self.CSV_STATEMENT.encode("utf-8")]),
+            headers={**auth_headers, "Content-Type": "text/plain"},
+        )
+        assert r.status_code == 413
+
+    def test_import_rejects_foreign_account(
+        self, client: TestClient, auth_headers: dict
+    ):
+        _create_user(client, auth_headers)
+        category = _create_category(client, auth_headers)
+
+        r = self._import(
+            client, auth_headers, str(uuid.uuid4()), category["id"], self.CSV_STATEMENT
+        )
+        assert r.status_code == 403
@@ -64,3 +64,75 @@ def test_delete_user(client, auth_headers):
 
     r = client.delete("/api/v1/users/", headers=auth_headers)
     assert r.status_code == 204
+
+
+def test_user_cache_skips_lookup_and_evicts_on_update(
+    client, auth_headers, query_counter, monkeypatch
+):
+    import uuid as _uuid
+
+    from app.config.settings import reload_settings
+    from app.dependencies.user_dependencies import reset_user_cache
+
+    monkeypatch.setenv("AUTH_USER_CACHE_ENABLED", "true")
+    reload_settings()
+    reset_user_cache()
+    try:
+        payload = {
+            "name": "Cached User",
+            "email": f"cached+{_uuid.uuid4().hex}@example.com",
+            "currency": "USD",
+        }
+        r = client.post("/api/v1/users", json=payload, headers=auth_headers)
+        assert r.status_code == 200
+
+        client.get("/api/v1/users/", headers=auth_headers)  # warms the cache
+        query_counter[0] = 0
+        r = client.get("/api/v1/users/", headers=auth_headers)
+        assert r.status_code == 200
+        assert r.json()["currency"] == "USD"
+        assert query_counter[0] == 0
+
+        r = client.put(
+            "/api/v1/users/",
+            json={**payload, "currency": "EUR"},
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+        r = client.get("/api/v1/users/", headers=auth_headers)
+        assert r.json()["currency"] == "EUR"
+    finally:
+        monkeypatch.delenv("AUTH_USER_CACHE_ENABLED", raising=False)
+        reload_settings()
+        reset_user_cache()
+
+
+def test_verified_token_is_cached_until_expiry(client, auth_headers, monkeypatch):
+    import os
+    import time
+    import uuid as _uuid
+
+    import jwt
+
+    from app.dependencies import auth_dependency
+
+    payload = {"name": "Token User", "email": f"tok+{_uuid.uuid4().hex}@example.com"}
+    r = client.post("/api/v1/users", json=payload, headers=auth_headers)
+    assert r.status_code == 200
+
+    def _fail_decode(*args, **kwargs):
+        raise AssertionError("signature verified again for a cached token")
+
+    monkeypatch.setattr(auth_dependency.jwt, "decode", _fail_decode)
+    r = client.get("/api/v1/users/", headers=auth_headers)
+    assert r.status_code == 200
+    monkeypatch.undo()
+
+    expired = jwt.encode(
+        {"sub": str(_uuid.uuid4()), "exp": int(time.time()) - 10},
+        os.environ["JWT_SECRET_KEY"],
+        algorithm="HS256",
+    )
+    r = client.get("/api/v1/users/", headers={"Authorization": f"Bearer {expired}"})
+    assert r.status_code == 401
+    assert r.json()["detail"] == "Token expired"